@@ -1,21 +1,27 @@
 # app_final.py
+# 시작 시간 측정 기준점 (다른 모듈보다 먼저 import)
+from startup_timer import startup_timer
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, scrolledtext
 import ttkbootstrap as tbs
 from ttkbootstrap.constants import *
 from ttkbootstrap.scrolled import ScrolledFrame
-from youtube_analyzer import YouTubeTrendAnalyzer
-from gemini_script_generator import GeminiScriptGenerator
-from gemini_image_generator import GeminiImageGenerator
-from music_image_generator import MusicImageGenerator
+from youtube_analyzer import YouTubeTrendAnalyzer, ALL_REGIONS
+from trend_store import get_trend_store
+from virtual_list import VirtualList
 from config_manager import ConfigManager
 from prompt_template_manager import PromptTemplateManager
+from rate_limiter import get_rate_limiter, estimate_tokens
+from image_pipeline import ImagePipeline
+from ui_dispatcher import UIDispatcher
 from PIL import Image, ImageTk
 import sys
 import threading
 import webbrowser
-import requests
-import io
+
+# Gemini 생성기, 썸네일 로더(requests), DataFrame(pandas)은 import 비용이 커서
+# 해당 기능을 처음 사용할 때 불러옴 (창이 뜬 뒤 백그라운드에서 미리 불러오기도 함)
+startup_timer.mark("모듈 import")
 
 class YouTubeMakerApp:
     def __init__(self, root):
@@ -23,52 +29,186 @@ class YouTubeMakerApp:
         self.root.title("YouTube Maker")
         self.root.geometry("1400x800")
         self.root.configure(bg='#2b2b2b')
+
+        # 백그라운드 스레드의 UI 갱신은 모두 이 큐를 거쳐 Tk 스레드에서 실행
+        self.ui = UIDispatcher(self.root)
+        self.ui.start()
         
         # 설정 관리자 초기화
         self.config_manager = ConfigManager()
         
         # API 키 로드 (선택적)
         self.api_key = self.config_manager.load_api_key()
+
+        # Gemini 속도 제한 설정 ({"모델명": {"rpm": int, "tpm": int}})
+        rate_limits = self.config_manager.get_setting('gemini_rate_limits', {}) or {}
+        for model, limit in rate_limits.items():
+            get_rate_limiter().configure(model, rpm=limit.get('rpm'), tpm=limit.get('tpm'))
         
-        # YouTube Analyzer 초기화 (선택적)
-        self.analyzer = None
-        if self.api_key:
-            try:
-                self.analyzer = YouTubeTrendAnalyzer(self.api_key)
-            except Exception as e:
-                print(f"YouTube Analyzer 초기화 실패: {e}")
-                # 잘못된 API 키는 삭제
-                self.config_manager.clear_api_key()
-                self.api_key = None
+        # 검색 결과 통계 기록 (조회수 증가 속도 계산용)
+        self.trend_store = get_trend_store()
         
-        # Gemini Script Generator 초기화 (선택적)
-        self.gemini_generator = None
-        self.gemini_image_generator = None
-        self.music_image_generator = None
-        gemini_key = self.config_manager.load_gemini_api_key()
-        if gemini_key:
-            try:
-                self.gemini_generator = GeminiScriptGenerator(gemini_key)
-                self.gemini_image_generator = GeminiImageGenerator(gemini_key)
-                self.music_image_generator = MusicImageGenerator(gemini_key)
-            except Exception as e:
-                print(f"Gemini 초기화 실패: {e}")
-                # Gemini는 선택적이므로 에러 무시
+        # API 클라이언트는 해당 탭을 처음 사용할 때 생성 (name -> 인스턴스 또는 None)
+        self.gemini_key = self.config_manager.load_gemini_api_key()
+        self._clients = {}
+        self._client_locks = {}  # name -> 생성 중복을 막는 잠금 (다른 클라이언트 생성은 막지 않음)
+        self._client_lock = threading.Lock()
+        startup_timer.mark("설정 로드")
 
         self.template_manager = PromptTemplateManager()
 
         # 이미지 생성 관련 상태
         self.image_cuts_data = []  # 컷별 이미지 데이터 저장
         self.music_cuts_data = []  # 음악 이미지 컷별 데이터 저장
+        self.image_results_list = None  # 컷 결과 VirtualList
+        self.music_results_list = None
 
-        # 이미지 캐시
-        self.image_cache = {}
+        # 썸네일 로더는 첫 검색 결과를 표시할 때 생성
+        self.thumbnail_placeholder = None
         
         # 현재 활성 탭
         self.current_tab = "youtube_analysis"
 
         # GUI 구성
         self.create_widgets()
+        startup_timer.mark("화면 구성")
+
+        # 첫 화면이 그려진 뒤 나머지 클라이언트를 백그라운드에서 미리 생성
+        self.root.after_idle(self.on_first_frame)
+
+    def on_first_frame(self):
+        """첫 화면 표시 후 호출: 시작 시간 기록 및 클라이언트 미리 생성 시작"""
+        startup_timer.mark("첫 화면 표시")
+
+        if self.config_manager.get_setting('warm_clients_on_startup', True):
+            threading.Thread(target=self.warm_clients, name="client-warmup", daemon=True).start()
+        elif self.config_manager.get_setting('startup_report', False):
+            print(startup_timer.report())
+
+    def warm_clients(self):
+        """
+        백그라운드에서 무거운 모듈 import와 클라이언트 생성을 미리 수행
+
+        이미 생성된 클라이언트는 건너뛰고, 실패해도 해당 탭을 열 때 다시 안내됨
+        """
+        for name in ('analyzer', 'gemini_generator', 'gemini_image_generator',
+                     'music_image_generator', 'thumbnail_loader'):
+            getattr(self, name)
+
+        # 검색 스레드에서 처음 쓰는 모듈 (discovery 클라이언트는 스레드마다 생성되므로 import만)
+        with startup_timer.section("googleapiclient.discovery"):
+            import googleapiclient.discovery  # noqa: F401
+
+        if self.config_manager.get_setting('startup_report', False):
+            print(startup_timer.report())
+
+    def _lazy_client(self, name, factory):
+        """
+        이름별 클라이언트를 처음 요청될 때 생성해 보관 (생성 실패 시 None)
+
+        Args:
+            name: 클라이언트 이름
+            factory: 클라이언트를 만드는 함수 (설정이 없으면 None 반환)
+        """
+        if name in self._clients:
+            return self._clients[name]
+
+        with self._client_lock:
+            lock = self._client_locks.setdefault(name, threading.Lock())
+
+        with lock:
+            if name not in self._clients:
+                with startup_timer.section(name):
+                    try:
+                        client = factory()
+                    except Exception as e:
+                        print(f"{name} 초기화 실패: {e}")
+                        client = None
+                self._clients[name] = client
+            return self._clients[name]
+
+    def _set_client(self, name, client):
+        self._clients[name] = client
+
+    def reset_gemini_clients(self):
+        """Gemini 키가 바뀌었을 때 다음 사용 시 새 키로 다시 생성되도록 초기화"""
+        for name in ('gemini_generator', 'gemini_image_generator', 'music_image_generator'):
+            self._clients.pop(name, None)
+
+    def _create_analyzer(self):
+        if not self.api_key:
+            return None
+        try:
+            return YouTubeTrendAnalyzer(
+                self.api_key,
+                cache_ttls=self.config_manager.get_setting('youtube_cache_ttls', None)
+            )
+        except ValueError:
+            # 잘못된 API 키는 삭제
+            self.config_manager.clear_api_key()
+            self.api_key = None
+            raise
+
+    def _gemini_client_pool(self):
+        """세 Gemini 생성기가 함께 쓰는 클라이언트 풀 (연결/모델 객체 공유)"""
+        from gemini_client_pool import get_gemini_client_pool
+        return get_gemini_client_pool(self.gemini_key)
+
+    def _create_gemini_generator(self):
+        if not self.gemini_key:
+            return None
+        from gemini_script_generator import GeminiScriptGenerator
+        return GeminiScriptGenerator(self.gemini_key, client_pool=self._gemini_client_pool())
+
+    def _create_gemini_image_generator(self):
+        if not self.gemini_key:
+            return None
+        from gemini_image_generator import GeminiImageGenerator
+        return GeminiImageGenerator(self.gemini_key, client_pool=self._gemini_client_pool())
+
+    def _create_music_image_generator(self):
+        if not self.gemini_key:
+            return None
+        from music_image_generator import MusicImageGenerator
+        return MusicImageGenerator(self.gemini_key, client_pool=self._gemini_client_pool())
+
+    def _create_thumbnail_loader(self):
+        from thumbnail_loader import ThumbnailLoader
+        # 백그라운드 다운로드, 완료 시 UI 스레드에서 표시
+        return ThumbnailLoader(dispatch=self.ui)
+
+    @property
+    def analyzer(self):
+        """YouTube 분석기 (API 키가 없으면 None)"""
+        return self._lazy_client('analyzer', self._create_analyzer)
+
+    @analyzer.setter
+    def analyzer(self, value):
+        self._set_client('analyzer', value)
+
+    @property
+    def gemini_generator(self):
+        """대본 생성기 (Gemini 키가 없으면 None)"""
+        return self._lazy_client('gemini_generator', self._create_gemini_generator)
+
+    @gemini_generator.setter
+    def gemini_generator(self, value):
+        self._set_client('gemini_generator', value)
+
+    @property
+    def gemini_image_generator(self):
+        """이미지 생성기 (Gemini 키가 없으면 None)"""
+        return self._lazy_client('gemini_image_generator', self._create_gemini_image_generator)
+
+    @property
+    def music_image_generator(self):
+        """음악 이미지 생성기 (Gemini 키가 없으면 None)"""
+        return self._lazy_client('music_image_generator', self._create_music_image_generator)
+
+    @property
+    def thumbnail_loader(self):
+        """썸네일 로더"""
+        return self._lazy_client('thumbnail_loader', self._create_thumbnail_loader)
 
     def show_api_key_dialog(self):
         """API 키 입력 다이얼로그 표시"""
@@ -561,7 +701,8 @@ API 키 발급 방법:
                                      audience_entry.get(),
                                      template_var.get(),
                                      result_text,
-                                     prompt_text
+                                     prompt_text,
+                                     cut_status_var
                                  ),
                                  bootstyle="success",
                                  width=25)
@@ -600,6 +741,13 @@ API 키 발급 방법:
 
 왼쪽에서 설정을 입력하고 생성 버튼을 눌러주세요.""")
         result_text.config(state=tk.DISABLED)
+
+        # 스트리밍 중 완성된 컷 현황
+        cut_status_var = tk.StringVar(value="")
+        ttk.Label(result_frame,
+                 textvariable=cut_status_var,
+                 font=('Helvetica', 9),
+                 bootstyle="secondary").pack(fill=X, pady=(0, 10))
         
         # 버튼 프레임
         button_frame = ttk.Frame(result_frame)
@@ -713,55 +861,105 @@ API 키 발급 방법:
                   bootstyle="secondary-outline",
                   width=10).pack(side=LEFT)
         
-    def generate_script_new(self, topic, language, format_type, duration, audience, template_name, result_text, prompt_text):
-        """새로운 대본 생성 실행 (컷 기반)"""
+    def generate_script_new(self, topic, language, format_type, duration, audience, template_name, result_text, prompt_text,
+                            cut_status_var):
+        """새로운 대본 생성 실행 (컷 기반, 완성된 컷 현황은 cut_status_var에 표시)"""
         if not topic:
             messagebox.showwarning("경고", "영상 주제를 입력해주세요.")
             return
         
-        def run_generation():
-            # 결과 텍스트 초기화
+        def set_result(text):
             result_text.config(state=tk.NORMAL)
             result_text.delete("1.0", tk.END)
-            result_text.insert("1.0", f"🔄 대본 생성 중...\n\n"
-                                      f"잠시만 기다려주세요...")
-            # spacing 재설정 (확실하게)
+            result_text.insert("1.0", text)
+            # spacing 재설정 (생성된 텍스트에도 적용)
             result_text.configure(spacing1=3, spacing2=3, spacing3=3)
             result_text.config(state=tk.DISABLED)
-            
+
+        def append_chunk(chunk, is_first):
+            result_text.config(state=tk.NORMAL)
+            if is_first:
+                result_text.delete("1.0", tk.END)
+            result_text.insert(tk.END, chunk)
+            result_text.see(tk.END)
+            result_text.configure(spacing1=3, spacing2=3, spacing3=3)
+            result_text.config(state=tk.DISABLED)
+
+        # 결과 텍스트 초기화
+        set_result("🔄 대본 생성 중...\n\n잠시만 기다려주세요...")
+        cut_status_var.set("")
+
+        def show_cuts(cuts, finished):
+            if not cuts:
+                text = "⚠️ 컷 형식을 찾지 못했습니다." if finished else ""
+            elif finished:
+                text = f"✅ 총 {len(cuts)}개 컷"
+            else:
+                last = cuts[-1]
+                text = f"✂️ 컷 {len(cuts)}개 완성 · 마지막: CUT {last['cut_number']} ({last['time_range']})"
+            self.post_progress(cut_status_var, text)
+
+        # 사용자 정의 프롬프트 (위젯은 UI 스레드에서만 읽음)
+        custom_prompt = prompt_text.get("1.0", tk.END).strip()
+
+        def run_generation():
+            from gemini_image_generator import ScriptStreamParser
+
             try:
-                # 사용자 정의 프롬프트 사용
-                custom_prompt = prompt_text.get("1.0", tk.END).strip()
-                
-                # 대본 생성
-                script = self.gemini_generator.generate_script(
+                # 긴 대본은 구간별로 나누어 병렬 생성
+                if duration >= self.config_manager.get_setting('script_chunk_min_duration', 3):
+                    def update_progress(current, total, message):
+                        self.ui.post(set_result,
+                                     f"🔄 대본 생성 중... ({current}/{total} 구간)\n\n{message}",
+                                     key=(id(result_text), 'result'))
+
+                    script = self.gemini_generator.generate_script_chunked(
+                        topic=topic,
+                        language=language,
+                        format_type=format_type,
+                        duration=duration,
+                        target_audience=audience,
+                        custom_prompt=custom_prompt,
+                        chunk_size=self.config_manager.get_setting('script_chunk_size', 20),
+                        progress_callback=update_progress
+                    )
+                    if script:
+                        self.ui.post(set_result, script, key=(id(result_text), 'result'))
+                        parser = ScriptStreamParser()
+                        show_cuts(parser.feed(script) + parser.close(), True)
+                    else:
+                        self.ui.post(set_result, "❌ 대본 생성에 실패했습니다.\n다시 시도해주세요.",
+                                     key=(id(result_text), 'result'))
+                    return
+
+                # 대본 스트리밍 생성 (도착하는 대로 표시, 닫힌 컷은 바로 집계)
+                parser = ScriptStreamParser()
+                cuts = []
+                received = False
+                for chunk in self.gemini_generator.generate_script_stream(
                     topic=topic,
                     language=language,
                     format_type=format_type,
                     duration=duration,
                     target_audience=audience,
                     custom_prompt=custom_prompt
-                )
-                
-                # 결과 표시
-                result_text.config(state=tk.NORMAL)
-                result_text.delete("1.0", tk.END)
-                if script:
-                    result_text.insert("1.0", script)
+                ):
+                    self.ui.post(append_chunk, chunk, not received)
+                    received = True
+
+                    completed = parser.feed(chunk)
+                    if completed:
+                        cuts.extend(completed)
+                        show_cuts(cuts, False)
+
+                if received:
+                    cuts.extend(parser.close())
+                    show_cuts(cuts, True)
                 else:
-                    result_text.insert("1.0", "❌ 대본 생성에 실패했습니다.\n다시 시도해주세요.")
-                
-                # spacing 재설정 (생성된 텍스트에도 적용)
-                result_text.configure(spacing1=3, spacing2=3, spacing3=3)
-                result_text.config(state=tk.DISABLED)
+                    self.ui.post(set_result, "❌ 대본 생성에 실패했습니다.\n다시 시도해주세요.")
                 
             except Exception as e:
-                result_text.config(state=tk.NORMAL)
-                result_text.delete("1.0", tk.END)
-                result_text.insert("1.0", f"❌ 오류 발생:\n\n{str(e)}")
-                # spacing 재설정
-                result_text.configure(spacing1=3, spacing2=3, spacing3=3)
-                result_text.config(state=tk.DISABLED)
+                self.ui.post(set_result, f"❌ 오류 발생:\n\n{str(e)}")
         
         # 백그라운드에서 실행
         threading.Thread(target=run_generation, daemon=True).start()
@@ -850,6 +1048,7 @@ API 키 발급 방법:
         # 스크롤 가능한 메인 컨테이너
         main_scroll = ScrolledFrame(container, autohide=True)
         main_scroll.pack(fill=BOTH, expand=YES)
+        self.image_results_viewport = main_scroll.container  # 결과 목록 높이 기준
 
         # ========== 기능 1: 설정 영역 ==========
         settings_frame = ttk.LabelFrame(main_scroll,
@@ -1010,6 +1209,23 @@ API 키 발급 방법:
                  font=('Helvetica', 9),
                  bootstyle="secondary").grid(row=2, column=2, columnspan=4, sticky=W, pady=5)
 
+        # 네 번째 줄: 동시 생성 수
+        ttk.Label(settings_grid,
+                 text="동시 생성:",
+                 font=('Helvetica', 10, 'bold')).grid(row=3, column=0, sticky=W, padx=(0, 10), pady=5)
+
+        self.image_workers_var = tk.IntVar(value=self.config_manager.get_setting('image_max_workers', 4))
+        ttk.Spinbox(settings_grid,
+                    from_=1,
+                    to=10,
+                    textvariable=self.image_workers_var,
+                    width=8).grid(row=3, column=1, sticky=W, padx=(0, 20), pady=5)
+
+        ttk.Label(settings_grid,
+                 text="💡 동시에 생성할 이미지 수 (1이면 순차 생성)",
+                 font=('Helvetica', 9),
+                 bootstyle="secondary").grid(row=3, column=2, columnspan=4, sticky=W, pady=5)
+
         # ========== 기능 2: 대본 입력 영역 ==========
         script_frame = ttk.LabelFrame(main_scroll,
                                      text="📝 대본 입력 (복사/붙여넣기)",
@@ -1059,6 +1275,15 @@ API 키 발급 방법:
                                               width=25)
         self.generate_images_btn.pack(side=LEFT, padx=(0, 10))
 
+        self.image_pipeline = None
+        self.stop_images_btn = ttk.Button(button_frame,
+                                          text="⏹ 중지",
+                                          command=self.stop_image_generation,
+                                          bootstyle="warning-outline",
+                                          state=tk.DISABLED,
+                                          width=10)
+        self.stop_images_btn.pack(side=LEFT, padx=(0, 10))
+
         ttk.Button(button_frame,
                   text="🗑️ 초기화",
                   command=self.clear_image_generation,
@@ -1090,6 +1315,13 @@ API 키 발급 방법:
                   bootstyle="success",
                   width=20).pack(side=LEFT)
 
+        self.image_export_stop_btn = ttk.Button(save_all_frame,
+                                              text="⏹ 저장 중지",
+                                              bootstyle="warning-outline",
+                                              state=tk.DISABLED,
+                                              width=12)
+        self.image_export_stop_btn.pack(side=LEFT, padx=(10, 0))
+
         ttk.Label(save_all_frame,
                  text="생성된 모든 이미지를 한 번에 저장합니다",
                  font=('Helvetica', 9),
@@ -1122,53 +1354,98 @@ API 키 발급 방법:
             messagebox.showwarning("경고", "컷을 파싱할 수 없습니다.\n올바른 형식의 대본을 입력해주세요.")
             return
 
-        # 버튼 비활성화
+        # 동시 생성 수
+        try:
+            max_workers = max(1, min(10, int(self.image_workers_var.get())))
+        except (tk.TclError, ValueError):
+            max_workers = 4
+        self.config_manager.save_setting('image_max_workers', max_workers)
+
+        # 프롬프트 생성과 이미지 생성을 큐로 연결해 동시에 진행
+        pipeline = ImagePipeline(
+            generator=self.gemini_image_generator,
+            model=self.image_model_var.get(),
+            aspect_ratio=self.aspect_ratio_var.get(),
+            prompt_options=dict(
+                style=self.style_var.get(),
+                mood=self.mood_var.get(),
+                color=self.color_var.get(),
+                lighting=self.lighting_var.get(),
+                camera=self.camera_var.get()
+            ),
+            image_workers=max_workers,
+            batch_size=self.get_prompt_batch_size(),
+            progress_callback=lambda current, total, message: self.post_progress(
+                self.image_progress_var, f"{message} ({current}/{total or '?'})")
+        )
+        self.image_pipeline = pipeline
+
+        # 버튼 상태 변경
         self.generate_images_btn.config(state=tk.DISABLED)
+        self.stop_images_btn.config(state=tk.NORMAL)
         self.image_progress_var.set(f"총 {len(cuts)}개 컷 처리 중...")
 
         def run_generation():
             try:
-                # 1단계: 프롬프트 생성
-                self.image_progress_var.set("프롬프트 생성 중...")
-
-                cuts_with_prompts = self.gemini_image_generator.generate_image_prompts(
-                    cuts=cuts,
-                    style=self.style_var.get(),
-                    mood=self.mood_var.get(),
-                    color=self.color_var.get(),
-                    lighting=self.lighting_var.get(),
-                    camera=self.camera_var.get()
-                )
-
-                # 2단계: 이미지 생성
-                def update_progress(current, total, message):
-                    self.image_progress_var.set(f"{message} ({current}/{total})")
-
-                results = self.gemini_image_generator.generate_all_images(
-                    cuts_with_prompts=cuts_with_prompts,
-                    model=self.image_model_var.get(),
-                    aspect_ratio=self.aspect_ratio_var.get(),
-                    progress_callback=update_progress
-                )
+                results = pipeline.run(cuts)
 
                 # UI 업데이트
-                self.root.after(0, lambda: self.display_image_results(results))
+                self.ui.post(self.display_image_results, results)
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("오류", f"이미지 생성 실패:\n{str(e)}"))
+                self.ui.post(messagebox.showerror, "오류", f"이미지 생성 실패:\n{str(e)}")
             finally:
-                self.root.after(0, lambda: self.generate_images_btn.config(state=tk.NORMAL))
-                self.root.after(0, lambda: self.image_progress_var.set(""))
+                self.image_pipeline = None
+                self.ui.post(lambda: self.generate_images_btn.config(state=tk.NORMAL))
+                self.ui.post(lambda: self.stop_images_btn.config(state=tk.DISABLED))
+                self.post_progress(self.image_progress_var, "")
 
         threading.Thread(target=run_generation, daemon=True).start()
 
+    def stop_image_generation(self):
+        """진행 중인 이미지 생성 중지 (완료된 컷만 표시)"""
+        if self.image_pipeline:
+            self.image_pipeline.cancel()
+            self.stop_images_btn.config(state=tk.DISABLED)
+            self.image_progress_var.set("중지하는 중...")
+
+    def post_progress(self, var, text):
+        """
+        진행 상황 표시 요청 (어느 스레드에서나 호출 가능)
+
+        같은 변수에 대한 요청이 쌓이면 마지막 값만 표시
+
+        Args:
+            var: 진행 상황 StringVar
+            text: 표시할 문구
+        """
+        self.ui.post(var.set, text, key=('progress', str(var)))
+
+    def get_prompt_batch_size(self):
+        """
+        프롬프트 배치 크기 설정값 (정수가 아니면 기본값 10, 최소 1)
+
+        Returns:
+            int: 한 번의 요청으로 프롬프트를 만들 컷 수
+        """
+        try:
+            return max(1, int(self.config_manager.get_setting('prompt_batch_size', 10)))
+        except (TypeError, ValueError):
+            return 10
+
     def display_image_results(self, results):
         """이미지 생성 결과 표시"""
+        self.image_cuts_data = results
+
+        # 목록 위젯이 있으면 재사용 (보이는 카드만 새 결과로 다시 채움)
+        if results and self.image_results_list and self.image_results_list.winfo_exists():
+            self.image_results_list.set_items(results)
+            return
+
         # 기존 내용 삭제
         for widget in self.image_results_container.winfo_children():
             widget.destroy()
-
-        self.image_cuts_data = results
+        self.image_results_list = None
 
         if not results:
             ttk.Label(self.image_results_container,
@@ -1177,44 +1454,68 @@ API 키 발급 방법:
                      bootstyle="warning").pack(pady=50)
             return
 
-        # 각 컷별 결과 표시
-        for i, cut in enumerate(results):
-            self.create_cut_result_card(self.image_results_container, cut, i)
+        # 각 컷별 결과 표시 (보이는 카드만 만들고 스크롤 시 재사용)
+        self.image_results_list = VirtualList(
+            self.image_results_container,
+            create_row=lambda parent: self.create_cut_row(
+                parent, "📝 대본", self.regenerate_single_image, self.save_single_image),
+            bind_row=lambda row, cut, index: self.bind_cut_row(
+                row, cut, index,
+                title=f"CUT {cut['cut_number']} ({cut['time_range']})",
+                source_text=f"[장면]\n{cut['scene_description']}\n\n[대사]\n{cut['narration']}"),
+            viewport=self.image_results_viewport
+        )
+        self.image_results_list.pack(fill=BOTH, expand=YES)
+        self.image_results_list.set_items(results)
+
+    def create_cut_row(self, parent, source_title, regenerate, save):
+        """
+        컷 결과 카드 위젯 생성 (내용은 bind_cut_row에서 채움)
+
+        Args:
+            parent: 부모 위젯
+            source_title: 왼쪽 원문 영역 제목 (대본/가사)
+            regenerate: 재생성 버튼 콜백 (cut_index, prompt_text_widget)
+            save: 저장 버튼 콜백 (cut_index)
+        """
+        row = ttk.Frame(parent)
+        row.cut = None
+        row.index = None
+        # 현재 표시 중인 내용 (바뀐 위젯만 갱신하기 위해 보관)
+        row.shown_title = None
+        row.shown_source = None
+        row.shown_prompt = ""
+        row.shown_image = None
 
-    def create_cut_result_card(self, parent, cut, index):
-        """개별 컷 결과 카드 생성"""
         # 카드 프레임
-        card = ttk.LabelFrame(parent,
-                             text=f"CUT {cut['cut_number']} ({cut['time_range']})",
-                             padding="10",
-                             bootstyle="info")
-        card.pack(fill=X, pady=(0, 15))
+        row.card = ttk.LabelFrame(row,
+                                  padding="10",
+                                  bootstyle="info")
+        row.card.pack(fill=BOTH, expand=YES, pady=(0, 15))
 
-        # 3분할 레이아웃: 대본 | 프롬프트 | 이미지
-        content_frame = ttk.Frame(card)
+        # 3분할 레이아웃: 원문 | 프롬프트 | 이미지
+        content_frame = ttk.Frame(row.card)
         content_frame.pack(fill=X)
         content_frame.columnconfigure(0, weight=1)
         content_frame.columnconfigure(1, weight=1)
         content_frame.columnconfigure(2, weight=0)
 
-        # 왼쪽: 대본 정보
-        script_frame = ttk.Frame(content_frame)
-        script_frame.grid(row=0, column=0, sticky=(N, S, W, E), padx=(0, 10))
+        # 왼쪽: 원문 정보
+        source_frame = ttk.Frame(content_frame)
+        source_frame.grid(row=0, column=0, sticky=(N, S, W, E), padx=(0, 10))
 
-        ttk.Label(script_frame,
-                 text="📝 대본",
+        ttk.Label(source_frame,
+                 text=source_title,
                  font=('Helvetica', 10, 'bold'),
                  bootstyle="primary").pack(anchor=W)
 
-        script_text = scrolledtext.ScrolledText(script_frame,
-                                                font=('Helvetica', 10),
-                                                wrap=tk.WORD,
-                                                height=12,
-                                                width=35)
-        script_text.pack(fill=X, pady=(5, 0))
-        script_text.insert("1.0", f"[장면]\n{cut['scene_description']}\n\n[대사]\n{cut['narration']}")
-        script_text.config(state=tk.DISABLED)
-        script_text.configure(spacing1=3, spacing2=3, spacing3=3)
+        row.source_text = scrolledtext.ScrolledText(source_frame,
+                                                    font=('Helvetica', 10),
+                                                    wrap=tk.WORD,
+                                                    height=12,
+                                                    width=35)
+        row.source_text.pack(fill=X, pady=(5, 0))
+        row.source_text.configure(spacing1=3, spacing2=3, spacing3=3)
 
         # 중앙: 프롬프트 (편집 가능)
         prompt_frame = ttk.Frame(content_frame)
@@ -1225,22 +1526,20 @@ API 키 발급 방법:
                  font=('Helvetica', 10, 'bold'),
                  bootstyle="success").pack(anchor=W)
 
-        prompt_text = scrolledtext.ScrolledText(prompt_frame,
-                                                font=('Helvetica', 10),
-                                                wrap=tk.WORD,
-                                                height=12,
-                                                width=40)
-        prompt_text.pack(fill=X, pady=(5, 5))
-        prompt_text.configure(spacing1=3, spacing2=3, spacing3=3)
-        prompt_text.insert("1.0", cut.get('image_prompt', '프롬프트 생성 실패'))
+        row.prompt_text = scrolledtext.ScrolledText(prompt_frame,
+                                                    font=('Helvetica', 10),
+                                                    wrap=tk.WORD,
+                                                    height=12,
+                                                    width=40)
+        row.prompt_text.pack(fill=X, pady=(5, 5))
+        row.prompt_text.configure(spacing1=3, spacing2=3, spacing3=3)
 
         # 재생성 버튼
-        regen_btn = ttk.Button(prompt_frame,
-                              text="🔄 이미지 재생성",
-                              command=lambda idx=index, pt=prompt_text: self.regenerate_single_image(idx, pt),
-                              bootstyle="warning-outline",
-                              width=18)
-        regen_btn.pack(anchor=W)
+        ttk.Button(prompt_frame,
+                  text="🔄 이미지 재생성",
+                  command=lambda: regenerate(row.index, row.prompt_text),
+                  bootstyle="warning-outline",
+                  width=18).pack(anchor=W)
 
         # 오른쪽: 이미지
         image_frame = ttk.Frame(content_frame)
@@ -1252,37 +1551,93 @@ API 키 발급 방법:
                  bootstyle="info").pack(anchor=W)
 
         # 이미지 표시 영역
-        image_display = ttk.Label(image_frame, text="")
-        image_display.pack(pady=(5, 5))
-
-        if cut.get('generated_image'):
-            # PIL Image를 PhotoImage로 변환
-            img = cut['generated_image']
-            # 썸네일 크기로 리사이즈
-            img_display = img.copy()
-            img_display.thumbnail((256, 256), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img_display)
-            image_display.config(image=photo)
-            image_display.image = photo  # 참조 유지
-
-            # 이미지 인덱스 저장 (저장시 사용)
-            image_display.cut_index = index
-        elif cut.get('image_error'):
-            image_display.config(text=f"❌ {cut['image_error'][:50]}...",
-                               font=('Helvetica', 9),
-                               bootstyle="danger")
-        else:
-            image_display.config(text="이미지 없음",
-                               font=('Helvetica', 10),
-                               bootstyle="secondary")
+        row.image_display = ttk.Label(image_frame, text="")
+        row.image_display.pack(pady=(5, 5))
 
         # 개별 저장 버튼
         ttk.Button(image_frame,
                   text="💾 저장",
-                  command=lambda idx=index: self.save_single_image(idx),
+                  command=lambda: save(row.index),
                   bootstyle="success-outline",
                   width=10).pack(anchor=W)
 
+        return row
+
+    def bind_cut_row(self, row, cut, index, title, source_text):
+        """
+        컷 결과 카드에 컷 내용 표시 (이미 표시 중인 내용과 다른 위젯만 갱신)
+
+        Args:
+            row: create_cut_row로 만든 위젯
+            cut: 컷 데이터
+            index: 컷 인덱스
+            title: 카드 제목
+            source_text: 왼쪽 원문 영역 내용
+        """
+        # 다른 컷으로 바뀌기 전에 편집한 프롬프트를 데이터에 보존
+        if row.cut is not None and row.cut is not cut:
+            edited = row.prompt_text.get("1.0", "end-1c")
+            if edited != row.shown_prompt:
+                row.cut['image_prompt'] = edited
+
+        same_cut = row.cut is cut and row.index == index
+        row.cut = cut
+        row.index = index
+
+        if row.shown_title != title:
+            row.card.config(text=title)
+            row.shown_title = title
+
+        if row.shown_source != source_text:
+            row.source_text.config(state=tk.NORMAL)
+            row.source_text.delete("1.0", tk.END)
+            row.source_text.insert("1.0", source_text)
+            row.source_text.config(state=tk.DISABLED)
+            row.shown_source = source_text
+
+        # 같은 컷이고 프롬프트가 그대로면 편집 중인 내용을 유지
+        prompt = cut.get('image_prompt', '프롬프트 생성 실패')
+        if not same_cut or prompt != row.shown_prompt:
+            row.shown_prompt = prompt
+            row.prompt_text.delete("1.0", tk.END)
+            row.prompt_text.insert("1.0", prompt)
+
+        image_state = (cut.get('generated_image'), cut.get('image_error'))
+        if row.shown_image == image_state:
+            return
+        row.shown_image = image_state
+
+        if cut.get('generated_image'):
+            # 이미지가 도착할 때 미리 만들어 둔 썸네일 사용 (원본을 다시 축소하지 않음)
+            img_display = cut['generated_image'].thumbnail((256, 256))
+            photo = ImageTk.PhotoImage(img_display)
+            row.image_display.config(image=photo, text="", bootstyle="default")
+            row.image_display.image = photo  # 참조 유지
+        elif cut.get('image_error'):
+            row.image_display.config(image="",
+                                     text=f"❌ {cut['image_error'][:50]}...",
+                                     font=('Helvetica', 9),
+                                     bootstyle="danger")
+            row.image_display.image = None
+        else:
+            row.image_display.config(image="",
+                                     text="이미지 없음",
+                                     font=('Helvetica', 10),
+                                     bootstyle="secondary")
+            row.image_display.image = None
+
+    def refresh_cut_row(self, results_list, results, cut_index):
+        """
+        컷 하나의 카드만 갱신 (UI 스레드에서 호출)
+
+        Args:
+            results_list: 컷 결과 VirtualList
+            results: 재생성을 시작할 때의 컷 리스트 (그사이 새 결과가 표시됐으면 무시)
+            cut_index: 갱신할 컷 인덱스
+        """
+        if results_list and results_list.winfo_exists() and results_list.items is results:
+            results_list.refresh_row(cut_index)
+
     def regenerate_single_image(self, cut_index, prompt_text_widget):
         """단일 컷 이미지 재생성"""
         new_prompt = prompt_text_widget.get("1.0", tk.END).strip()
@@ -1291,27 +1646,30 @@ API 키 발급 방법:
             messagebox.showwarning("경고", "프롬프트를 입력해주세요.")
             return
 
-        self.image_progress_var.set(f"컷 {cut_index + 1} 이미지 재생성 중...")
+        self.post_progress(self.image_progress_var, f"컷 {cut_index + 1} 이미지 재생성 중...")
+        model = self.image_model_var.get()
+        aspect_ratio = self.aspect_ratio_var.get()
+        results = self.image_cuts_data
 
         def run_regeneration():
             try:
-                cut = self.image_cuts_data[cut_index]
+                cut = results[cut_index]
                 updated_cut = self.gemini_image_generator.regenerate_cut_image(
                     cut=cut,
                     new_prompt=new_prompt,
-                    model=self.image_model_var.get(),
-                    aspect_ratio=self.aspect_ratio_var.get()
+                    model=model,
+                    aspect_ratio=aspect_ratio
                 )
 
-                self.image_cuts_data[cut_index] = updated_cut
+                results[cut_index] = updated_cut
 
-                # UI 업데이트
-                self.root.after(0, lambda: self.display_image_results(self.image_cuts_data))
+                # UI 업데이트 (바뀐 컷의 카드만 갱신)
+                self.ui.post(lambda: self.refresh_cut_row(self.image_results_list, results, cut_index))
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("오류", f"재생성 실패:\n{str(e)}"))
+                self.ui.post(messagebox.showerror, "오류", f"재생성 실패:\n{str(e)}")
             finally:
-                self.root.after(0, lambda: self.image_progress_var.set(""))
+                self.post_progress(self.image_progress_var, "")
 
         threading.Thread(target=run_regeneration, daemon=True).start()
 
@@ -1343,35 +1701,183 @@ API 키 발급 방법:
 
     def save_all_images(self):
         """모든 이미지 일괄 저장"""
-        from tkinter import filedialog
+        self.export_cut_images(self.image_cuts_data, "cut", self.image_progress_var, self.image_export_stop_btn)
 
-        if not self.image_cuts_data:
-            messagebox.showwarning("경고", "저장할 이미지가 없습니다.")
-            return
+    def ask_export_options(self):
+        """
+        내보내기 옵션 다이얼로그 표시 (마지막 선택값을 설정에 저장)
+
+        Returns:
+            dict: format, quality, compress_level, max_size, zip (취소 시 None)
+        """
+        saved = self.config_manager.get_setting('export_options', {}) or {}
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("이미지 내보내기")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.grab_set()
+
+        result = [None]  # 결과 저장용
+
+        main_frame = ttk.Frame(dialog, padding="20")
+        main_frame.pack(fill=BOTH, expand=YES)
+
+        ttk.Label(main_frame,
+                 text="💾 이미지 내보내기",
+                 font=('Helvetica', 14, 'bold'),
+                 bootstyle="primary").grid(row=0, column=0, columnspan=2, sticky=W, pady=(0, 15))
+
+        format_var = tk.StringVar(value=saved.get('format', 'PNG'))
+        quality_var = tk.IntVar(value=saved.get('quality', 90))
+        compress_var = tk.IntVar(value=saved.get('compress_level', 6))
+        size_var = tk.StringVar(value=str(saved.get('max_size') or "원본"))
+        zip_var = tk.BooleanVar(value=saved.get('zip', False))
+
+        fields = [
+            ("포맷:", ttk.Combobox(main_frame, textvariable=format_var,
+                                  values=["PNG", "JPEG", "WEBP"], state="readonly", width=12)),
+            ("품질 (JPEG/WebP):", ttk.Spinbox(main_frame, from_=1, to=100,
+                                             textvariable=quality_var, width=12)),
+            ("압축 수준 (PNG 0-9):", ttk.Spinbox(main_frame, from_=0, to=9,
+                                              textvariable=compress_var, width=12)),
+            ("최대 크기 (px):", ttk.Combobox(main_frame, textvariable=size_var,
+                                          values=["원본", "3840", "2560", "1920", "1280", "1024"],
+                                          width=12)),
+        ]
+        for row, (label, widget) in enumerate(fields, 1):
+            ttk.Label(main_frame, text=label, font=('Helvetica', 10)).grid(row=row, column=0, sticky=W, pady=5)
+            widget.grid(row=row, column=1, sticky=W, padx=(10, 0), pady=5)
+
+        ttk.Checkbutton(main_frame,
+                       text="ZIP 파일 하나로 저장",
+                       variable=zip_var,
+                       bootstyle="round-toggle").grid(row=len(fields) + 1, column=0, columnspan=2,
+                                                      sticky=W, pady=(10, 0))
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=len(fields) + 2, column=0, columnspan=2, sticky=E, pady=(20, 0))
+
+        def on_ok():
+            try:
+                quality = int(quality_var.get())
+                compress_level = int(compress_var.get())
+            except (tk.TclError, ValueError):
+                messagebox.showwarning("경고", "품질과 압축 수준은 숫자로 입력해주세요.", parent=dialog)
+                return
+
+            size = size_var.get().strip()
+            if size.isdigit():
+                max_size = int(size)
+            elif size in ("", "원본"):
+                max_size = None
+            else:
+                messagebox.showwarning("경고", "최대 크기는 숫자 또는 '원본'으로 입력해주세요.", parent=dialog)
+                return
+
+            result[0] = {
+                'format': format_var.get(),
+                'quality': max(1, min(100, quality)),
+                'compress_level': max(0, min(9, compress_level)),
+                'max_size': max_size,
+                'zip': zip_var.get(),
+            }
+            self.config_manager.save_setting('export_options', result[0])
+            dialog.destroy()
+
+        ttk.Button(button_frame,
+                  text="✅ 내보내기",
+                  command=on_ok,
+                  bootstyle="success",
+                  width=12).pack(side=RIGHT, padx=(5, 0))
+
+        ttk.Button(button_frame,
+                  text="❌ 취소",
+                  command=dialog.destroy,
+                  bootstyle="secondary",
+                  width=12).pack(side=RIGHT)
+
+        # 다이얼로그가 닫힐 때까지 대기
+        dialog.wait_window()
+
+        return result[0]
+
+    def export_cut_images(self, cuts_data, prefix, progress_var, stop_button):
+        """
+        컷 이미지를 백그라운드에서 일괄 내보내기 (인코딩은 프로세스 풀에서 병렬 처리)
+
+        Args:
+            cuts_data: 컷 리스트
+            prefix: 파일 이름 접두사 (예: "cut" → cut_01.png)
+            progress_var: 진행 상황 StringVar
+            stop_button: 내보내기 중지 버튼 (진행 중에만 활성화)
+        """
+        from tkinter import filedialog
 
         # 저장할 이미지가 있는지 확인
-        images_to_save = [cut for cut in self.image_cuts_data if cut.get('generated_image')]
+        images_to_save = [cut for cut in cuts_data if cut.get('generated_image')]
 
         if not images_to_save:
             messagebox.showwarning("경고", "저장할 이미지가 없습니다.")
             return
 
-        # 폴더 선택
-        folder_path = filedialog.askdirectory(title="이미지 저장 폴더 선택")
+        options = self.ask_export_options()
+        if not options:
+            return
 
-        if folder_path:
-            try:
-                import os
-                saved_count = 0
+        if options['zip']:
+            target_path = filedialog.asksaveasfilename(
+                defaultextension=".zip",
+                filetypes=[("ZIP 파일", "*.zip")],
+                initialfile=f"{prefix}_images.zip"
+            )
+        else:
+            # 폴더 선택
+            target_path = filedialog.askdirectory(title="이미지 저장 폴더 선택")
+
+        if not target_path:
+            return
+
+        from image_exporter import ImageExporter, ExportCancelled
+
+        items = [
+            (f"{prefix}_{cut['cut_number']:02d}", str(cut['generated_image'].path))
+            for cut in images_to_save
+        ]
+        max_size = options['max_size']
+        exporter = ImageExporter(
+            image_format=options['format'],
+            quality=options['quality'],
+            compress_level=options['compress_level'],
+            max_size=(max_size, max_size) if max_size else None,
+            progress_callback=lambda current, total, message: self.post_progress(progress_var, message)
+        )
 
-                for cut in images_to_save:
-                    file_path = os.path.join(folder_path, f"cut_{cut['cut_number']:02d}.png")
-                    cut['generated_image'].save(file_path)
-                    saved_count += 1
+        self.post_progress(progress_var, f"{len(items)}개 이미지 내보내는 중...")
 
-                messagebox.showinfo("완료", f"{saved_count}개 이미지가 저장되었습니다:\n{folder_path}")
+        def stop_export():
+            exporter.cancel()
+            stop_button.config(state=tk.DISABLED)
+            self.post_progress(progress_var, "저장 중지하는 중...")
+
+        stop_button.config(command=stop_export, state=tk.NORMAL)
+
+        def run_export():
+            try:
+                if options['zip']:
+                    exporter.export_to_zip(items, target_path)
+                else:
+                    exporter.export_to_folder(items, target_path)
+                self.ui.post(messagebox.showinfo, "완료", f"{len(items)}개 이미지가 저장되었습니다:\n{target_path}")
+            except ExportCancelled:
+                self.ui.post(messagebox.showinfo, "중지", "이미지 저장을 중지했습니다.\n(폴더 저장은 이미 저장된 파일이 남아 있습니다)")
             except Exception as e:
-                messagebox.showerror("오류", f"저장 실패:\n{str(e)}")
+                self.ui.post(messagebox.showerror, "오류", f"저장 실패:\n{str(e)}")
+            finally:
+                self.ui.post(lambda: stop_button.config(state=tk.DISABLED))
+                self.post_progress(progress_var, "")
+
+        threading.Thread(target=run_export, daemon=True).start()
 
     def load_script_file(self):
         """대본 텍스트 파일 불러오기"""
@@ -1431,6 +1937,7 @@ API 키 발급 방법:
 
         # 데이터 초기화
         self.image_cuts_data = []
+        self.image_results_list = None
         self.image_progress_var.set("")
 
     def show_music_image_maker(self):
@@ -1461,6 +1968,7 @@ API 키 발급 방법:
         # 스크롤 가능한 메인 컨테이너
         main_scroll = ScrolledFrame(container, autohide=True)
         main_scroll.pack(fill=BOTH, expand=YES)
+        self.music_results_viewport = main_scroll.container  # 결과 목록 높이 기준
 
         # ========== 기능 1: 곡 정보 및 컨셉 ==========
         music_info_frame = ttk.LabelFrame(main_scroll,
@@ -1773,6 +2281,13 @@ API 키 발급 방법:
                   bootstyle="success",
                   width=20).pack(side=LEFT)
 
+        self.music_export_stop_btn = ttk.Button(save_all_frame,
+                                              text="⏹ 저장 중지",
+                                              bootstyle="warning-outline",
+                                              state=tk.DISABLED,
+                                              width=12)
+        self.music_export_stop_btn.pack(side=LEFT, padx=(10, 0))
+
         ttk.Label(save_all_frame,
                  text="생성된 모든 이미지를 한 번에 저장합니다",
                  font=('Helvetica', 9),
@@ -1821,161 +2336,82 @@ API 키 발급 방법:
         tempo = self.music_tempo_var.get()
         music_mood = self.music_mood_var.get()
 
+        # 스타일 옵션 (위젯 변수는 UI 스레드에서만 읽음)
+        style_options = dict(
+            style=self.music_style_var.get(),
+            visual_mood=self.music_visual_mood_var.get(),
+            color=self.music_color_var.get(),
+            lighting=self.music_lighting_var.get(),
+            camera=self.music_camera_var.get()
+        )
+        model = self.music_image_model_var.get()
+        aspect_ratio = self.music_aspect_ratio_var.get()
+
         # 버튼 비활성화
         self.music_generate_btn.config(state=tk.DISABLED)
-        self.music_progress_var.set(f"총 {len(lyrics_lines)}개 컷 처리 중...")
+        self.post_progress(self.music_progress_var, f"총 {len(lyrics_lines)}개 컷 처리 중...")
 
         def run_generation():
             try:
-                results = []
                 total = len(lyrics_lines)
 
-                for i, lyric_line in enumerate(lyrics_lines):
-                    self.music_progress_var.set(f"컷 {i+1}/{total} 프롬프트 생성 중...")
-
-                    # 프롬프트 생성
-                    image_prompt = self.generate_music_image_prompt(
-                        lyric_line=lyric_line,
-                        song_title=song_title,
-                        visual_concept=visual_concept,
-                        genre=genre,
-                        tempo=tempo,
-                        music_mood=music_mood,
-                        style=self.music_style_var.get(),
-                        visual_mood=self.music_visual_mood_var.get(),
-                        color=self.music_color_var.get(),
-                        lighting=self.music_lighting_var.get(),
-                        camera=self.music_camera_var.get()
-                    )
+                # 1단계: 프롬프트 생성 (여러 줄을 묶어서 요청)
+                def update_prompt_progress(current, total, message):
+                    self.post_progress(self.music_progress_var, f"{message} ({current}/{total})")
 
-                    self.music_progress_var.set(f"컷 {i+1}/{total} 이미지 생성 중...")
+                cuts = self.music_image_generator.parse_lyrics_to_cuts('\n'.join(lyrics_lines))
+                cuts_with_prompts = self.music_image_generator.generate_all_prompts(
+                    cuts=cuts,
+                    song_title=song_title,
+                    visual_concept=visual_concept,
+                    genre=genre,
+                    tempo=tempo,
+                    music_mood=music_mood,
+                    progress_callback=update_prompt_progress,
+                    batch_size=self.get_prompt_batch_size(),
+                    **style_options
+                )
+
+                # 2단계: 이미지 생성
+                results = []
+                for i, cut in enumerate(cuts_with_prompts):
+                    self.post_progress(self.music_progress_var, f"컷 {i+1}/{total} 이미지 생성 중...")
 
-                    # 이미지 생성
                     image, error = self.gemini_image_generator.generate_single_image(
-                        prompt=image_prompt,
-                        model=self.music_image_model_var.get(),
-                        aspect_ratio=self.music_aspect_ratio_var.get()
+                        prompt=cut['image_prompt'],
+                        model=model,
+                        aspect_ratio=aspect_ratio
                     )
 
-                    results.append({
-                        'cut_number': i + 1,
-                        'lyrics': lyric_line,
-                        'image_prompt': image_prompt,
-                        'generated_image': image,
-                        'image_error': error
-                    })
-
-                    # API 호출 간 딜레이
-                    if i < total - 1:
-                        import time
-                        time.sleep(1)
+                    cut_result = cut.copy()
+                    cut_result['generated_image'] = image
+                    cut_result['image_error'] = error
+                    results.append(cut_result)
 
                 # UI 업데이트
-                self.root.after(0, lambda: self.display_music_image_results(results))
+                self.ui.post(self.display_music_image_results, results)
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("오류", f"이미지 생성 실패:\n{str(e)}"))
+                self.ui.post(messagebox.showerror, "오류", f"이미지 생성 실패:\n{str(e)}")
             finally:
-                self.root.after(0, lambda: self.music_generate_btn.config(state=tk.NORMAL))
-                self.root.after(0, lambda: self.music_progress_var.set(""))
+                self.ui.post(lambda: self.music_generate_btn.config(state=tk.NORMAL))
+                self.post_progress(self.music_progress_var, "")
 
         threading.Thread(target=run_generation, daemon=True).start()
 
-    def generate_music_image_prompt(self, lyric_line, song_title, visual_concept, genre, tempo,
-                                    music_mood, style, visual_mood, color, lighting, camera):
-        """음악 이미지 생성을 위한 프롬프트 생성"""
-        # 스타일 설명 매핑
-        style_descriptions = {
-            "Realistic Photography": "photorealistic, live action photography, high detail realistic image",
-            "Animation": "anime style, 2D animation, illustrated",
-            "3D Pixar Style": "3D rendered, Pixar animation style, CGI, stylized 3D characters",
-            "Cyberpunk/Futuristic": "cyberpunk aesthetic, futuristic, neon-lit, sci-fi",
-            "Cinematic Movie Frame": "cinematic movie still, film grain, widescreen cinematic composition",
-            "Oil Painting": "oil painting style, artistic brush strokes, classical painting aesthetic"
-        }
-
-        # 색감 설명 매핑
-        color_descriptions = {
-            "Vibrant & Colorful": "vibrant colors, saturated, colorful",
-            "Monochrome/B&W": "black and white, monochrome, grayscale",
-            "Pastel/Soft": "pastel colors, soft tones, gentle hues",
-            "Warm Earthy Tones": "warm earthy tones, brown, orange, autumn colors",
-            "Cool Blue/Teal": "cool blue tones, teal, cyan color palette",
-            "High Contrast/Bold": "high contrast, bold colors, dramatic color contrast",
-            "Muted/Desaturated": "muted colors, desaturated, subdued palette",
-            "Vintage/Sepia": "vintage sepia tone, retro color grading, nostalgic warm tint"
-        }
-
-        # 템포 설명 매핑
-        tempo_descriptions = {
-            "Slow": "slow, gentle movement, peaceful pace",
-            "Moderate": "moderate tempo, balanced rhythm",
-            "Fast": "fast paced, dynamic movement, energetic",
-            "Intense": "intense, powerful, dramatic action"
-        }
-
-        # 음악 무드 설명 매핑
-        music_mood_descriptions = {
-            "Euphoric/Uplifting": "euphoric, uplifting, joyful atmosphere",
-            "Melancholic/Emotional": "melancholic, emotional, touching, bittersweet",
-            "Dreamy/Ethereal": "dreamy, ethereal, floating, surreal",
-            "Dark/Intense": "dark, intense, dramatic, powerful",
-            "Calm/Peaceful": "calm, peaceful, serene, tranquil",
-            "Romantic/Sentimental": "romantic, sentimental, warm, intimate",
-            "Mysterious/Enigmatic": "mysterious, enigmatic, intriguing, atmospheric"
-        }
-
-        style_keyword = style_descriptions.get(style, style)
-        color_keyword = color_descriptions.get(color, color)
-        tempo_keyword = tempo_descriptions.get(tempo, tempo)
-        mood_keyword = music_mood_descriptions.get(music_mood, music_mood)
-
-        prompt = f"""You are an expert image prompt engineer for AI image generation.
-Create a detailed image generation prompt for a music video visual based on the following lyrics and music information.
-
-【Lyrics Line】
-{lyric_line}
-
-【Music Information】
-- Song Title: {song_title if song_title else 'Not specified'}
-- Genre: {genre}
-- Tempo: {tempo_keyword}
-- Mood: {mood_keyword}
-- Visual Concept/Theme: {visual_concept if visual_concept else 'Create appropriate visuals based on the lyrics'}
-
-【Visual Style Requirements】
-- Visual Style: {style_keyword}
-- Atmosphere: {visual_mood}
-- Color Palette: {color_keyword}
-- Lighting: {lighting}
-- Camera: {camera}
-
-【Output Requirements】
-1. Write the prompt entirely in English
-2. Create a vivid visual scene that represents the emotion and meaning of the lyrics
-3. Incorporate the music's mood, tempo, and genre into the visual atmosphere
-4. If visual concept is provided, integrate it with the lyrics meaning
-5. Include specific details about composition, colors, lighting, and atmosphere
-6. Keep the prompt concise but comprehensive (2-4 sentences)
-7. Do NOT include any explanations, just output the image prompt directly
-
-【Output Format】
-Return ONLY the image generation prompt, nothing else. No quotes, no labels, just the prompt text."""
-
-        try:
-            response = self.gemini_image_generator.text_model.generate_content(prompt)
-            return response.text.strip()
-        except Exception as e:
-            # 기본 프롬프트 반환
-            return f"{style_keyword}, {lyric_line}, {mood_keyword}, {color_keyword}, {lighting} lighting, {camera} shot"
-
     def display_music_image_results(self, results):
         """음악 이미지 생성 결과 표시"""
+        self.music_cuts_data = results
+
+        # 목록 위젯이 있으면 재사용 (보이는 카드만 새 결과로 다시 채움)
+        if results and self.music_results_list and self.music_results_list.winfo_exists():
+            self.music_results_list.set_items(results)
+            return
+
         # 기존 내용 삭제
         for widget in self.music_results_container.winfo_children():
             widget.destroy()
-
-        self.music_cuts_data = results
+        self.music_results_list = None
 
         if not results:
             ttk.Label(self.music_results_container,
@@ -1984,111 +2420,19 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
                      bootstyle="warning").pack(pady=50)
             return
 
-        # 각 컷별 결과 표시
-        for i, cut in enumerate(results):
-            self.create_music_cut_result_card(self.music_results_container, cut, i)
-
-    def create_music_cut_result_card(self, parent, cut, index):
-        """개별 음악 컷 결과 카드 생성"""
-        # 카드 프레임
-        card = ttk.LabelFrame(parent,
-                             text=f"CUT {cut['cut_number']}",
-                             padding="10",
-                             bootstyle="info")
-        card.pack(fill=X, pady=(0, 15))
-
-        # 3분할 레이아웃: 가사 | 프롬프트 | 이미지
-        content_frame = ttk.Frame(card)
-        content_frame.pack(fill=X)
-        content_frame.columnconfigure(0, weight=1)
-        content_frame.columnconfigure(1, weight=1)
-        content_frame.columnconfigure(2, weight=0)
-
-        # 왼쪽: 가사 정보
-        lyrics_frame = ttk.Frame(content_frame)
-        lyrics_frame.grid(row=0, column=0, sticky=(N, S, W, E), padx=(0, 10))
-
-        ttk.Label(lyrics_frame,
-                 text="🎵 가사",
-                 font=('Helvetica', 10, 'bold'),
-                 bootstyle="primary").pack(anchor=W)
-
-        lyrics_text = scrolledtext.ScrolledText(lyrics_frame,
-                                                font=('Helvetica', 10),
-                                                wrap=tk.WORD,
-                                                height=12,
-                                                width=35)
-        lyrics_text.pack(fill=X, pady=(5, 0))
-        lyrics_text.insert("1.0", cut['lyrics'])
-        lyrics_text.config(state=tk.DISABLED)
-        lyrics_text.configure(spacing1=3, spacing2=3, spacing3=3)
-
-        # 중앙: 프롬프트 (편집 가능)
-        prompt_frame = ttk.Frame(content_frame)
-        prompt_frame.grid(row=0, column=1, sticky=(N, S, W, E), padx=(0, 10))
-
-        ttk.Label(prompt_frame,
-                 text="🎨 이미지 프롬프트 (편집 가능)",
-                 font=('Helvetica', 10, 'bold'),
-                 bootstyle="success").pack(anchor=W)
-
-        prompt_text = scrolledtext.ScrolledText(prompt_frame,
-                                                font=('Helvetica', 10),
-                                                wrap=tk.WORD,
-                                                height=12,
-                                                width=40)
-        prompt_text.pack(fill=X, pady=(5, 5))
-        prompt_text.configure(spacing1=3, spacing2=3, spacing3=3)
-        prompt_text.insert("1.0", cut.get('image_prompt', '프롬프트 생성 실패'))
-
-        # 재생성 버튼
-        regen_btn = ttk.Button(prompt_frame,
-                              text="🔄 이미지 재생성",
-                              command=lambda idx=index, pt=prompt_text: self.regenerate_single_music_image(idx, pt),
-                              bootstyle="warning-outline",
-                              width=18)
-        regen_btn.pack(anchor=W)
-
-        # 오른쪽: 이미지
-        image_frame = ttk.Frame(content_frame)
-        image_frame.grid(row=0, column=2, sticky=(N, S, W, E))
-
-        ttk.Label(image_frame,
-                 text="🖼️ 생성 이미지",
-                 font=('Helvetica', 10, 'bold'),
-                 bootstyle="info").pack(anchor=W)
-
-        # 이미지 표시 영역
-        image_display = ttk.Label(image_frame, text="")
-        image_display.pack(pady=(5, 5))
-
-        if cut.get('generated_image'):
-            # PIL Image를 PhotoImage로 변환
-            img = cut['generated_image']
-            # 썸네일 크기로 리사이즈
-            img_display = img.copy()
-            img_display.thumbnail((256, 256), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img_display)
-            image_display.config(image=photo)
-            image_display.image = photo  # 참조 유지
-
-            # 이미지 인덱스 저장 (저장시 사용)
-            image_display.cut_index = index
-        elif cut.get('image_error'):
-            image_display.config(text=f"❌ {cut['image_error'][:50]}...",
-                               font=('Helvetica', 9),
-                               bootstyle="danger")
-        else:
-            image_display.config(text="이미지 없음",
-                               font=('Helvetica', 10),
-                               bootstyle="secondary")
-
-        # 개별 저장 버튼
-        ttk.Button(image_frame,
-                  text="💾 저장",
-                  command=lambda idx=index: self.save_single_music_image(idx),
-                  bootstyle="success-outline",
-                  width=10).pack(anchor=W)
+        # 각 컷별 결과 표시 (보이는 카드만 만들고 스크롤 시 재사용)
+        self.music_results_list = VirtualList(
+            self.music_results_container,
+            create_row=lambda parent: self.create_cut_row(
+                parent, "🎵 가사", self.regenerate_single_music_image, self.save_single_music_image),
+            bind_row=lambda row, cut, index: self.bind_cut_row(
+                row, cut, index,
+                title=f"CUT {cut['cut_number']}",
+                source_text=cut['lyrics']),
+            viewport=self.music_results_viewport
+        )
+        self.music_results_list.pack(fill=BOTH, expand=YES)
+        self.music_results_list.set_items(results)
 
     def regenerate_single_music_image(self, cut_index, prompt_text_widget):
         """단일 음악 컷 이미지 재생성"""
@@ -2098,30 +2442,36 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
             messagebox.showwarning("경고", "프롬프트를 입력해주세요.")
             return
 
-        self.music_progress_var.set(f"컷 {cut_index + 1} 이미지 재생성 중...")
+        self.post_progress(self.music_progress_var, f"컷 {cut_index + 1} 이미지 재생성 중...")
+        model = self.music_image_model_var.get()
+        aspect_ratio = self.music_aspect_ratio_var.get()
+        results = self.music_cuts_data
 
         def run_regeneration():
             try:
-                cut = self.music_cuts_data[cut_index]
+                cut = results[cut_index]
 
                 image, error = self.gemini_image_generator.generate_single_image(
                     prompt=new_prompt,
-                    model=self.music_image_model_var.get(),
-                    aspect_ratio=self.music_aspect_ratio_var.get()
+                    model=model,
+                    aspect_ratio=aspect_ratio,
+                    use_cache=False
                 )
 
-                cut['image_prompt'] = new_prompt
-                cut['generated_image'] = image
-                cut['image_error'] = error
-                self.music_cuts_data[cut_index] = cut
+                # 카드가 보고 있는 컷은 그대로 두고 새 컷으로 교체
+                updated_cut = cut.copy()
+                updated_cut['image_prompt'] = new_prompt
+                updated_cut['generated_image'] = image
+                updated_cut['image_error'] = error
+                results[cut_index] = updated_cut
 
-                # UI 업데이트
-                self.root.after(0, lambda: self.display_music_image_results(self.music_cuts_data))
+                # UI 업데이트 (바뀐 컷의 카드만 갱신)
+                self.ui.post(lambda: self.refresh_cut_row(self.music_results_list, results, cut_index))
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("오류", f"재생성 실패:\n{str(e)}"))
+                self.ui.post(messagebox.showerror, "오류", f"재생성 실패:\n{str(e)}")
             finally:
-                self.root.after(0, lambda: self.music_progress_var.set(""))
+                self.post_progress(self.music_progress_var, "")
 
         threading.Thread(target=run_regeneration, daemon=True).start()
 
@@ -2153,35 +2503,7 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
 
     def save_all_music_images(self):
         """모든 음악 이미지 일괄 저장"""
-        from tkinter import filedialog
-
-        if not self.music_cuts_data:
-            messagebox.showwarning("경고", "저장할 이미지가 없습니다.")
-            return
-
-        # 저장할 이미지가 있는지 확인
-        images_to_save = [cut for cut in self.music_cuts_data if cut.get('generated_image')]
-
-        if not images_to_save:
-            messagebox.showwarning("경고", "저장할 이미지가 없습니다.")
-            return
-
-        # 폴더 선택
-        folder_path = filedialog.askdirectory(title="이미지 저장 폴더 선택")
-
-        if folder_path:
-            try:
-                import os
-                saved_count = 0
-
-                for cut in images_to_save:
-                    file_path = os.path.join(folder_path, f"music_cut_{cut['cut_number']:02d}.png")
-                    cut['generated_image'].save(file_path)
-                    saved_count += 1
-
-                messagebox.showinfo("완료", f"{saved_count}개 이미지가 저장되었습니다:\n{folder_path}")
-            except Exception as e:
-                messagebox.showerror("오류", f"저장 실패:\n{str(e)}")
+        self.export_cut_images(self.music_cuts_data, "music_cut", self.music_progress_var, self.music_export_stop_btn)
 
     def clear_music_image_generation(self):
         """음악 이미지 생성 초기화"""
@@ -2209,6 +2531,7 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
 
         # 데이터 초기화
         self.music_cuts_data = []
+        self.music_results_list = None
         self.music_progress_var.set("")
 
     def generate_script(self, topic, duration, tone, audience, additional, result_text):
@@ -2217,13 +2540,16 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
             messagebox.showwarning("경고", "영상 주제를 입력해주세요.")
             return
         
-        def run_generation():
-            # 결과 텍스트 초기화
+        def set_result(text):
             result_text.config(state=tk.NORMAL)
             result_text.delete("1.0", tk.END)
-            result_text.insert("1.0", "🔄 대본 생성 중...\n\n잠시만 기다려주세요...")
+            result_text.insert("1.0", text)
             result_text.config(state=tk.DISABLED)
-            
+
+        # 결과 텍스트 초기화
+        set_result("🔄 대본 생성 중...\n\n잠시만 기다려주세요...")
+
+        def run_generation():
             try:
                 # 대본 생성
                 script = self.gemini_generator.generate_script(
@@ -2235,21 +2561,15 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
                 )
                 
                 # 결과 표시
-                result_text.config(state=tk.NORMAL)
-                result_text.delete("1.0", tk.END)
                 if script:
-                    result_text.insert("1.0", script)
+                    self.ui.post(set_result, script)
                 else:
-                    result_text.insert("1.0", "❌ 대본 생성에 실패했습니다.\n다시 시도해주세요.")
-                result_text.config(state=tk.DISABLED)
+                    self.ui.post(set_result, "❌ 대본 생성에 실패했습니다.\n다시 시도해주세요.")
                 
             except Exception as e:
-                result_text.config(state=tk.NORMAL)
-                result_text.delete("1.0", tk.END)
-                result_text.insert("1.0", f"❌ 오류 발생:\n\n{str(e)}\n\n"
+                self.ui.post(set_result, f"❌ 오류 발생:\n\n{str(e)}\n\n"
                                          f"API 요청 한도를 초과했을 수 있습니다.\n"
                                          f"잠시 후 다시 시도해주세요.")
-                result_text.config(state=tk.DISABLED)
         
         # 백그라운드에서 실행
         threading.Thread(target=run_generation, daemon=True).start()
@@ -2344,7 +2664,10 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
             if new_key:
                 # 새 API 키로 analyzer 재초기화
                 try:
-                    self.analyzer = YouTubeTrendAnalyzer(new_key)
+                    self.analyzer = YouTubeTrendAnalyzer(
+                        new_key,
+                        cache_ttls=self.config_manager.get_setting('youtube_cache_ttls', None)
+                    )
                     self.api_key = new_key
                     self.config_manager.save_api_key(new_key)
                     messagebox.showinfo("성공", "API 키가 성공적으로 변경되었습니다.")
@@ -2439,15 +2762,34 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
         def change_gemini_key():
             """Gemini API 키 변경"""
             new_key = self.show_gemini_api_key_dialog()
-            if new_key:
+            if not new_key:
+                return
+
+            from gemini_client_pool import GeminiClientPool, set_gemini_client_pool
+
+            def apply_key(pool):
+                # 검증된 키로만 공유 풀과 생성기를 교체 (진행 중인 작업은 이전 풀을 계속 사용, 이미지 생성기는 다음 사용 시 생성)
+                set_gemini_client_pool(pool)
+                self.gemini_key = new_key
+                self.reset_gemini_clients()
+                self.config_manager.save_gemini_api_key(new_key)
+                messagebox.showinfo("성공", "Gemini API 키가 성공적으로 변경되었습니다.")
+                self.show_settings()  # 화면 새로고침
+
+            def run_validation():
+                # API 호출로 키를 확인하므로 백그라운드에서 실행하고 결과만 UI 스레드로 전달
+                pool = None
                 try:
-                    # 새 Gemini API 키로 generator 재초기화
-                    self.gemini_generator = GeminiScriptGenerator(new_key)
-                    self.config_manager.save_gemini_api_key(new_key)
-                    messagebox.showinfo("성공", "Gemini API 키가 성공적으로 변경되었습니다.")
-                    self.show_settings()  # 화면 새로고침
+                    pool = GeminiClientPool(new_key)
+                    pool.validate()
                 except Exception as e:
-                    messagebox.showerror("오류", f"올바르지 않은 Gemini API 키입니다.\n{str(e)}")
+                    if pool is not None:
+                        pool.close()
+                    self.ui.post(messagebox.showerror, "오류", f"올바르지 않은 Gemini API 키입니다.\n\n{e}")
+                    return
+                self.ui.post(apply_key, pool)
+
+            threading.Thread(target=run_validation, daemon=True).start()
         
         def test_gemini_key():
             """Gemini API 키 테스트"""
@@ -2455,16 +2797,23 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
                 messagebox.showwarning("경고", "Gemini API 키가 설정되지 않았습니다.")
                 return
             
-            try:
-                # 간단한 생성 테스트
-                response = self.gemini_generator.model.generate_content("Hello")
-                if response:
-                    messagebox.showinfo("성공", "✅ Gemini API 키가 정상적으로 작동합니다!")
-                else:
-                    messagebox.showwarning("경고", "응답을 받지 못했습니다.")
-            except Exception as e:
-                error_msg = str(e)
-                messagebox.showerror("오류", f"❌ Gemini API 키 테스트 실패\n\n{error_msg}")
+            generator = self.gemini_generator
+
+            def run_test():
+                # 속도 제한 대기가 길어질 수 있으므로 백그라운드에서 요청하고 결과만 UI 스레드로 전달
+                try:
+                    # 간단한 생성 테스트
+                    get_rate_limiter().acquire(generator.model_name, estimate_tokens("Hello"))
+                    response = generator.model.generate_content("Hello")
+                    if response:
+                        self.ui.post(messagebox.showinfo, "성공", "✅ Gemini API 키가 정상적으로 작동합니다!")
+                    else:
+                        self.ui.post(messagebox.showwarning, "경고", "응답을 받지 못했습니다.")
+                except Exception as e:
+                    error_msg = str(e)
+                    self.ui.post(messagebox.showerror, "오류", f"❌ Gemini API 키 테스트 실패\n\n{error_msg}")
+
+            threading.Thread(target=run_test, daemon=True).start()
         
         def delete_gemini_key():
             """Gemini API 키 삭제"""
@@ -2472,7 +2821,8 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
                                   "저장된 Gemini API 키를 삭제하시겠습니까?\n대본 생성 기능을 사용할 수 없습니다.",
                                   parent=container):
                 self.config_manager.clear_gemini_api_key()
-                self.gemini_generator = None
+                self.gemini_key = None
+                self.reset_gemini_clients()
                 messagebox.showinfo("완료", "Gemini API 키가 삭제되었습니다.")
                 self.show_settings()  # 화면 새로고침
         
@@ -2596,7 +2946,7 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
         ttk.Label(filter_frame, text="국가", font=('Helvetica', 10, 'bold')).pack(anchor=W, pady=(5, 5))
         
         self.country_var = tk.StringVar(value="한국")
-        countries = ["한국", "미국", "일본", "중국", "스페인", "인도", "유럽", "동남아"]
+        countries = ["한국", "미국", "일본", "중국", "스페인", "인도", "유럽", "동남아", ALL_REGIONS]
         ttk.Combobox(filter_frame,
                     textvariable=self.country_var,
                     values=countries,
@@ -2703,8 +3053,8 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
         right_panel.columnconfigure(0, weight=1)
         right_panel.rowconfigure(0, weight=1)
         
-        # 결과 프레임
-        self.result_frame = ScrolledFrame(right_panel, autohide=True)
+        # 결과 프레임 (결과 목록은 VirtualList가 자체 스크롤)
+        self.result_frame = ttk.Frame(right_panel)
         self.result_frame.pack(fill=BOTH, expand=YES)
         
         # 초기 메시지
@@ -2727,24 +3077,34 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
         else:
             self.search_filters.pack_forget()
 
-    def load_thumbnail(self, url):
-        """썸네일 로드"""
-        if url not in self.image_cache:
-            try:
-                response = requests.get(url, timeout=5)
-                img_data = response.content
-                img = Image.open(io.BytesIO(img_data))
-                img = img.resize((180, 135), Image.Resampling.LANCZOS)
-                self.image_cache[url] = ImageTk.PhotoImage(img)
-            except Exception:
-                self.image_cache[url] = None
-        return self.image_cache[url]
-
-    def create_video_card(self, parent, video, index):
-        """비디오 카드 생성"""
-        card_container = ttk.Frame(parent, bootstyle="light")
-        card_container.grid(row=index, column=0, sticky=(W, E), pady=6, padx=8)
-        parent.columnconfigure(0, weight=1)
+    def load_thumbnail(self, label, url):
+        """썸네일 로드 (자리 표시 이미지를 먼저 보여주고 도착하면 교체)"""
+        if self.thumbnail_placeholder is None:
+            self.thumbnail_placeholder = ImageTk.PhotoImage(
+                Image.new('RGB', self.thumbnail_loader.size, '#e9ecef'))
+        label.config(image=self.thumbnail_placeholder)
+        label.image = self.thumbnail_placeholder
+
+        def show(image):
+            if image is None or not label.winfo_exists():
+                return
+            photo = ImageTk.PhotoImage(image)
+            label.config(image=photo)
+            label.image = photo
+
+        self.thumbnail_loader.load(url, show)
+
+    def create_video_row(self, parent):
+        """비디오 카드 위젯 생성 (내용은 bind_video_row에서 채움)"""
+        row = ttk.Frame(parent)
+        row.video = None
+        
+        def open_video(event=None):
+            if row.video:
+                webbrowser.open(row.video['url'])
+        
+        card_container = ttk.Frame(row, bootstyle="light")
+        card_container.pack(fill=BOTH, expand=YES, pady=6, padx=8)
         
         card = ttk.Frame(card_container, style='Card.TFrame', relief='raised', borderwidth=1)
         card.pack(fill=BOTH, expand=YES, padx=2, pady=2)
@@ -2754,12 +3114,9 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
         thumbnail_frame = ttk.Frame(card)
         thumbnail_frame.grid(row=0, column=0, rowspan=4, padx=10, pady=10, sticky=N)
         
-        photo = self.load_thumbnail(video['thumbnail'])
-        if photo:
-            thumbnail_label = ttk.Label(thumbnail_frame, image=photo, cursor="hand2")
-            thumbnail_label.image = photo
-            thumbnail_label.pack()
-            thumbnail_label.bind("<Button-1>", lambda e: webbrowser.open(video['url']))
+        row.thumbnail_label = ttk.Label(thumbnail_frame, cursor="hand2")
+        row.thumbnail_label.pack()
+        row.thumbnail_label.bind("<Button-1>", open_video)
         
         # 콘텐츠
         content_frame = ttk.Frame(card)
@@ -2767,36 +3124,33 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
         content_frame.columnconfigure(0, weight=1)
         
         # 제목
-        title_label = ttk.Label(content_frame,
-                               text=video['title'],
-                               wraplength=600,
-                               font=('Helvetica', 12, 'bold'),
-                               cursor="hand2")
-        title_label.grid(row=0, column=0, sticky=W, pady=(0, 6))
-        title_label.bind("<Button-1>", lambda e: webbrowser.open(video['url']))
+        row.title_label = ttk.Label(content_frame,
+                                    wraplength=600,
+                                    font=('Helvetica', 12, 'bold'),
+                                    cursor="hand2")
+        row.title_label.grid(row=0, column=0, sticky=W, pady=(0, 6))
+        row.title_label.bind("<Button-1>", open_video)
         
         # 채널
-        ttk.Label(content_frame,
-                 text=f"📺 {video['channel']}",
-                 font=('Helvetica', 10),
-                 bootstyle="info").grid(row=1, column=0, sticky=W, pady=(0, 6))
+        row.channel_label = ttk.Label(content_frame,
+                                      font=('Helvetica', 10),
+                                      bootstyle="info")
+        row.channel_label.grid(row=1, column=0, sticky=W, pady=(0, 6))
         
         # 통계
         stats_frame = ttk.Frame(content_frame)
         stats_frame.grid(row=2, column=0, sticky=W, pady=(0, 4))
         
-        stats_text = f"👁 {video['view_count']:,}회  •  👍 {video['like_count']:,}  •  💬 {video['comment_count']:,}"
-        ttk.Label(stats_frame,
-                 text=stats_text,
-                 font=('Helvetica', 9),
-                 foreground='#666666').pack(side=LEFT)
+        row.stats_label = ttk.Label(stats_frame,
+                                    font=('Helvetica', 9),
+                                    foreground='#666666')
+        row.stats_label.pack(side=LEFT)
         
         # 메타
-        meta_text = f"⏱ {video['duration']}  •  📅 {video['published_at'][:10]}"
-        ttk.Label(content_frame,
-                 text=meta_text,
-                 font=('Helvetica', 9),
-                 foreground='#888888').grid(row=3, column=0, sticky=W)
+        row.meta_label = ttk.Label(content_frame,
+                                   font=('Helvetica', 9),
+                                   foreground='#888888')
+        row.meta_label.grid(row=3, column=0, sticky=W)
         
         # 버튼
         button_frame = ttk.Frame(card)
@@ -2804,98 +3158,198 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
         
         ttk.Button(button_frame,
                   text="▶️ 재생",
-                  command=lambda: webbrowser.open(video['url']),
+                  command=open_video,
                   bootstyle="danger",
                   width=10).pack()
+        
+        return row
+
+    def bind_video_row(self, row, video, index):
+        """비디오 카드에 영상 정보 표시"""
+        row.video = video
+        
+        self.load_thumbnail(row.thumbnail_label, video['thumbnail'])
+        row.title_label.config(text=video['title'])
+        
+        # 채널
+        channel_text = f"📺 {video['channel']}"
+        if video.get('channel_subscribers'):
+            channel_text += f"  •  구독자 {video['channel_subscribers']:,}명"
+        if video.get('outlier_score'):
+            channel_text += f"  •  채널 평균 대비 {video['outlier_score']:.1f}배"
+        row.channel_label.config(text=channel_text)
+        
+        # 통계
+        stats_text = f"👁 {video['view_count']:,}회  •  👍 {video['like_count']:,}  •  💬 {video['comment_count']:,}"
+        if video.get('views_per_hour') is not None:
+            stats_text += f"  •  🚀 시간당 {video['views_per_hour']:,.0f}회"
+        row.stats_label.config(text=stats_text)
+        
+        # 메타
+        meta_text = f"⏱ {video['duration']}  •  📅 {video['published_at'][:10]}"
+        if video.get('ranks'):
+            ranks = sorted(video['ranks'].items(), key=lambda item: item[1])
+            meta_text += "  •  🏆 " + ", ".join(f"{country} {rank}위" for country, rank in ranks)
+        row.meta_label.config(text=meta_text)
 
     def search(self):
         """검색 실행"""
+        # 기존 결과 삭제
+        for widget in self.result_frame.winfo_children():
+            widget.destroy()
+        
+        # 로딩
+        loading = ttk.Label(self.result_frame,
+                          text="검색 중...",
+                          font=('Helvetica', 14),
+                          bootstyle="info")
+        loading.pack(pady=50)
+        
+        # 검색 조건 (위젯 변수는 UI 스레드에서만 읽음)
+        mode = self.mode_var.get()
+        country = self.country_var.get()
+        order = self.order_var.get()
+        keywords = self.keywords_var.get().strip().split() if self.keywords_var.get().strip() else None
+        max_results = int(self.max_results_var.get()) if self.max_results_var.get().isdigit() else 25
+        min_views = int(self.min_views_var.get()) if self.min_views_var.get().isdigit() else 0
+        search_params = dict(
+            category=self.category_var.get(),
+            keywords=keywords,
+            order=order,
+            max_results=max_results,
+            duration=self.duration_var.get() or None,
+            period=self.period_var.get() or None,
+            country=country,
+            license_type=self.license_var.get(),
+            min_views=min_views
+        )
+        
         def run_search():
-            # 기존 결과 삭제
-            for widget in self.result_frame.winfo_children():
-                widget.destroy()
-            
-            # 로딩
-            loading = ttk.Label(self.result_frame,
-                              text="검색 중...",
-                              font=('Helvetica', 14),
-                              bootstyle="info")
-            loading.pack(pady=50)
-            self.root.update()
-            
             try:
-                if self.mode_var.get() == "trending":
+                if mode == "trending" and country == ALL_REGIONS:
+                    # 모든 지역의 종합 인기 차트를 병렬로 조회해 합침
+                    results = self.analyzer.sweep_trending(
+                        categories=['전체'],
+                        max_results_per_chart=50
+                    )
+                    title = f"🔥 {ALL_REGIONS} 인기 급상승 동영상"
+                elif mode == "trending":
                     results = self.analyzer.get_trending_videos(
-                        country=self.country_var.get(),
-                        max_results=25
+                        country=country,
+                        max_results=50
                     )
-                    title = f"🔥 {self.country_var.get()} 인기 급상승 동영상"
+                    title = f"🔥 {country} 인기 급상승 동영상"
                 else:
-                    keywords = self.keywords_var.get().strip().split() if self.keywords_var.get().strip() else None
-                    max_results = int(self.max_results_var.get()) if self.max_results_var.get().isdigit() else 25
-                    min_views = int(self.min_views_var.get()) if self.min_views_var.get().isdigit() else 0
-                    
-                    results = self.analyzer.search_videos(
-                        category=self.category_var.get(),
-                        keywords=keywords,
-                        order=self.order_var.get(),
-                        max_results=max_results,
-                        duration=self.duration_var.get() or None,
-                        period=self.period_var.get() or None,
-                        country=self.country_var.get(),
-                        license_type=self.license_var.get(),
-                        min_views=min_views
-                    )
+                    # 페이지 단위로 도착하는 결과 수를 표시하며 수집
+                    results = []
+                    for video in self.analyzer.iter_search_videos(**search_params):
+                        results.append(video)
+                        if len(results) % 50 == 0:
+                            self.ui.post(lambda count=len(results): loading.config(text=f"검색 중... ({count}개)"),
+                                         key=('search', 'loading'))
+                    self.analyzer.sort_videos(results, order)
                     
                     keyword_text = ', '.join(keywords) if keywords else '전체'
                     title = f"🔍 검색 결과: {keyword_text}"
                 
-                loading.destroy()
-                
-                # 헤더
-                header_frame = ttk.Frame(self.result_frame)
-                header_frame.grid(row=0, column=0, sticky=(W, E), pady=(5, 10), padx=8)
-                
-                ttk.Label(header_frame,
-                         text=title,
-                         font=('Helvetica', 16, 'bold'),
-                         bootstyle="primary").pack(side=LEFT)
+                # 채널 통계 (고유 채널만 50개씩 묶어 조회)
+                if results:
+                    try:
+                        self.analyzer.enrich_channel_stats(results)
+                    except Exception as e:
+                        print(f"채널 통계 조회 실패: {e}")
                 
-                ttk.Label(header_frame,
-                         text=f"총 {len(results)}개",
-                         font=('Helvetica', 12),
-                         bootstyle="secondary").pack(side=LEFT, padx=(10, 0))
+                # 통계 변경분 기록 후 이전 기록 대비 조회수 증가 속도 표시
+                # (차트 순위는 단일 지역 인기 차트만 기록, 검색 순서는 순위가 아님)
+                if self.trend_store and results:
+                    chart_region = country if mode == "trending" and country != ALL_REGIONS else None
+                    self.trend_store.record_videos(results, region=chart_region)
+                    velocities = {
+                        row['video_id']: row['views_per_hour']
+                        for row in self.trend_store.get_view_velocity(
+                            video_ids=[video['video_id'] for video in results],
+                            limit=None
+                        )
+                    }
+                    for video in results:
+                        if video['video_id'] in velocities:
+                            video['views_per_hour'] = velocities[video['video_id']]
                 
-                # 결과
-                if results:
-                    for i, video in enumerate(results, 1):
-                        self.create_video_card(self.result_frame, video, i)
-                else:
-                    no_result = ttk.Frame(self.result_frame)
-                    no_result.grid(row=1, column=0, pady=50)
-                                        
-                    ttk.Label(no_result,
-                             text="검색 결과가 없습니다",
-                             font=('Helvetica', 14)).pack(pady=10)
+                # 오늘 할당량 사용량 (캐시로 절약한 양 포함)
+                usage = self.analyzer.get_quota_usage()
+                self.ui.post(self.show_search_results, loading, title, results, usage)
                     
             except Exception as e:
-                loading.destroy()
-                error_frame = ttk.Frame(self.result_frame)
-                error_frame.pack(pady=50)
-                
-                ttk.Label(error_frame,
-                         text="⚠️",
-                         font=('Helvetica', 48)).pack()
-                
-                ttk.Label(error_frame,
-                         text=f"오류 발생: {str(e)}",
-                         font=('Helvetica', 12),
-                         bootstyle="danger").pack(pady=10)
+                self.ui.post(self.show_search_error, loading, str(e))
         
         threading.Thread(target=run_search, daemon=True).start()
 
+    def show_search_results(self, loading, title, results, usage):
+        """
+        검색 결과 표시 (UI 스레드에서 호출)
+
+        Args:
+            loading: 검색 중 표시 라벨
+            title: 결과 제목
+            results: 영상 정보 리스트
+            usage: 오늘 할당량 사용량
+        """
+        loading.destroy()
+        
+        # 헤더
+        header_frame = ttk.Frame(self.result_frame)
+        header_frame.pack(fill=X, pady=(5, 10), padx=8)
+        
+        ttk.Label(header_frame,
+                 text=title,
+                 font=('Helvetica', 16, 'bold'),
+                 bootstyle="primary").pack(side=LEFT)
+        
+        ttk.Label(header_frame,
+                 text=f"총 {len(results)}개",
+                 font=('Helvetica', 12),
+                 bootstyle="secondary").pack(side=LEFT, padx=(10, 0))
+        
+        ttk.Label(header_frame,
+                 text=f"오늘 할당량 {usage['spent']:,} units 사용 · {usage['saved']:,} units 절약",
+                 font=('Helvetica', 10),
+                 bootstyle="secondary").pack(side=RIGHT)
+        
+        # 결과 (보이는 카드만 만들고 스크롤 시 재사용)
+        if results:
+            video_list = VirtualList(self.result_frame,
+                                     create_row=self.create_video_row,
+                                     bind_row=self.bind_video_row)
+            video_list.pack(fill=BOTH, expand=YES)
+            video_list.set_items(results)
+        else:
+            no_result = ttk.Frame(self.result_frame)
+            no_result.pack(pady=50)
+                                
+            ttk.Label(no_result,
+                     text="검색 결과가 없습니다",
+                     font=('Helvetica', 14)).pack(pady=10)
+
+    def show_search_error(self, loading, message):
+        """검색 오류 표시 (UI 스레드에서 호출)"""
+        loading.destroy()
+        error_frame = ttk.Frame(self.result_frame)
+        error_frame.pack(pady=50)
+        
+        ttk.Label(error_frame,
+                 text="⚠️",
+                 font=('Helvetica', 48)).pack()
+        
+        ttk.Label(error_frame,
+                 text=f"오류 발생: {message}",
+                 font=('Helvetica', 12),
+                 bootstyle="danger").pack(pady=10)
 
 if __name__ == "__main__":
+    # 이미지 내보내기 프로세스 풀이 PyInstaller 실행 파일에서도 동작하도록
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     root = tbs.Window(themename="cosmo")
     app = YouTubeMakerApp(root)
     root.mainloop()
\ No newline at end of file
@@ -2,11 +2,15 @@
 """
 API 키 및 설정 관리 모듈
 YouTube API 키와 Gemini API 키를 별도로 관리
+설정은 메모리에 보관하고 파일 수정 시각이 바뀌었을 때만 다시 읽으며, 저장은 임시 파일 교체로 원자적으로 처리
 """
 
 import os
+import copy
 import json
 import base64
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
 
@@ -19,6 +23,11 @@ class ConfigManager:
         
         # 설정 디렉토리가 없으면 생성
         self.config_dir.mkdir(exist_ok=True)
+
+        # 메모리 캐시 (파일의 수정 시각/크기가 같으면 다시 읽지 않음)
+        self._lock = threading.RLock()
+        self._cache = None
+        self._cache_stamp = None
         
     def _encode_key(self, key: str) -> str:
         """API 키를 간단히 인코딩 (보안 강화)"""
@@ -48,12 +57,8 @@ class ConfigManager:
             bool: 저장 성공 여부
         """
         try:
-            config = self.load_config()
-            config['youtube_api_key'] = self._encode_key(api_key)
-            
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            
+            with self.transaction() as config:
+                config['youtube_api_key'] = self._encode_key(api_key)
             return True
         except Exception as e:
             print(f"YouTube API 키 저장 실패: {e}")
@@ -67,8 +72,8 @@ class ConfigManager:
             str: YouTube API 키 (없으면 빈 문자열)
         """
         try:
-            config = self.load_config()
-            encoded_key = config.get('youtube_api_key', '')
+            with self._lock:
+                encoded_key = self._read().get('youtube_api_key', '')
             return self._decode_key(encoded_key)
         except Exception:
             return ""
@@ -105,12 +110,8 @@ class ConfigManager:
             bool: 저장 성공 여부
         """
         try:
-            config = self.load_config()
-            config['gemini_api_key'] = self._encode_key(api_key)
-            
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            
+            with self.transaction() as config:
+                config['gemini_api_key'] = self._encode_key(api_key)
             return True
         except Exception as e:
             print(f"Gemini API 키 저장 실패: {e}")
@@ -124,8 +125,8 @@ class ConfigManager:
             str: Gemini API 키 (없으면 빈 문자열)
         """
         try:
-            config = self.load_config()
-            encoded_key = config.get('gemini_api_key', '')
+            with self._lock:
+                encoded_key = self._read().get('gemini_api_key', '')
             return self._decode_key(encoded_key)
         except Exception:
             return ""
@@ -177,21 +178,93 @@ class ConfigManager:
     
     # ========== 공통 메서드 ==========
     
-    def load_config(self) -> dict:
+    def _file_stamp(self):
+        """설정 파일 변경 감지용 (수정 시각, 크기), 파일이 없으면 None"""
+        try:
+            stat = self.config_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _read(self) -> dict:
         """
-        전체 설정 로드
+        캐시된 설정 반환 (파일이 바뀐 경우에만 다시 읽음, 호출 측에서 잠금)
         
         Returns:
-            dict: 설정 딕셔너리
+            dict: 캐시된 설정 딕셔너리 (수정하지 말 것)
         """
-        if not self.config_file.exists():
-            return {}
+        stamp = self._file_stamp()
+        if self._cache is not None and stamp == self._cache_stamp:
+            return self._cache
         
+        config = {}
+        if stamp is not None:
+            try:
+                with open(self.config_file, 'r') as f:
+                    config = json.load(f)
+            except Exception:
+                config = {}
+        
+        self._cache = config
+        self._cache_stamp = stamp
+        return config
+    
+    def _write(self, config: dict):
+        """
+        임시 파일에 쓴 뒤 교체해 원자적으로 저장 (호출 측에서 잠금)
+        
+        Raises:
+            OSError: 파일 저장 실패
+        """
+        tmp_path = self.config_dir / f".{self.config_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
-        except Exception:
-            return {}
+            with open(tmp_path, 'w') as f:
+                json.dump(config, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_file)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+        
+        self._cache = config
+        self._cache_stamp = self._file_stamp()
+    
+    @contextmanager
+    def transaction(self):
+        """
+        여러 설정을 한 번에 변경하고 한 번만 저장
+        
+        블록 안에서 받은 딕셔너리를 수정하면, 블록이 정상 종료될 때 변경이 있으면 저장
+        (예외가 발생하면 아무것도 저장하지 않음)
+        
+        예:
+            with config_manager.transaction() as config:
+                config['image_max_workers'] = 4
+                config['prompt_batch_size'] = 10
+        
+        Raises:
+            OSError: 파일 저장 실패
+        """
+        with self._lock:
+            current = self._read()
+            config = copy.deepcopy(current)
+            yield config
+            if config != current:
+                self._write(config)
+    
+    def load_config(self) -> dict:
+        """
+        전체 설정 로드
+        
+        Returns:
+            dict: 설정 딕셔너리 (복사본)
+        """
+        with self._lock:
+            return copy.deepcopy(self._read())
     
     def save_setting(self, key: str, value) -> bool:
         """
@@ -204,13 +277,21 @@ class ConfigManager:
         Returns:
             bool: 저장 성공 여부
         """
-        try:
-            config = self.load_config()
-            config[key] = value
-            
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+        return self.update_settings({key: value})
+    
+    def update_settings(self, values: dict) -> bool:
+        """
+        여러 설정을 한 번에 저장
+        
+        Args:
+            values: 설정 키와 값 딕셔너리
             
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            with self.transaction() as config:
+                config.update(values)
             return True
         except Exception as e:
             print(f"설정 저장 실패: {e}")
@@ -227,8 +308,11 @@ class ConfigManager:
         Returns:
             설정 값 (없으면 기본값)
         """
-        config = self.load_config()
-        return config.get(key, default)
+        with self._lock:
+            config = self._read()
+            if key not in config:
+                return default
+            return copy.deepcopy(config[key])
     
     def clear_all(self) -> bool:
         """
@@ -238,9 +322,12 @@ class ConfigManager:
             bool: 삭제 성공 여부
         """
         try:
-            if self.config_file.exists():
-                self.config_file.unlink()
+            with self._lock:
+                if self.config_file.exists():
+                    self.config_file.unlink()
+                self._cache = None
+                self._cache_stamp = None
             return True
         except Exception as e:
             print(f"설정 삭제 실패: {e}")
-            return False
\ No newline at end of file
+            return False
@@ -0,0 +1,205 @@
+# gemini_client_pool.py
+"""
+Gemini 클라이언트 공유 모듈
+현재 API 키로 google-genai 클라이언트(HTTP 연결 풀)와 google-generativeai 모델 객체를 한 번만 만들어
+대본/이미지/음악 이미지 생성기가 함께 사용 (탭을 오가거나 배치를 이어서 실행해도 연결 재사용)
+"""
+
+import threading
+from typing import Dict, Optional
+
+import httpx
+from google import genai
+from google.genai import types
+import google.generativeai as genai_legacy
+
+from rate_limiter import request_with_retry
+
+
+class GeminiClientPool:
+    def __init__(
+        self,
+        api_key: str,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 120.0
+    ):
+        """
+        Gemini 클라이언트 풀 초기화
+
+        Args:
+            api_key: Gemini API 키
+            max_connections: google-genai HTTP 클라이언트의 최대 동시 연결 수
+            max_keepalive_connections: 유휴 상태로 유지할 최대 연결 수
+            keepalive_expiry: 유휴 연결 유지 시간 (초)
+        """
+        if not api_key or len(api_key) < 10:
+            raise ValueError("유효한 Gemini API 키가 필요합니다.")
+
+        self.api_key = api_key
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+
+        self._lock = threading.Lock()
+        self._client = None
+        self._models: Dict[str, genai_legacy.GenerativeModel] = {}
+
+    def configure_legacy(self):
+        """
+        google-generativeai 전역 설정을 이 풀의 키로 적용
+
+        프로세스 전역 설정이라 다른 키의 풀이 만들어지면 덮어써지므로, 풀을 넘겨줄 때마다 다시 적용
+        """
+        genai_legacy.configure(api_key=self.api_key)
+
+    @property
+    def client(self) -> genai.Client:
+        """
+        이미지 생성용 google-genai 클라이언트 (처음 사용할 때 생성, 연결 풀 공유)
+        """
+        with self._lock:
+            if self._client is None:
+                self._client = genai.Client(
+                    api_key=self.api_key,
+                    http_options=types.HttpOptions(client_args={'limits': self.limits})
+                )
+            return self._client
+
+    def validate(self, model_name: str = 'gemini-2.5-flash'):
+        """
+        API 키가 실제로 사용 가능한지 확인 (모델 정보 조회, 토큰 소모 없음)
+
+        google-genai 클라이언트는 풀마다 키를 따로 가지므로 공유 풀을 교체하기 전에 호출해도 전역 설정에 영향 없음
+
+        Raises:
+            Exception: 키가 거부되었거나 API에 연결할 수 없음
+        """
+        self.client.models.get(model=model_name)
+
+    def text_model(self, model_name: str) -> genai_legacy.GenerativeModel:
+        """
+        텍스트 생성 모델 객체 반환 (모델 이름별로 한 번만 생성)
+
+        Args:
+            model_name: 모델 이름 (예: 'gemini-2.5-flash')
+        """
+        with self._lock:
+            model = self._models.get(model_name)
+            if model is None:
+                model = genai_legacy.GenerativeModel(model_name)
+                self._models[model_name] = model
+            return model
+
+    def generate_text(self, model_name: str, prompt: str, max_retries: int = 3) -> str:
+        """
+        텍스트 생성 (공유 속도 제한기를 거치고 실패 시 재시도)
+
+        Args:
+            model_name: 텍스트 모델 이름
+            prompt: 프롬프트
+            max_retries: 최대 시도 횟수
+
+        Returns:
+            str: 생성된 텍스트 (앞뒤 공백 제거)
+
+        Raises:
+            Exception: 재시도 후에도 실패
+        """
+        model = self.text_model(model_name)
+        return request_with_retry(
+            model_name, prompt,
+            lambda: model.generate_content(prompt).text.strip(),
+            max_retries
+        )
+
+    def generate_image(self, model: str, prompt: str, aspect_ratio: str, max_retries: int = 3) -> Optional[bytes]:
+        """
+        이미지 생성 (공유 속도 제한기를 거치고 실패 시 재시도)
+
+        Args:
+            model: 이미지 모델 이름
+            prompt: 이미지 생성 프롬프트
+            aspect_ratio: 이미지 비율 ("16:9" 또는 "9:16")
+            max_retries: 최대 시도 횟수
+
+        Returns:
+            bytes: 인코딩된 이미지 데이터 (응답에 이미지가 없으면 None)
+
+        Raises:
+            Exception: 재시도 후에도 실패
+        """
+        def request() -> Optional[bytes]:
+            response = self.client.models.generate_content(
+                model=model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_modalities=['TEXT', 'IMAGE'],
+                    image_config=types.ImageConfig(
+                        aspect_ratio=aspect_ratio,
+                    )
+                )
+            )
+
+            # 응답에서 이미지 추출
+            for part in response.candidates[0].content.parts:
+                if part.inline_data is not None:
+                    return part.inline_data.data
+            return None
+
+        return request_with_retry(model, prompt, request, max_retries, base_delay=3)
+
+    def close(self):
+        """HTTP 연결 정리"""
+        with self._lock:
+            if self._client is not None:
+                try:
+                    self._client.close()
+                except Exception as e:
+                    print(f"Gemini 클라이언트 종료 실패: {e}")
+                self._client = None
+            self._models.clear()
+
+
+_shared_pool: Optional[GeminiClientPool] = None
+_shared_lock = threading.Lock()
+
+
+def get_gemini_client_pool(api_key: str) -> GeminiClientPool:
+    """
+    프로세스 전체에서 공유하는 클라이언트 풀 반환
+
+    키가 바뀌면 새 풀을 만들어 교체 (google-generativeai 전역 설정은 한 키만 가질 수 있음)
+
+    Raises:
+        ValueError: 유효하지 않은 API 키
+    """
+    with _shared_lock:
+        if _shared_pool is not None and _shared_pool.api_key == api_key:
+            _shared_pool.configure_legacy()
+            return _shared_pool
+
+        pool = GeminiClientPool(api_key)
+        _install_pool(pool)
+        return pool
+
+
+def set_gemini_client_pool(pool: GeminiClientPool):
+    """
+    검증을 마친 풀로 공유 풀 교체 (API 키 변경 시)
+
+    Args:
+        pool: validate()로 확인한 새 키의 풀
+    """
+    with _shared_lock:
+        _install_pool(pool)
+
+
+def _install_pool(pool: GeminiClientPool):
+    # 이전 풀은 닫지 않고 참조만 놓음: 진행 중인 생성 작업이 아직 이전 풀의 클라이언트를 쓰고 있을 수 있으며,
+    # 그 생성기들이 해제되면 함께 정리됨
+    global _shared_pool
+    _shared_pool = pool
+    pool.configure_legacy()
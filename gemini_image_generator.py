@@ -4,36 +4,184 @@ Gemini 이미지 생성 모듈
 대본에서 각 컷별 이미지 생성을 위한 프롬프트 생성 및 이미지 생성
 """
 
-from google import genai
-from google.genai import types
-from PIL import Image
-import google.generativeai as genai_legacy
 from typing import Optional, List, Dict, Tuple
-import time
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import re
-import io
+import json
 import base64
 
+from gemini_client_pool import GeminiClientPool, get_gemini_client_pool
+from image_cache import load_or_generate_image
+from image_store import ImageHandle
+from prompt_cache import get_prompt_cache
+from gemini_script_generator import CUT_HEADER_PATTERN
+
+
+def parse_cut_block(cut_num: str, time_range: str, content: str) -> Dict:
+    """
+    컷 헤더 하나와 그 본문을 컷 정보로 변환
+
+    Args:
+        cut_num: 컷 번호 문자열
+        time_range: 시간 범위 (예: "0:00-0:08")
+        content: 다음 컷 헤더 전까지의 본문
+
+    Returns:
+        Dict: 컷 정보
+    """
+    content = content.strip()
+
+    # 컷 내용에서 장면 설명, 대사, 음악 추출
+    scene_desc = ""
+    narration = ""
+    music = ""
+
+    # [장면 설명] 추출
+    scene_match = re.search(r'\[장면\s*설명\]\s*\n?(.*?)(?=\[|---|\Z)', content, re.DOTALL)
+    if scene_match:
+        scene_desc = scene_match.group(1).strip()
+
+    # [대사/내레이션] 추출
+    narration_match = re.search(r'\[대사/내레이션\]\s*\n?(.*?)(?=\[|---|\Z)', content, re.DOTALL)
+    if narration_match:
+        narration = narration_match.group(1).strip()
+
+    # [음악/효과음] 추출
+    music_match = re.search(r'\[음악/효과음\]\s*\n?(.*?)(?=\[|---|\Z)', content, re.DOTALL)
+    if music_match:
+        music = music_match.group(1).strip()
+
+    return {
+        'cut_number': int(cut_num),
+        'time_range': time_range,
+        'scene_description': scene_desc,
+        'narration': narration,
+        'music': music,
+        'full_content': content
+    }
+
+
+class ScriptStreamParser:
+    """
+    스트리밍으로 도착하는 대본에서 완성된 컷을 순서대로 추출
+
+    다음 컷 헤더가 도착하면 이전 컷이 완성된 것으로 보고 반환하며,
+    결과는 parse_script_to_cuts와 같은 형태
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._header_regex = re.compile(CUT_HEADER_PATTERN)
+
+    def feed(self, text: str) -> List[Dict]:
+        """
+        텍스트 조각 추가
+
+        Args:
+            text: 새로 도착한 대본 조각
+
+        Returns:
+            List[Dict]: 이번 조각으로 완성된 컷 리스트
+        """
+        self._buffer += text
+
+        headers = list(self._header_regex.finditer(self._buffer))
+        if len(headers) < 2:
+            return []
+
+        completed = []
+        for current, following in zip(headers, headers[1:]):
+            content = self._buffer[current.end():following.start()]
+            completed.append(parse_cut_block(current.group(1), current.group(2), content))
+
+        # 마지막 헤더부터는 아직 진행 중인 컷
+        self._buffer = self._buffer[headers[-1].start():]
+        return completed
+
+    def close(self) -> List[Dict]:
+        """
+        스트림 종료 시 남은 마지막 컷 반환
+
+        Returns:
+            List[Dict]: 남은 컷 리스트 (없으면 빈 리스트)
+        """
+        buffer, self._buffer = self._buffer, ""
+
+        match = self._header_regex.search(buffer)
+        if not match:
+            return []
+        return [parse_cut_block(match.group(1), match.group(2), buffer[match.end():])]
+
+
+def parse_batch_prompt_response(text: str, expected_cut_numbers: List[int]) -> Dict[int, str]:
+    """
+    배치 프롬프트 응답(JSON 배열)을 컷 번호별 프롬프트로 변환
+
+    Args:
+        text: 모델 응답 텍스트 ([{"cut_number": 1, "image_prompt": "..."}, ...])
+        expected_cut_numbers: 요청한 컷 번호 목록
+
+    Returns:
+        Dict[int, str]: 컷 번호 -> 이미지 프롬프트 (검증에 실패한 컷은 제외)
+    """
+    text = text.strip()
+
+    # ```json ... ``` 코드 블록 제거
+    fence_match = re.search(r'```(?:json)?\s*(.*?)```', text, re.DOTALL)
+    if fence_match:
+        text = fence_match.group(1).strip()
+
+    # 배열 앞뒤의 설명 문구 제거
+    start, end = text.find('['), text.rfind(']')
+    if start == -1 or end <= start:
+        return {}
+
+    try:
+        items = json.loads(text[start:end + 1])
+    except ValueError:
+        return {}
+
+    expected = set(expected_cut_numbers)
+    prompts = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            cut_number = int(item.get('cut_number'))
+        except (TypeError, ValueError):
+            continue
+        image_prompt = item.get('image_prompt')
+        if cut_number in expected and isinstance(image_prompt, str) and image_prompt.strip():
+            prompts[cut_number] = image_prompt.strip()
+
+    return prompts
+
 
 class GeminiImageGenerator:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, client_pool: Optional[GeminiClientPool] = None):
         """
         Gemini 이미지 생성기 초기화
 
         Args:
             api_key: Gemini API 키
+            client_pool: 공유 클라이언트 풀 (기본: API 키별 공유 풀)
         """
         if not api_key or len(api_key) < 10:
             raise ValueError("유효한 Gemini API 키가 필요합니다.")
 
         self.api_key = api_key
+        self.client_pool = client_pool or get_gemini_client_pool(api_key)
+
+        # google-genai 클라이언트 (이미지 생성용, 다른 생성기와 연결 풀 공유)
+        self.client = self.client_pool.client
 
-        # 새로운 google-genai 클라이언트 (이미지 생성용)
-        self.client = genai.Client(api_key=api_key)
+        # google-generativeai 모델 (텍스트 생성용)
+        self.text_model_name = 'gemini-2.5-flash'
+        self.text_model = self.client_pool.text_model(self.text_model_name)
 
-        # 기존 google-generativeai 라이브러리 (텍스트 생성용)
-        genai_legacy.configure(api_key=api_key)
-        self.text_model = genai_legacy.GenerativeModel('gemini-2.5-flash')
+        # 이미지 프롬프트 캐시 (~/.youtube_maker/prompt_cache.json)
+        self.prompt_cache = get_prompt_cache()
 
         # 지원 모델
         self.supported_models = {
@@ -43,6 +191,28 @@ class GeminiImageGenerator:
 
         self.default_model = "gemini-2.5-flash-image"
 
+        # 스타일 설명 매핑
+        self.style_descriptions = {
+            "Realistic Photography": "photorealistic, live action photography, high detail realistic image",
+            "Animation": "anime style, 2D animation, illustrated",
+            "3D Pixar Style": "3D rendered, Pixar animation style, CGI, stylized 3D characters",
+            "Cyberpunk/Futuristic": "cyberpunk aesthetic, futuristic, neon-lit, sci-fi",
+            "Cinematic Movie Frame": "cinematic movie still, film grain, widescreen cinematic composition",
+            "Oil Painting": "oil painting style, artistic brush strokes, classical painting aesthetic"
+        }
+
+        # 색감 설명 매핑
+        self.color_descriptions = {
+            "Vibrant & Colorful": "vibrant colors, saturated, colorful",
+            "Monochrome/B&W": "black and white, monochrome, grayscale",
+            "Pastel/Soft": "pastel colors, soft tones, gentle hues",
+            "Warm Earthy Tones": "warm earthy tones, brown, orange, autumn colors",
+            "Cool Blue/Teal": "cool blue tones, teal, cyan color palette",
+            "High Contrast/Bold": "high contrast, bold colors, dramatic color contrast",
+            "Muted/Desaturated": "muted colors, desaturated, subdued palette",
+            "Vintage/Sepia": "vintage sepia tone, retro color grading, nostalgic warm tint"
+        }
+
     def parse_script_to_cuts(self, script: str) -> List[Dict]:
         """
         대본을 컷 단위로 파싱
@@ -55,48 +225,13 @@ class GeminiImageGenerator:
         """
         cuts = []
 
-        # 컷 구분 패턴: === CUT 1 (0:00-0:08) === 형식
-        cut_pattern = r'===\s*CUT\s*(\d+)\s*\(([^)]+)\)\s*==='
-
         # 대본을 컷으로 분할
-        parts = re.split(cut_pattern, script)
+        parts = re.split(CUT_HEADER_PATTERN, script)
 
         # parts: [intro, cut_num, time, content, cut_num, time, content, ...]
         i = 1
         while i < len(parts) - 2:
-            cut_num = parts[i]
-            time_range = parts[i + 1]
-            content = parts[i + 2].strip()
-
-            # 컷 내용에서 장면 설명, 대사, 음악 추출
-            scene_desc = ""
-            narration = ""
-            music = ""
-
-            # [장면 설명] 추출
-            scene_match = re.search(r'\[장면\s*설명\]\s*\n?(.*?)(?=\[|---|\Z)', content, re.DOTALL)
-            if scene_match:
-                scene_desc = scene_match.group(1).strip()
-
-            # [대사/내레이션] 추출
-            narration_match = re.search(r'\[대사/내레이션\]\s*\n?(.*?)(?=\[|---|\Z)', content, re.DOTALL)
-            if narration_match:
-                narration = narration_match.group(1).strip()
-
-            # [음악/효과음] 추출
-            music_match = re.search(r'\[음악/효과음\]\s*\n?(.*?)(?=\[|---|\Z)', content, re.DOTALL)
-            if music_match:
-                music = music_match.group(1).strip()
-
-            cuts.append({
-                'cut_number': int(cut_num),
-                'time_range': time_range,
-                'scene_description': scene_desc,
-                'narration': narration,
-                'music': music,
-                'full_content': content
-            })
-
+            cuts.append(parse_cut_block(parts[i], parts[i + 1], parts[i + 2]))
             i += 3
 
         return cuts
@@ -109,7 +244,10 @@ class GeminiImageGenerator:
         color: str = "Vibrant & Colorful",
         lighting: str = "Natural Sunlight",
         camera: str = "Wide Angle",
-        max_retries: int = 3
+        max_retries: int = 3,
+        use_cache: bool = True,
+        batch_size: int = 1,
+        flush: bool = True
     ) -> List[Dict]:
         """
         각 컷에 대한 이미지 생성용 영어 프롬프트 생성
@@ -122,14 +260,17 @@ class GeminiImageGenerator:
             lighting: 조명 (Golden Hour, Neon/Night City, etc.)
             camera: 카메라 (Close-up, Wide Angle, Low Angle, etc.)
             max_retries: 최대 재시도 횟수
+            use_cache: 같은 요청으로 생성한 프롬프트가 있으면 재사용
+            batch_size: 한 번의 요청으로 처리할 컷 수 (1이면 컷별 요청)
+            flush: 끝난 뒤 프롬프트 캐시를 디스크에 기록 (여러 번 나누어 호출하는 쪽은 False로 두고 마지막에 한 번 기록)
 
         Returns:
             List[Dict]: 이미지 프롬프트가 추가된 컷 리스트
         """
         results = []
 
-        for cut in cuts:
-            prompt = self._build_prompt_generation_request(
+        request_texts = [
+            self._build_prompt_generation_request(
                 cut=cut,
                 style=style,
                 mood=mood,
@@ -137,27 +278,162 @@ class GeminiImageGenerator:
                 lighting=lighting,
                 camera=camera
             )
-
-            image_prompt = None
-            for attempt in range(max_retries):
-                try:
-                    response = self.text_model.generate_content(prompt)
-                    image_prompt = response.text.strip()
-                    break
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                        continue
-                    else:
-                        image_prompt = f"Error generating prompt: {str(e)}"
+            for cut in cuts
+        ]
+
+        # 배치 모드: 캐시에 없는 컷만 묶어서 요청
+        batch_prompts = {}
+        if batch_size > 1:
+            pending = [
+                cut for cut, request in zip(cuts, request_texts)
+                if not (use_cache and self._is_prompt_cached(request))
+            ]
+            for start in range(0, len(pending), batch_size):
+                batch_prompts.update(self._request_batch_image_prompts(
+                    cuts=pending[start:start + batch_size],
+                    style=style,
+                    mood=mood,
+                    color=color,
+                    lighting=lighting,
+                    camera=camera,
+                    max_retries=max_retries
+                ))
+
+        for cut, prompt in zip(cuts, request_texts):
+            image_prompt = batch_prompts.get(cut['cut_number'])
+            if image_prompt is not None:
+                # 배치 결과도 컷별 요청 기준으로 캐시
+                if self.prompt_cache:
+                    self.prompt_cache.set(prompt, self.text_model_name, image_prompt)
+            else:
+                # 캐시 조회 또는 배치 응답에서 빠진 컷은 개별 요청
+                image_prompt = self._request_image_prompt(prompt, max_retries, use_cache)
 
             cut_result = cut.copy()
             cut_result['image_prompt'] = image_prompt
             cut_result['generated_image'] = None
             results.append(cut_result)
 
+        if flush and self.prompt_cache:
+            self.prompt_cache.flush()
+
         return results
 
+    def _is_prompt_cached(self, prompt: str) -> bool:
+        """요청 프롬프트에 대한 캐시 존재 여부"""
+        return bool(self.prompt_cache) and self.prompt_cache.contains(prompt, self.text_model_name)
+
+    def _request_image_prompt(self, prompt: str, max_retries: int = 3, use_cache: bool = True) -> str:
+        """
+        요청 프롬프트로 이미지 프롬프트 생성 (캐시 우선)
+
+        Args:
+            prompt: _build_prompt_generation_request로 구성한 요청
+            max_retries: 최대 재시도 횟수
+            use_cache: 캐시된 결과 사용 여부
+
+        Returns:
+            str: 이미지 프롬프트 (실패 시 오류 메시지)
+        """
+        if use_cache and self.prompt_cache:
+            cached = self.prompt_cache.get(prompt, self.text_model_name)
+            if cached is not None:
+                return cached
+
+        try:
+            image_prompt = self.client_pool.generate_text(self.text_model_name, prompt, max_retries)
+        except Exception as e:
+            return f"Error generating prompt: {str(e)}"
+
+        if self.prompt_cache:
+            self.prompt_cache.set(prompt, self.text_model_name, image_prompt)
+        return image_prompt
+
+    def _request_batch_image_prompts(
+        self,
+        cuts: List[Dict],
+        style: str,
+        mood: str,
+        color: str,
+        lighting: str,
+        camera: str,
+        max_retries: int = 3
+    ) -> Dict[int, str]:
+        """
+        여러 컷의 이미지 프롬프트를 한 번의 요청으로 생성
+
+        Returns:
+            Dict[int, str]: 컷 번호 -> 이미지 프롬프트 (응답에 없는 컷은 제외)
+        """
+        if not cuts:
+            return {}
+
+        prompt = self._build_batch_prompt_generation_request(cuts, style, mood, color, lighting, camera)
+        cut_numbers = [cut['cut_number'] for cut in cuts]
+
+        try:
+            return parse_batch_prompt_response(
+                self.client_pool.generate_text(self.text_model_name, prompt, max_retries), cut_numbers)
+        except Exception:
+            # 배치 실패 시 빈 결과 -> 호출 측에서 컷별 요청으로 대체
+            return {}
+
+    def _build_batch_prompt_generation_request(
+        self,
+        cuts: List[Dict],
+        style: str,
+        mood: str,
+        color: str,
+        lighting: str,
+        camera: str
+    ) -> str:
+        """
+        여러 컷의 이미지 프롬프트를 한 번에 생성하기 위한 요청 프롬프트 구성 (JSON 입출력)
+        """
+        style_keyword = self.style_descriptions.get(style, style)
+        color_keyword = self.color_descriptions.get(color, color)
+
+        scenes = [
+            {
+                'cut_number': cut['cut_number'],
+                'time': cut['time_range'],
+                'scene_description': cut['scene_description'],
+                'narration': cut['narration']
+            }
+            for cut in cuts
+        ]
+        scenes_json = json.dumps(scenes, ensure_ascii=False, indent=2)
+
+        prompt = f"""You are an expert image prompt engineer for AI image generation.
+Based on the following video script scenes (JSON array, scene text in Korean), create a detailed image generation prompt in English for EACH scene.
+
+【Scenes】
+{scenes_json}
+
+【Style Requirements】
+- Visual Style: {style_keyword}
+- Mood/Atmosphere: {mood}
+- Color Palette: {color_keyword}
+- Lighting: {lighting}
+- Overall Camera Composition: The overall video uses {camera} shots as the primary camera style. Consider this when composing each scene, but you may vary slightly based on what works best for each specific scene.
+
+【Output Requirements】
+1. Write every prompt entirely in English
+2. Be specific about visual elements, composition, lighting, and atmosphere
+3. Include character descriptions if people are mentioned
+4. Describe the background and environment in detail
+5. Apply the specified style, mood, color, and lighting consistently across all scenes
+6. Keep each prompt concise but comprehensive (2-4 sentences)
+7. Write each prompt so it stands on its own; do not refer to other scenes
+8. CRITICAL: The images must contain NO TEXT, NO LETTERS, NO WORDS, NO CAPTIONS, NO SUBTITLES, NO WATERMARKS, NO WRITING of any kind. These are pure visual images without any textual elements.
+
+【Output Format】
+Return ONLY a JSON array with exactly one object per scene, in the same order, like:
+[{{"cut_number": 1, "image_prompt": "..."}}, {{"cut_number": 2, "image_prompt": "..."}}]
+No explanations, no markdown."""
+
+        return prompt
+
     def _build_prompt_generation_request(
         self,
         cut: Dict,
@@ -170,30 +446,8 @@ class GeminiImageGenerator:
         """
         이미지 프롬프트 생성을 위한 요청 프롬프트 구성
         """
-        # 스타일 설명 매핑
-        style_descriptions = {
-            "Realistic Photography": "photorealistic, live action photography, high detail realistic image",
-            "Animation": "anime style, 2D animation, illustrated",
-            "3D Pixar Style": "3D rendered, Pixar animation style, CGI, stylized 3D characters",
-            "Cyberpunk/Futuristic": "cyberpunk aesthetic, futuristic, neon-lit, sci-fi",
-            "Cinematic Movie Frame": "cinematic movie still, film grain, widescreen cinematic composition",
-            "Oil Painting": "oil painting style, artistic brush strokes, classical painting aesthetic"
-        }
-
-        # 색감 설명 매핑
-        color_descriptions = {
-            "Vibrant & Colorful": "vibrant colors, saturated, colorful",
-            "Monochrome/B&W": "black and white, monochrome, grayscale",
-            "Pastel/Soft": "pastel colors, soft tones, gentle hues",
-            "Warm Earthy Tones": "warm earthy tones, brown, orange, autumn colors",
-            "Cool Blue/Teal": "cool blue tones, teal, cyan color palette",
-            "High Contrast/Bold": "high contrast, bold colors, dramatic color contrast",
-            "Muted/Desaturated": "muted colors, desaturated, subdued palette",
-            "Vintage/Sepia": "vintage sepia tone, retro color grading, nostalgic warm tint"
-        }
-
-        style_keyword = style_descriptions.get(style, style)
-        color_keyword = color_descriptions.get(color, color)
+        style_keyword = self.style_descriptions.get(style, style)
+        color_keyword = self.color_descriptions.get(color, color)
 
         prompt = f"""You are an expert image prompt engineer for AI image generation.
 Based on the following video script scene description, create a detailed image generation prompt in English.
@@ -230,19 +484,22 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
         prompt: str,
         model: str = None,
         aspect_ratio: str = "16:9",
-        max_retries: int = 3
-    ) -> Tuple[Optional[Image.Image], Optional[str]]:
+        max_retries: int = 3,
+        use_cache: bool = True
+    ) -> Tuple[Optional[ImageHandle], Optional[str]]:
         """
-        단일 이미지 생성
+        단일 이미지 생성 (이미지는 디스크 저장소에 두고 핸들만 반환)
 
         Args:
             prompt: 이미지 생성 프롬프트 (영어)
             model: 사용할 모델
             aspect_ratio: 이미지 비율 ("16:9" 또는 "9:16")
             max_retries: 최대 재시도 횟수
+            use_cache: 캐시된 이미지 사용 여부 (False면 항상 새로 생성)
 
         Returns:
-            Tuple[Image, error_message]: 생성된 이미지와 에러 메시지
+            Tuple[ImageHandle, error_message]: 생성된 이미지의 저장소 핸들(PIL.Image가 아님,
+                                               표시할 때 load()로 디코딩)과 에러 메시지
         """
         if model is None:
             model = self.default_model
@@ -251,50 +508,26 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
         # aspect_hint = "wide landscape format, 16:9 aspect ratio" if aspect_ratio == "16:9" else "vertical portrait format, 9:16 aspect ratio"
         # enhanced_prompt = f"{prompt}, {aspect_hint}"
 
-        for attempt in range(max_retries):
-            try:
-                response = self.client.models.generate_content(
-                    model=model,
-                    contents=prompt,
-                    config=types.GenerateContentConfig(
-                        response_modalities=['TEXT', 'IMAGE'],
-                        image_config=types.ImageConfig(
-                            aspect_ratio=aspect_ratio,
-                        )
-                    )
-                )
-
-                # 응답에서 이미지 추출
-                for part in response.candidates[0].content.parts:
-                    if part.inline_data is not None:
-                        # 이미지 데이터를 PIL Image로 변환
-                        image_data = part.inline_data.data
-                        image = Image.open(io.BytesIO(image_data))
-                        return image, None
-
-                return None, "이미지가 응답에 포함되지 않았습니다."
-
-            except Exception as e:
-                error_msg = str(e)
-
-                # Rate Limit 처리
-                if "429" in error_msg or "quota" in error_msg.lower() or "resource_exhausted" in error_msg.lower():
-                    if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt) * 3
-                        time.sleep(wait_time)
-                        continue
-
-                if attempt == max_retries - 1:
-                    return None, f"이미지 생성 실패: {error_msg}"
-
-        return None, "알 수 없는 오류"
+        try:
+            image = load_or_generate_image(
+                prompt, model, aspect_ratio,
+                lambda: self.client_pool.generate_image(model, prompt, aspect_ratio, max_retries),
+                use_cache
+            )
+        except Exception as e:
+            return None, f"이미지 생성 실패: {str(e)}"
+
+        if image is None:
+            return None, "이미지가 응답에 포함되지 않았습니다."
+        return image, None
 
     def generate_all_images(
         self,
         cuts_with_prompts: List[Dict],
         model: str = None,
         aspect_ratio: str = "16:9",
-        progress_callback=None
+        progress_callback=None,
+        max_workers: int = 1
     ) -> List[Dict]:
         """
         모든 컷에 대해 이미지 생성
@@ -304,33 +537,55 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
             model: 사용할 모델
             aspect_ratio: 이미지 비율 ("16:9" 또는 "9:16")
             progress_callback: 진행 상황 콜백 함수
+            max_workers: 동시에 진행할 이미지 생성 요청 수 (1이면 순차 생성)
 
         Returns:
-            List[Dict]: 이미지가 추가된 컷 리스트
+            List[Dict]: 이미지가 추가된 컷 리스트 (컷 순서 유지)
         """
-        results = []
         total = len(cuts_with_prompts)
 
-        for i, cut in enumerate(cuts_with_prompts):
+        if max_workers <= 1:
+            results = []
+            for i, cut in enumerate(cuts_with_prompts):
+                if progress_callback:
+                    progress_callback(i + 1, total, f"컷 {cut['cut_number']} 이미지 생성 중...")
+
+                # API 호출 간격은 공유 속도 제한기가 조절
+                results.append(self._generate_cut_image(cut, model, aspect_ratio))
+
+            return results
+
+        # 동시 생성: 최대 max_workers개의 요청을 동시에 유지
+        started = [0]
+        lock = threading.Lock()
+
+        def worker(cut: Dict) -> Dict:
             if progress_callback:
-                progress_callback(i + 1, total, f"컷 {cut['cut_number']} 이미지 생성 중...")
+                with lock:
+                    started[0] += 1
+                    current = started[0]
+                progress_callback(current, total, f"컷 {cut['cut_number']} 이미지 생성 중...")
 
-            image, error = self.generate_single_image(
-                prompt=cut['image_prompt'],
-                model=model,
-                aspect_ratio=aspect_ratio
-            )
+            return self._generate_cut_image(cut, model, aspect_ratio)
 
-            cut_result = cut.copy()
-            cut_result['generated_image'] = image
-            cut_result['image_error'] = error
-            results.append(cut_result)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map은 입력 순서대로 결과를 반환하므로 컷 순서가 유지됨
+            return list(executor.map(worker, cuts_with_prompts))
 
-            # API 호출 간 딜레이
-            if i < total - 1:
-                time.sleep(1)
+    def _generate_cut_image(self, cut: Dict, model: str, aspect_ratio: str) -> Dict:
+        """
+        단일 컷 이미지 생성 후 결과 컷 정보 구성
+        """
+        image, error = self.generate_single_image(
+            prompt=cut['image_prompt'],
+            model=model,
+            aspect_ratio=aspect_ratio
+        )
 
-        return results
+        cut_result = cut.copy()
+        cut_result['generated_image'] = image
+        cut_result['image_error'] = error
+        return cut_result
 
     def regenerate_cut_image(
         self,
@@ -351,7 +606,13 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
         Returns:
             Dict: 업데이트된 컷 정보
         """
-        image, error = self.generate_single_image(prompt=new_prompt, model=model, aspect_ratio=aspect_ratio)
+        # 재생성은 항상 새 이미지를 요청 (결과는 캐시에 갱신됨)
+        image, error = self.generate_single_image(
+            prompt=new_prompt,
+            model=model,
+            aspect_ratio=aspect_ratio,
+            use_cache=False
+        )
 
         cut_result = cut.copy()
         cut_result['image_prompt'] = new_prompt
@@ -368,8 +629,7 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
             bool: 연결 성공 여부
         """
         try:
-            response = self.text_model.generate_content("Say hello")
-            return bool(response and response.text)
+            return bool(self.client_pool.generate_text(self.text_model_name, "Say hello", max_retries=1))
         except Exception as e:
             print(f"연결 테스트 실패: {e}")
             return False
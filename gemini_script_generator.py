@@ -1,24 +1,103 @@
 # gemini_script_generator.py
-import google.generativeai as genai
-from typing import Optional
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, List, Optional, Tuple
+from rate_limiter import get_rate_limiter, estimate_tokens, is_rate_limit_error
+from gemini_client_pool import GeminiClientPool, get_gemini_client_pool
+
+# 컷 헤더 형식: === CUT 1 (0:00-0:08) === (대본 파서들이 함께 사용)
+CUT_HEADER_PATTERN = r'===\s*CUT\s*(\d+)\s*\(([^)]+)\)\s*==='
+
+# 1분당 컷 수 기준 컷 길이 (초)
+SECONDS_PER_CUT = 6
+
+
+def _parse_time_range(time_range: str) -> Optional[Tuple[int, int]]:
+    """
+    "0:08-0:16" 형식의 시간 범위를 (시작 초, 끝 초)로 변환 (형식이 다르면 None)
+    """
+    match = re.match(r'\s*(\d+):(\d{1,2})\s*[-~]\s*(\d+):(\d{1,2})', time_range)
+    if not match:
+        return None
+    m1, s1, m2, s2 = (int(value) for value in match.groups())
+    return m1 * 60 + s1, m2 * 60 + s2
+
+
+def _format_time(seconds: int) -> str:
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+def stitch_script_chunks(chunks: List[str]) -> str:
+    """
+    구간별로 생성된 대본을 하나로 합침 (CUT 번호와 시간 범위를 처음부터 다시 매김)
+
+    Args:
+        chunks: 구간 순서대로 정렬된 대본 텍스트 리스트
+
+    Returns:
+        str: 합쳐진 대본
+    """
+    blocks = []
+    cut_number = 0
+    current = 0
+
+    for index, chunk in enumerate(chunks):
+        parts = re.split(CUT_HEADER_PATTERN, chunk)
+        # parts: [intro, cut_num, time, content, cut_num, time, content, ...]
+
+        # 첫 구간의 컷 앞부분(제목, 개요 등)은 대본 머리말로 유지
+        if index == 0 and parts[0].strip():
+            blocks.append(parts[0].strip())
+
+        for i in range(1, len(parts) - 2, 3):
+            time_range = _parse_time_range(parts[i + 1])
+            length = SECONDS_PER_CUT
+            if time_range and time_range[1] > time_range[0]:
+                length = time_range[1] - time_range[0]
+
+            cut_number += 1
+            header = f"=== CUT {cut_number} ({_format_time(current)}-{_format_time(current + length)}) ==="
+            blocks.append(f"{header}\n{parts[i + 2].strip()}")
+            current += length
+
+    return "\n\n".join(blocks)
+
+
+def _limit_cuts(text: str, count: int) -> Tuple[str, int]:
+    """
+    대본에서 앞쪽 count개 컷까지만 남김 (다른 구간의 컷까지 작성한 응답 정리)
+
+    Returns:
+        tuple: (정리된 대본, 남은 컷 수)
+    """
+    headers = list(re.finditer(CUT_HEADER_PATTERN, text))
+    if len(headers) > count:
+        text = text[:headers[count].start()].rstrip()
+    return text, min(len(headers), count)
+
 
 class GeminiScriptGenerator:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, client_pool: Optional[GeminiClientPool] = None):
         """
         Gemini 대본 생성기 초기화
         
         Args:
             api_key: Gemini API 키
+            client_pool: 공유 클라이언트 풀 (기본: API 키별 공유 풀)
         """
         if not api_key or len(api_key) < 10:
             raise ValueError("유효한 Gemini API 키가 필요합니다.")
         
-        # API 키 설정
-        genai.configure(api_key=api_key)
+        # 공유 클라이언트 풀 (API 키 설정 포함)
+        self.client_pool = client_pool or get_gemini_client_pool(api_key)
         
         # 모델 초기화 (Gemini 2.5 Flash)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+        self.model_name = 'gemini-2.5-flash'
+        self.model = self.client_pool.text_model(self.model_name)
+
+        # 공유 속도 제한기
+        self.rate_limiter = get_rate_limiter()
     
     def generate_script(
         self,
@@ -45,6 +124,299 @@ class GeminiScriptGenerator:
         Returns:
             str: 생성된 대본 (실패 시 None)
         """
+        prompt = self._prepare_prompt(
+            topic=topic,
+            language=language,
+            format_type=format_type,
+            duration=duration,
+            target_audience=target_audience,
+            custom_prompt=custom_prompt
+        )
+        
+        return self._generate_text(prompt, max_retries)
+    
+    def _generate_text(self, prompt: str, max_retries: int = 3) -> Optional[str]:
+        """
+        텍스트 생성 요청 (Rate Limit 시 재시도)
+        
+        Returns:
+            str: 생성된 텍스트 (실패 시 None)
+        """
+        for attempt in range(max_retries):
+            try:
+                return self._request_text(prompt)
+                
+            except Exception as e:
+                error_msg = str(e)
+                
+                # Rate Limit 오류 처리 (Retry-After 우선, 없으면 지수 백오프)
+                if is_rate_limit_error(e):
+                    if attempt < max_retries - 1:
+                        wait_time = self.rate_limiter.report_rate_limit(self.model_name, e, attempt, base_delay=2)
+                        print(f"Rate limit 도달. {wait_time:.0f}초 대기 중...")
+                        continue
+                    else:
+                        raise Exception(f"API 요청 한도 초과\n\n원본 에러: {error_msg}")
+                
+                # 기타 오류
+                raise Exception(f"{error_msg}")
+        
+        return None
+    
+    def _request_text(self, prompt: str) -> str:
+        """텍스트 생성 요청 한 번 (재시도 없음)"""
+        self.rate_limiter.acquire(self.model_name, estimate_tokens(prompt))
+        response = self.model.generate_content(prompt)
+        return response.text
+    
+    def generate_script_chunked(
+        self,
+        topic: str,
+        language: str = "한국어",
+        format_type: str = "롱폼",
+        duration: int = 1,
+        target_audience: str = "20-30대",
+        custom_prompt: str = "",
+        chunk_size: int = 20,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        progress_callback: Optional[Callable] = None
+    ) -> Optional[str]:
+        """
+        긴 대본을 구간별로 나누어 병렬 생성
+        
+        먼저 구간별 개요를 만들고, 개요를 공유한 채 CUT 구간을 동시에 작성한 뒤
+        CUT 번호와 시간 범위를 이어서 합침. 실패했거나 컷 수가 부족한 구간만 다시 요청함
+        
+        Args:
+            topic: 영상 주제
+            language: 대본 언어 (한국어/영어)
+            format_type: 포맷 (롱폼/숏폼)
+            duration: 영상 길이 (분)
+            target_audience: 대상 시청자
+            custom_prompt: 사용자 정의 프롬프트 템플릿 (선택)
+            chunk_size: 한 번에 작성할 컷 수
+            max_workers: 동시에 요청할 구간 수
+            max_retries: 구간별 최대 재시도 횟수
+            progress_callback: 진행 상황 콜백 (completed, total, message)
+            
+        Returns:
+            str: 생성된 대본 (실패 시 None)
+        """
+        base_prompt = self._prepare_prompt(
+            topic=topic,
+            language=language,
+            format_type=format_type,
+            duration=duration,
+            target_audience=target_audience,
+            custom_prompt=custom_prompt
+        )
+        
+        total_cuts = duration * 10
+        chunk_size = max(1, chunk_size)
+        ranges = [
+            (start, min(start + chunk_size - 1, total_cuts))
+            for start in range(1, total_cuts + 1, chunk_size)
+        ]
+        
+        # 구간이 하나면 그대로 생성
+        if len(ranges) <= 1:
+            return self._generate_text(base_prompt, max_retries)
+        
+        # 1단계: 구간별 개요 (모든 구간이 공유하는 맥락)
+        if progress_callback:
+            progress_callback(0, len(ranges), "개요 작성 중...")
+        outline = self._generate_text(self._build_outline_prompt(base_prompt, ranges), max_retries)
+        if not outline:
+            return None
+        
+        # 2단계: 구간별 병렬 생성
+        def generate_chunk(index: int) -> str:
+            start, end = ranges[index]
+            expected = end - start + 1
+            prompt = self._build_chunk_prompt(base_prompt, outline, ranges, index)
+            best_text, best_count = None, 0
+            last_error = None
+            for attempt in range(max_retries):
+                wait_time = (2 ** attempt) * 2
+                try:
+                    text, count = _limit_cuts(self._request_text(prompt) or "", expected)
+                    if count == expected:
+                        return text
+                    if count > best_count:
+                        best_text, best_count = text, count
+                    last_error = f"컷 {count}개만 받았습니다 (요청: {expected}개)."
+                except Exception as e:
+                    last_error = str(e)
+                    # Rate Limit은 공유 속도 제한기에 대기 시간을 알려 다음 요청 전에 대기
+                    if is_rate_limit_error(e):
+                        self.rate_limiter.report_rate_limit(self.model_name, e, attempt, base_delay=2)
+                        wait_time = 0
+                print(f"구간 CUT {start}-{end} 생성 실패 (시도 {attempt + 1}/{max_retries}): {last_error}")
+                if attempt < max_retries - 1 and wait_time:
+                    time.sleep(wait_time)
+
+            # 재시도해도 컷 수가 모자라면 가장 많이 받은 응답 사용
+            if best_text:
+                print(f"구간 CUT {start}-{end}: 요청한 {expected}개 중 {best_count}개 컷으로 진행")
+                return best_text
+            raise Exception(f"CUT {start}-{end} 구간 생성 실패\n\n원본 에러: {last_error}")
+        
+        chunks = [None] * len(ranges)
+        completed = 0
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {executor.submit(generate_chunk, i): i for i in range(len(ranges))}
+            for future in as_completed(futures):
+                index = futures[future]
+                chunks[index] = future.result()
+                completed += 1
+                if progress_callback:
+                    start, end = ranges[index]
+                    progress_callback(completed, len(ranges), f"CUT {start}-{end} 작성 완료")
+        
+        # 3단계: CUT 번호와 시간 범위를 이어서 합침
+        return stitch_script_chunks(chunks)
+    
+    def _build_outline_prompt(self, base_prompt: str, ranges: List[Tuple[int, int]]) -> str:
+        """
+        구간별 개요 작성 요청 구성
+        
+        Returns:
+            str: 완성된 프롬프트
+        """
+        sections = "\n".join(
+            f"[구간 {i + 1}] CUT {start}-{end}: (이 구간에서 다룰 내용 2-3문장)"
+            for i, (start, end) in enumerate(ranges)
+        )
+        
+        return f"""{base_prompt}
+
+【이번 요청】
+대본을 바로 작성하지 말고, 위 대본을 {len(ranges)}개 구간으로 나누어 작성하기 위한 개요만 작성해주세요.
+각 구간이 다룰 내용과 흐름이 이어지도록 구성하고, 아래 형식만 반환해주세요.
+
+{sections}"""
+    
+    def _build_chunk_prompt(
+        self,
+        base_prompt: str,
+        outline: str,
+        ranges: List[Tuple[int, int]],
+        index: int
+    ) -> str:
+        """
+        개요를 바탕으로 특정 CUT 구간만 작성하도록 요청 구성
+        
+        Returns:
+            str: 완성된 프롬프트
+        """
+        start, end = ranges[index]
+        start_time = _format_time((start - 1) * SECONDS_PER_CUT)
+        
+        if index == 0:
+            position = "대본의 시작 부분이므로 강력한 오프닝 훅으로 시작하세요."
+        elif index == len(ranges) - 1:
+            position = "대본의 마지막 부분이므로 마무리와 CTA(좋아요, 구독 유도)로 끝내세요."
+        else:
+            position = "대본의 중간 부분이므로 인사나 마무리 없이 앞 구간에서 자연스럽게 이어지도록 작성하세요."
+        
+        return f"""{base_prompt}
+
+【전체 개요】
+{outline}
+
+【이번 요청】
+전체 대본 중 [구간 {index + 1}] CUT {start}-{end}만 작성해주세요.
+• 첫 컷은 CUT {start} ({start_time}부터 시작)
+• {position}
+• 위의 컷 형식을 정확히 따르고, 다른 구간의 컷은 작성하지 마세요.
+최종 결과는 CUT {start}부터 CUT {end}까지의 대본만 반환해주세요."""
+    
+    def generate_script_stream(
+        self,
+        topic: str,
+        language: str = "한국어",
+        format_type: str = "롱폼",
+        duration: int = 1,
+        target_audience: str = "20-30대",
+        custom_prompt: str = "",
+        max_retries: int = 3
+    ) -> Iterator[str]:
+        """
+        YouTube 영상 대본 스트리밍 생성 (도착하는 대로 텍스트 조각 반환)
+        
+        Args:
+            topic: 영상 주제
+            language: 대본 언어 (한국어/영어)
+            format_type: 포맷 (롱폼/숏폼)
+            duration: 영상 길이 (분)
+            target_audience: 대상 시청자
+            custom_prompt: 사용자 정의 프롬프트 템플릿 (선택)
+            max_retries: 최대 재시도 횟수 (첫 조각을 받기 전까지만 재시도)
+            
+        Yields:
+            str: 생성된 대본 텍스트 조각
+        """
+        prompt = self._prepare_prompt(
+            topic=topic,
+            language=language,
+            format_type=format_type,
+            duration=duration,
+            target_audience=target_audience,
+            custom_prompt=custom_prompt
+        )
+        
+        for attempt in range(max_retries):
+            received = False
+            try:
+                self.rate_limiter.acquire(self.model_name, estimate_tokens(prompt))
+                response = self.model.generate_content(prompt, stream=True)
+                
+                for chunk in response:
+                    try:
+                        text = chunk.text
+                    except ValueError:
+                        # 텍스트가 없는 조각 (안전 필터 메타데이터 등)
+                        continue
+                    if text:
+                        received = True
+                        yield text
+                return
+                
+            except Exception as e:
+                error_msg = str(e)
+                
+                # 이미 일부를 전달했다면 재시도하면 내용이 중복되므로 중단
+                if received:
+                    raise Exception(f"대본 생성 중단\n\n원본 에러: {error_msg}")
+                
+                # Rate Limit 오류 처리 (Retry-After 우선, 없으면 지수 백오프)
+                if is_rate_limit_error(e):
+                    if attempt < max_retries - 1:
+                        wait_time = self.rate_limiter.report_rate_limit(self.model_name, e, attempt, base_delay=2)
+                        print(f"Rate limit 도달. {wait_time:.0f}초 대기 중...")
+                        continue
+                    else:
+                        raise Exception(f"API 요청 한도 초과\n\n원본 에러: {error_msg}")
+                
+                # 기타 오류
+                raise Exception(f"{error_msg}")
+    
+    def _prepare_prompt(
+        self,
+        topic: str,
+        language: str,
+        format_type: str,
+        duration: int,
+        target_audience: str,
+        custom_prompt: str = ""
+    ) -> str:
+        """
+        사용자 정의 템플릿 또는 기본 템플릿으로 대본 생성 요청 구성
+        
+        Returns:
+            str: 완성된 프롬프트
+        """
         # 컷 개수 계산 (1분당 10개)
         total_cuts = duration * 10
         
@@ -70,29 +442,7 @@ class GeminiScriptGenerator:
                 target_audience=target_audience
             )
         
-        # 재시도 로직으로 대본 생성
-        for attempt in range(max_retries):
-            try:
-                response = self.model.generate_content(prompt)
-                return response.text
-                
-            except Exception as e:
-                error_msg = str(e)
-                
-                # Rate Limit 오류 처리
-                if "429" in error_msg or "quota" in error_msg.lower() or "resource_exhausted" in error_msg.lower():
-                    if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt) * 2
-                        print(f"Rate limit 도달. {wait_time}초 대기 중...")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        raise Exception(f"API 요청 한도 초과\n\n원본 에러: {error_msg}")
-                
-                # 기타 오류
-                raise Exception(f"{error_msg}")
-        
-        return None
+        return prompt
     
     def _build_prompt(
         self,
@@ -229,6 +579,7 @@ class GeminiScriptGenerator:
             bool: 연결 성공 여부
         """
         try:
+            self.rate_limiter.acquire(self.model_name, estimate_tokens("Say hello"))
             response = self.model.generate_content("Say hello")
             if not response:
                 return False
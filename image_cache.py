@@ -0,0 +1,339 @@
+# image_cache.py
+"""
+이미지 캐시 모듈
+용량 기준 LRU 캐시(디스크/메모리)와, (프롬프트, 모델, 비율) 해시를 키로 생성 이미지를 저장하는 디스크 캐시
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
+
+from PIL import Image
+
+if TYPE_CHECKING:
+    from image_store import ImageHandle
+
+
+class DiskLRUCache:
+    def __init__(self, directory: Path, max_bytes: int):
+        """
+        디스크 LRU 캐시 초기화
+
+        Args:
+            directory: 캐시 파일을 저장할 디렉토리
+            max_bytes: 최대 용량 (바이트)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._index = OrderedDict()  # key -> (파일명, 크기), 오래 사용하지 않은 순
+        self._total_bytes = 0
+
+        self._load_index()
+
+    def _load_index(self):
+        """디스크의 기존 캐시 파일을 마지막 사용 시각 순으로 인덱싱"""
+        entries = []
+        for path in self.directory.iterdir():
+            if not path.is_file() or path.name.startswith('.'):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, path.name, stat.st_size))
+
+        for _, key, name, size in sorted(entries):
+            self._index[key] = (name, size)
+            self._total_bytes += size
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        캐시된 데이터 조회 (조회 시 최근 사용으로 갱신)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            bytes: 캐시된 데이터 (없으면 None)
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            self._index.move_to_end(key)
+
+        path = self.directory / entry[0]
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            return data
+        except OSError:
+            with self._lock:
+                if self._index.pop(key, None):
+                    self._total_bytes -= entry[1]
+            return None
+
+    def put(self, key: str, data: bytes, ext: str = ""):
+        """
+        데이터 저장 후 용량 초과분을 오래된 순으로 삭제
+
+        Args:
+            key: 캐시 키
+            data: 저장할 데이터
+            ext: 파일 확장자 (예: ".png")
+        """
+        name = f"{key}{ext}"
+        path = self.directory / name
+        tmp_path = self.directory / f".{name}.{threading.get_ident()}.tmp"
+
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"캐시 저장 실패: {e}")
+            return
+
+        with self._lock:
+            old = self._index.pop(key, None)
+            if old:
+                self._total_bytes -= old[1]
+                if old[0] != name:
+                    self._remove_file(old[0])
+
+            self._index[key] = (name, len(data))
+            self._total_bytes += len(data)
+
+            while self._total_bytes > self.max_bytes and len(self._index) > 1:
+                _, (old_name, old_size) = self._index.popitem(last=False)
+                self._total_bytes -= old_size
+                self._remove_file(old_name)
+
+    def _remove_file(self, name: str):
+        try:
+            (self.directory / name).unlink()
+        except OSError:
+            pass
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            for name, _ in self._index.values():
+                self._remove_file(name)
+            self._index.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+
+class MemoryLRUCache:
+    def __init__(self, max_bytes: int, sizeof: Optional[Callable] = None):
+        """
+        메모리 LRU 캐시 초기화
+
+        Args:
+            max_bytes: 최대 용량 (바이트)
+            sizeof: 값의 크기(바이트)를 계산하는 함수 (기본: len)
+        """
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or len
+
+        self._lock = threading.Lock()
+        self._items = OrderedDict()  # key -> (값, 크기), 오래 사용하지 않은 순
+        self._total_bytes = 0
+
+    def get(self, key):
+        """
+        캐시된 값 조회 (조회 시 최근 사용으로 갱신, 없으면 None)
+        """
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            self._items.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        """
+        값 저장 후 용량 초과분을 오래된 순으로 제거
+        """
+        size = self.sizeof(value)
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old:
+                self._total_bytes -= old[1]
+
+            self._items[key] = (value, size)
+            self._total_bytes += size
+
+            while self._total_bytes > self.max_bytes and len(self._items) > 1:
+                _, (_, old_size) = self._items.popitem(last=False)
+                self._total_bytes -= old_size
+
+    def pop(self, key):
+        """항목 제거 후 값 반환 (없으면 None)"""
+        with self._lock:
+            entry = self._items.pop(key, None)
+            if entry is None:
+                return None
+            self._total_bytes -= entry[1]
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._total_bytes = 0
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+
+def image_nbytes(image: Image.Image) -> int:
+    """디코딩된 이미지의 대략적인 메모리 크기 (바이트)"""
+    return image.width * image.height * len(image.getbands())
+
+
+def _image_extension(data: bytes) -> str:
+    """이미지 데이터의 시그니처로 확장자 판별"""
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return ".png"
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return ".webp"
+    if data[:3] == b'\xff\xd8\xff':
+        return ".jpg"
+    return ".img"
+
+
+class ImageCache:
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = 1024 * 1024 * 1024):
+        """
+        생성 이미지 캐시 초기화
+
+        Args:
+            directory: 캐시 디렉토리 (기본: ~/.youtube_maker/image_cache)
+            max_bytes: 최대 용량 (기본 1GB)
+        """
+        if directory is None:
+            directory = Path.home() / '.youtube_maker' / 'image_cache'
+        self.store = DiskLRUCache(directory, max_bytes)
+
+    @staticmethod
+    def make_key(prompt: str, model: str, aspect_ratio: str) -> str:
+        """(프롬프트, 모델, 비율)로 캐시 키 생성"""
+        payload = json.dumps([model, aspect_ratio, prompt], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, prompt: str, model: str, aspect_ratio: str) -> Optional[Image.Image]:
+        """
+        캐시된 이미지 조회
+
+        Returns:
+            Image: 캐시된 이미지 (없으면 None)
+        """
+        data = self.get_bytes(prompt, model, aspect_ratio)
+        if data is None:
+            return None
+        try:
+            return Image.open(io.BytesIO(data))
+        except Exception:
+            return None
+
+    def get_bytes(self, prompt: str, model: str, aspect_ratio: str) -> Optional[bytes]:
+        """
+        캐시된 이미지의 인코딩된 데이터 조회 (디코딩하지 않음)
+
+        Returns:
+            bytes: 캐시된 데이터 (없으면 None)
+        """
+        return self.store.get(self.make_key(prompt, model, aspect_ratio))
+
+    def put(self, prompt: str, model: str, aspect_ratio: str, data: bytes):
+        """
+        API가 반환한 인코딩된 이미지 데이터를 그대로 저장
+        """
+        self.store.put(self.make_key(prompt, model, aspect_ratio), data, _image_extension(data))
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_image_cache() -> Optional[ImageCache]:
+    """
+    프로세스 전체에서 공유하는 이미지 캐시 반환 (생성 실패 시 None)
+    """
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            try:
+                _shared_cache = ImageCache()
+            except OSError as e:
+                print(f"이미지 캐시 초기화 실패: {e}")
+                return None
+        return _shared_cache
+
+
+def load_or_generate_image(
+    prompt: str,
+    model: str,
+    aspect_ratio: str,
+    generate: Callable[[], Optional[bytes]],
+    use_cache: bool = True
+) -> Optional['ImageHandle']:
+    """
+    생성 이미지를 세션 이미지 저장소에 넣고 핸들 반환
+    같은 (프롬프트, 모델, 비율)로 생성한 이미지가 캐시에 있으면 재사용하고, 없으면 생성해 캐시에 채움
+
+    Args:
+        prompt: 이미지 생성 프롬프트
+        model: 이미지 모델 이름
+        aspect_ratio: 이미지 비율
+        generate: 캐시에 없을 때 호출할 생성 함수 (인코딩된 이미지 데이터, 응답에 이미지가 없으면 None)
+        use_cache: False면 캐시를 조회하지 않고 항상 생성 (결과는 캐시에 갱신)
+
+    Returns:
+        ImageHandle: 저장소의 이미지 핸들 (generate가 None을 반환하면 None)
+
+    Raises:
+        Exception: 생성 또는 저장소 기록 실패
+    """
+    # image_store가 이 모듈을 import하므로 호출 시점에 가져옴
+    from image_store import get_image_store
+
+    cache = get_image_cache()
+    store = get_image_store()
+
+    if use_cache and cache:
+        data = cache.get_bytes(prompt, model, aspect_ratio)
+        if data is not None:
+            try:
+                return store.put_bytes(data)
+            except Exception as e:
+                print(f"캐시 이미지 로드 실패: {e}")
+
+    data = generate()
+    if data is None:
+        return None
+
+    # 인코딩된 이미지 데이터를 그대로 저장소에 보관 (디코딩은 표시할 때)
+    image = store.put_bytes(data)
+    if cache:
+        cache.put(prompt, model, aspect_ratio, data)
+    return image
@@ -0,0 +1,278 @@
+# image_exporter.py
+"""
+이미지 일괄 내보내기 모듈
+저장소의 이미지를 프로세스 풀에서 병렬로 인코딩해 폴더 또는 ZIP 파일 하나로 저장
+(PNG/JPEG/WebP, 품질/압축 수준, 축소 크기 지정)
+"""
+
+import io
+import multiprocessing
+import os
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+
+# 지원 포맷별 확장자
+EXPORT_FORMATS = {
+    'PNG': '.png',
+    'JPEG': '.jpg',
+    'WEBP': '.webp',
+}
+
+# 원본 파일 확장자별 포맷 (같은 포맷이고 축소하지 않으면 다시 인코딩하지 않음)
+_SOURCE_FORMATS = {'.png': 'PNG', '.jpg': 'JPEG', '.jpeg': 'JPEG', '.webp': 'WEBP'}
+
+
+class ExportCancelled(Exception):
+    """내보내기가 중지되었음을 알리는 예외"""
+
+
+class _PoolUnavailable(Exception):
+    """프로세스 풀에서 작업 프로세스를 띄우지 못했음을 알리는 예외"""
+
+
+def encode_image(
+    source_path: str,
+    image_format: str = 'PNG',
+    quality: int = 90,
+    compress_level: int = 6,
+    max_size: Optional[Tuple[int, int]] = None
+) -> bytes:
+    """
+    이미지 파일을 지정한 포맷으로 인코딩 (프로세스 풀에서 실행되므로 모듈 최상위 함수)
+
+    Args:
+        source_path: 원본 이미지 파일 경로
+        image_format: 'PNG', 'JPEG', 'WEBP'
+        quality: JPEG/WebP 품질 (1-100)
+        compress_level: PNG 압축 수준 (0-9, 높을수록 작고 느림)
+        max_size: 최대 (너비, 높이) (None이면 원본 크기)
+
+    Returns:
+        bytes: 인코딩된 데이터
+    """
+    ext = os.path.splitext(source_path)[1].lower()
+
+    with Image.open(source_path) as image:
+        needs_resize = max_size is not None and (image.width > max_size[0] or image.height > max_size[1])
+
+        # 포맷이 같고 축소하지 않으면 원본 그대로 사용
+        if _SOURCE_FORMATS.get(ext) == image_format and not needs_resize:
+            with open(source_path, 'rb') as f:
+                return f.read()
+
+        image.load()
+        if needs_resize:
+            image.thumbnail(max_size, Image.Resampling.LANCZOS)
+
+        if image_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+
+        options = {}
+        if image_format == 'PNG':
+            options['compress_level'] = compress_level
+        elif image_format == 'JPEG':
+            options.update(quality=quality, optimize=True)
+        elif image_format == 'WEBP':
+            options.update(quality=quality, method=4)
+
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format, **options)
+        return buffer.getvalue()
+
+
+def export_image(source_path: str, target_path: str, **options) -> int:
+    """
+    이미지를 인코딩해 파일로 저장 (임시 파일에 쓴 뒤 교체)
+
+    Returns:
+        int: 저장한 바이트 수
+    """
+    data = encode_image(source_path, **options)
+    tmp_path = f"{target_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, target_path)
+    return len(data)
+
+
+class ImageExporter:
+    def __init__(
+        self,
+        image_format: str = 'PNG',
+        quality: int = 90,
+        compress_level: int = 6,
+        max_size: Optional[Tuple[int, int]] = None,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable] = None
+    ):
+        """
+        이미지 내보내기 초기화
+
+        Args:
+            image_format: 'PNG', 'JPEG', 'WEBP'
+            quality: JPEG/WebP 품질 (1-100)
+            compress_level: PNG 압축 수준 (0-9)
+            max_size: 최대 (너비, 높이) (None이면 원본 크기)
+            max_workers: 인코딩 프로세스 수 (기본: CPU 수)
+            progress_callback: 진행 상황 콜백 (completed, total, message)
+        """
+        image_format = image_format.upper()
+        if image_format == 'JPG':
+            image_format = 'JPEG'
+        if image_format not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 포맷입니다: {image_format}")
+
+        self.image_format = image_format
+        self.options = dict(
+            image_format=image_format,
+            quality=max(1, min(100, int(quality))),
+            compress_level=max(0, min(9, int(compress_level))),
+            max_size=tuple(max_size) if max_size else None
+        )
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.progress_callback = progress_callback
+
+        self._cancel_event = threading.Event()
+
+    @property
+    def extension(self) -> str:
+        return EXPORT_FORMATS[self.image_format]
+
+    def cancel(self):
+        """진행 중인 내보내기 중지 (이미 인코딩 중인 이미지는 끝까지 처리)"""
+        self._cancel_event.set()
+
+    def export_to_folder(self, items: List[Tuple[str, str]], folder_path: str) -> List[str]:
+        """
+        폴더에 이미지 파일로 저장
+
+        Args:
+            items: (확장자를 제외한 파일 이름, 원본 이미지 경로) 리스트
+            folder_path: 저장 폴더
+
+        Returns:
+            List[str]: 저장된 파일 경로 (items 순서)
+
+        Raises:
+            ExportCancelled: 중지된 경우
+        """
+        os.makedirs(folder_path, exist_ok=True)
+        targets = [os.path.join(folder_path, f"{name}{self.extension}") for name, _ in items]
+
+        self._run(
+            [(export_image, (source, target)) for (_, source), target in zip(items, targets)],
+            lambda index, result: None
+        )
+        return targets
+
+    def export_to_zip(self, items: List[Tuple[str, str]], zip_path: str) -> str:
+        """
+        ZIP 파일 하나로 저장 (이미 압축된 이미지라 추가 압축 없이 저장)
+
+        Args:
+            items: (확장자를 제외한 파일 이름, 원본 이미지 경로) 리스트
+            zip_path: ZIP 파일 경로
+
+        Returns:
+            str: 저장된 ZIP 파일 경로
+
+        Raises:
+            ExportCancelled: 중지된 경우 (작성 중이던 ZIP 파일은 삭제)
+        """
+        tmp_path = f"{zip_path}.{os.getpid()}.tmp"
+        # 인코딩은 완료 순서대로 끝나지만 ZIP에는 items 순서대로 기록
+        pending: Dict[int, bytes] = {}
+        next_index = [0]
+
+        try:
+            with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_STORED) as archive:
+                def write_ready(index, data):
+                    pending[index] = data
+                    while next_index[0] in pending:
+                        name = items[next_index[0]][0]
+                        archive.writestr(f"{name}{self.extension}", pending.pop(next_index[0]))
+                        next_index[0] += 1
+
+                self._run([(encode_image, (source,)) for _, source in items], write_ready)
+
+            os.replace(tmp_path, zip_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        return zip_path
+
+    def _run(self, tasks: List[Tuple[Callable, tuple]], on_result: Callable):
+        """
+        작업을 프로세스 풀에서 실행하고 완료될 때마다 on_result(index, result) 호출
+
+        작업 프로세스를 띄울 수 없는 환경이면 남은 작업을 스레드 풀로 이어서 실행
+        (Tk와 여러 스레드가 돌고 있는 프로세스를 fork하지 않도록 spawn 방식 사용)
+        """
+        workers = min(self.max_workers, max(1, len(tasks)))
+        done = set()  # 완료된 작업 index
+
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        except (OSError, NotImplementedError, ValueError) as e:
+            print(f"프로세스 풀 사용 불가, 스레드로 내보내기: {e}")
+            executor = None
+
+        if executor is not None:
+            try:
+                with executor:
+                    self._collect(executor, tasks, on_result, done)
+                return
+            except _PoolUnavailable as e:
+                print(f"프로세스 풀 사용 불가, 스레드로 내보내기: {e}")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            self._collect(executor, tasks, on_result, done)
+
+    def _collect(self, executor, tasks: List[Tuple[Callable, tuple]], on_result: Callable, done: set):
+        """
+        done에 없는 작업만 실행하고 완료 순서대로 처리
+
+        Raises:
+            ExportCancelled: 중지된 경우
+            _PoolUnavailable: 작업 프로세스를 띄우지 못한 경우 (작업 자체의 오류는 그대로 전달)
+        """
+        total = len(tasks)
+        futures = {}
+
+        try:
+            for index, (fn, args) in enumerate(tasks):
+                if index in done:
+                    continue
+                try:
+                    futures[executor.submit(fn, *args, **self.options)] = index
+                except (OSError, BrokenProcessPool) as e:
+                    # 프로세스 생성은 첫 submit 때 일어나므로 여기서 실패가 드러남
+                    raise _PoolUnavailable(e) from e
+
+            for future in as_completed(futures):
+                if self._cancel_event.is_set():
+                    raise ExportCancelled()
+                try:
+                    result = future.result()
+                except BrokenProcessPool as e:
+                    raise _PoolUnavailable(e) from e
+
+                index = futures[future]
+                on_result(index, result)
+                done.add(index)
+                if self.progress_callback:
+                    self.progress_callback(len(done), total, f"이미지 {len(done)}/{total} 저장")
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
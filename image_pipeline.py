@@ -0,0 +1,251 @@
+# image_pipeline.py
+"""
+컷 이미지 생성 파이프라인 모듈
+대본 파싱 → 프롬프트 생성 → 이미지 생성 단계를 크기 제한 큐로 연결해 동시에 진행
+"""
+
+import queue
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+# 단계 종료 신호
+_DONE = object()
+
+
+class PipelineCancelled(Exception):
+    """파이프라인이 중지되었음을 알리는 예외"""
+
+
+class ImagePipeline:
+    def __init__(
+        self,
+        generator,
+        model: str = None,
+        aspect_ratio: str = "16:9",
+        prompt_options: Optional[Dict] = None,
+        prompt_workers: int = 1,
+        image_workers: int = 4,
+        batch_size: int = 1,
+        queue_size: int = 8,
+        progress_callback: Optional[Callable] = None,
+        result_callback: Optional[Callable] = None
+    ):
+        """
+        이미지 생성 파이프라인 초기화
+
+        Args:
+            generator: GeminiImageGenerator 인스턴스
+            model: 이미지 생성 모델
+            aspect_ratio: 이미지 비율 ("16:9" 또는 "9:16")
+            prompt_options: generate_image_prompts에 전달할 스타일 옵션
+                            (style, mood, color, lighting, camera)
+            prompt_workers: 프롬프트 생성 스레드 수
+            image_workers: 이미지 생성 스레드 수
+            batch_size: 한 번에 묶어서 요청할 최대 컷 수 (큐에 대기 중인 컷만 묶음)
+            queue_size: 단계 사이 큐의 최대 크기 (가득 차면 앞 단계가 대기,
+                        배치 하나가 큐에 모두 들어가도록 batch_size보다 작으면 batch_size로 늘림)
+            progress_callback: 진행 상황 콜백 (completed, total, message)
+                               (total은 전체 컷 수, 이터러블 입력이 끝나기 전에는 None)
+            result_callback: 컷 이미지가 완성될 때마다 호출 (cut_result)
+        """
+        self.generator = generator
+        self.model = model
+        self.aspect_ratio = aspect_ratio
+        self.prompt_options = prompt_options or {}
+        self.prompt_workers = max(1, prompt_workers)
+        self.image_workers = max(1, image_workers)
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(self.batch_size, queue_size)
+        self.progress_callback = progress_callback
+        self.result_callback = result_callback
+
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """진행 중인 파이프라인 중지 (진행 중인 API 요청은 끝까지 기다림)"""
+        self._cancel_event.set()
+
+    def run(self, cuts: Iterable[Dict]) -> List[Dict]:
+        """
+        파이프라인 실행 (완료될 때까지 대기)
+
+        Args:
+            cuts: 컷 리스트 또는 컷을 순서대로 내보내는 이터러블
+
+        Returns:
+            List[Dict]: 이미지가 추가된 컷 리스트 (컷 순서 유지, 중지 시 완료된 컷만)
+        """
+        prompt_queue = queue.Queue(maxsize=self.queue_size)
+        image_queue = queue.Queue(maxsize=self.queue_size)
+
+        results = {}
+        # 리스트처럼 길이를 알 수 있으면 처음부터 전체 컷 수로 진행률 표시
+        total = len(cuts) if hasattr(cuts, '__len__') else None
+        state = {'fed': 0, 'completed': 0, 'total': total, 'prompt_alive': self.prompt_workers}
+        errors = []
+
+        def fail(error: Exception):
+            with self._lock:
+                errors.append(error)
+            self.cancel()
+
+        def feeder():
+            try:
+                for cut in cuts:
+                    with self._lock:
+                        index = state['fed']
+                        state['fed'] += 1
+                    self._put(prompt_queue, (index, cut))
+
+                # 이터러블 입력도 끝까지 받은 뒤에는 전체 컷 수를 알 수 있음
+                with self._lock:
+                    state['total'] = state['fed']
+            except PipelineCancelled:
+                pass
+            except Exception as e:
+                fail(e)
+            finally:
+                for _ in range(self.prompt_workers):
+                    self._put_final(prompt_queue)
+
+        def prompt_worker():
+            try:
+                finished = False
+                while not finished:
+                    batch, finished = self._take_batch(prompt_queue)
+                    if not batch:
+                        break
+
+                    indices = [index for index, _ in batch]
+                    cuts_with_prompts = self.generator.generate_image_prompts(
+                        cuts=[cut for _, cut in batch],
+                        batch_size=len(batch),
+                        flush=False,
+                        **self.prompt_options
+                    )
+
+                    for index, cut in zip(indices, cuts_with_prompts):
+                        self._put(image_queue, (index, cut))
+            except PipelineCancelled:
+                pass
+            except Exception as e:
+                fail(e)
+            finally:
+                # 마지막 프롬프트 스레드가 이미지 단계에 종료 신호 전달
+                with self._lock:
+                    state['prompt_alive'] -= 1
+                    last = state['prompt_alive'] == 0
+                if last:
+                    for _ in range(self.image_workers):
+                        self._put_final(image_queue)
+
+        def image_worker():
+            try:
+                while True:
+                    item = self._get(image_queue)
+                    if item is _DONE:
+                        break
+
+                    index, cut = item
+                    image, error = self.generator.generate_single_image(
+                        prompt=cut['image_prompt'],
+                        model=self.model,
+                        aspect_ratio=self.aspect_ratio
+                    )
+
+                    cut_result = cut.copy()
+                    cut_result['generated_image'] = image
+                    cut_result['image_error'] = error
+
+                    with self._lock:
+                        results[index] = cut_result
+                        state['completed'] += 1
+                        completed = state['completed']
+                        total = state['total']
+
+                    if self.result_callback:
+                        self.result_callback(cut_result)
+                    if self.progress_callback:
+                        self.progress_callback(completed, total, f"컷 {cut['cut_number']} 이미지 완료")
+            except PipelineCancelled:
+                pass
+            except Exception as e:
+                fail(e)
+
+        threads = [threading.Thread(target=feeder, daemon=True)]
+        threads += [threading.Thread(target=prompt_worker, daemon=True) for _ in range(self.prompt_workers)]
+        threads += [threading.Thread(target=image_worker, daemon=True) for _ in range(self.image_workers)]
+
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        finally:
+            # 프롬프트 캐시는 배치마다가 아니라 파이프라인이 끝날 때(중지/오류 포함) 한 번만 기록
+            if self.generator.prompt_cache:
+                self.generator.prompt_cache.flush()
+
+        if errors:
+            raise errors[0]
+
+        return [results[index] for index in sorted(results)]
+
+    def _take_batch(self, source: queue.Queue) -> tuple:
+        """
+        대기 중인 컷을 최대 batch_size개까지 꺼냄 (첫 컷은 도착할 때까지 대기)
+
+        Returns:
+            tuple: ((index, cut) 리스트, 종료 신호 수신 여부)
+        """
+        first = self._get(source)
+        if first is _DONE:
+            return [], True
+
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                item = source.get_nowait()
+            except queue.Empty:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    def _put(self, target: queue.Queue, item):
+        """큐에 여유가 생길 때까지 대기하며 추가 (중지 시 예외)"""
+        while True:
+            if self.cancelled:
+                raise PipelineCancelled()
+            try:
+                target.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _put_final(self, target: queue.Queue):
+        """종료 신호 추가 (중지된 경우 대기 중인 스레드는 스스로 종료하므로 생략)"""
+        while not self.cancelled:
+            try:
+                target.put(_DONE, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, source: queue.Queue):
+        """항목이 도착할 때까지 대기하며 꺼냄 (중지 시 예외)"""
+        while True:
+            if self.cancelled:
+                raise PipelineCancelled()
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                continue
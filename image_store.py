@@ -0,0 +1,244 @@
+# image_store.py
+"""
+생성 이미지 저장소 모듈
+생성된 이미지를 인코딩된 파일 그대로 디스크에 두고, 컷 정보에는 가벼운 핸들만 보관
+디코딩은 표시/저장할 때만 하며 디코딩된 이미지는 용량 기준 LRU로 일부만 메모리에 유지
+미리보기 크기 썸네일은 이미지가 도착할 때(생성 스레드에서) 한 번만 만들어 이미지별로 캐시
+"""
+
+import atexit
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+from PIL import Image
+
+from image_cache import MemoryLRUCache, image_nbytes
+
+
+# 저장 파일 확장자별 PIL 포맷
+_FORMATS = {'.png': 'PNG', '.jpg': 'JPEG', '.jpeg': 'JPEG', '.webp': 'WEBP'}
+
+# PIL 포맷별 저장 확장자
+_EXTENSIONS = {'PNG': '.png', 'JPEG': '.jpg', 'WEBP': '.webp'}
+
+# 이미지가 도착할 때 미리 만들어 둘 미리보기 크기 (결과 카드 표시 크기)
+PREVIEW_SIZES = ((256, 256),)
+
+
+class ImageHandle:
+    """디스크에 저장된 이미지 참조 (컷 정보에 넣어도 메모리를 거의 차지하지 않음)"""
+
+    __slots__ = ('store', 'key', 'ext', 'size')
+
+    def __init__(self, store: 'ImageStore', key: str, ext: str, size: Tuple[int, int]):
+        self.store = store
+        self.key = key  # 인코딩된 데이터의 해시 (같은 이미지는 같은 키)
+        self.ext = ext
+        self.size = size
+
+    @property
+    def width(self) -> int:
+        return self.size[0]
+
+    @property
+    def height(self) -> int:
+        return self.size[1]
+
+    @property
+    def path(self) -> Path:
+        return self.store.directory / f"{self.key}{self.ext}"
+
+    def load(self) -> Image.Image:
+        """
+        디코딩된 이미지 반환 (LRU에 있으면 재사용, 반환된 이미지는 수정하지 말 것)
+        """
+        return self.store.load(self)
+
+    def thumbnail(self, max_size: Tuple[int, int]) -> Image.Image:
+        """
+        표시용 축소 이미지 반환 (원본 비율 유지, 한 번 만든 크기는 캐시에서 재사용)
+
+        Args:
+            max_size: 최대 (너비, 높이)
+        """
+        return self.store.thumbnail(self, max_size)
+
+    def read_bytes(self) -> bytes:
+        """인코딩된 원본 데이터"""
+        return self.path.read_bytes()
+
+    def save(self, file_path: str):
+        """
+        파일로 저장 (확장자가 원본 포맷과 같으면 다시 인코딩하지 않고 그대로 복사)
+
+        Args:
+            file_path: 저장 경로 (확장자로 포맷 결정)
+        """
+        target_ext = os.path.splitext(file_path)[1].lower()
+        if _FORMATS.get(target_ext) == _FORMATS.get(self.ext):
+            shutil.copyfile(self.path, file_path)
+            return
+
+        image = self.load()
+        if _FORMATS.get(target_ext) == 'JPEG' and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        image.save(file_path)
+
+    def __repr__(self) -> str:
+        return f"ImageHandle({self.key[:12]}{self.ext}, {self.width}x{self.height})"
+
+
+class ImageStore:
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        decoded_bytes: int = 96 * 1024 * 1024,
+        thumbnail_bytes: int = 32 * 1024 * 1024,
+        preview_sizes: Sequence[Tuple[int, int]] = PREVIEW_SIZES
+    ):
+        """
+        이미지 저장소 초기화
+
+        Args:
+            directory: 이미지 파일 디렉토리 (기본: 세션별 임시 디렉토리, 종료 시 삭제)
+            decoded_bytes: 디코딩된 이미지를 메모리에 유지할 최대 용량
+            thumbnail_bytes: 썸네일을 메모리에 유지할 최대 용량
+            preview_sizes: 저장할 때 미리 만들어 둘 썸네일 크기
+        """
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix='youtube_maker_images_')
+            atexit.register(shutil.rmtree, directory, True)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.preview_sizes = sorted(preview_sizes, key=lambda size: size[0] * size[1], reverse=True)
+
+        self._decoded = MemoryLRUCache(decoded_bytes, sizeof=image_nbytes)
+        self._thumbnails = MemoryLRUCache(thumbnail_bytes, sizeof=image_nbytes)  # (key, 크기) -> 썸네일
+        self._lock = threading.Lock()
+
+    def put_bytes(self, data: bytes) -> ImageHandle:
+        """
+        인코딩된 이미지 데이터를 그대로 저장하고 미리보기 썸네일 생성
+
+        원본 디코딩은 썸네일을 만들 때 한 번만 하며 메모리에 남기지 않음
+
+        Args:
+            data: PNG/JPEG/WebP 등 인코딩된 이미지 데이터
+
+        Returns:
+            ImageHandle: 저장된 이미지 핸들
+        """
+        with Image.open(io.BytesIO(data)) as image:
+            size = image.size
+            ext = _EXTENSIONS.get(image.format, '.img')
+
+        key = hashlib.sha256(data).hexdigest()
+        path = self.directory / f"{key}{ext}"
+
+        # 같은 이미지는 한 번만 저장
+        with self._lock:
+            if not path.exists():
+                tmp_path = self.directory / f".{key}.{threading.get_ident()}.tmp"
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+
+        handle = ImageHandle(self, key, ext, size)
+        self.precompute_thumbnails(handle, data)
+        return handle
+
+    def put_image(self, image: Image.Image) -> ImageHandle:
+        """
+        PIL 이미지를 PNG로 인코딩해 저장
+
+        Args:
+            image: 저장할 이미지
+
+        Returns:
+            ImageHandle: 저장된 이미지 핸들
+        """
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG')
+        return self.put_bytes(buffer.getvalue())
+
+    def load(self, handle: ImageHandle) -> Image.Image:
+        """
+        핸들의 이미지를 디코딩해 반환 (최근 사용한 이미지는 메모리에서 재사용)
+        """
+        image = self._decoded.get(handle.key)
+        if image is None:
+            with Image.open(handle.path) as opened:
+                opened.load()
+                image = opened
+            self._decoded.put(handle.key, image)
+        return image
+
+    def precompute_thumbnails(self, handle: ImageHandle, data: Optional[bytes] = None):
+        """
+        preview_sizes의 썸네일을 큰 크기부터 차례로 생성 (작은 크기는 직전 크기에서 축소)
+
+        Args:
+            handle: 이미지 핸들
+            data: 인코딩된 데이터 (있으면 파일을 다시 읽지 않음)
+        """
+        missing = [size for size in self.preview_sizes if (handle.key, size) not in self._thumbnails]
+        if not missing:
+            return
+
+        try:
+            source = Image.open(io.BytesIO(data) if data is not None else handle.path)
+            source.load()
+        except Exception as e:
+            print(f"썸네일 생성 실패: {e}")
+            return
+
+        for size in self.preview_sizes:
+            thumbnail = self._thumbnails.get((handle.key, size))
+            if thumbnail is None:
+                thumbnail = _shrink(source, size)
+                self._thumbnails.put((handle.key, size), thumbnail)
+            source = thumbnail
+
+    def thumbnail(self, handle: ImageHandle, max_size: Tuple[int, int]) -> Image.Image:
+        """
+        핸들의 썸네일 반환 (캐시에 없으면 원본을 디코딩해 생성, 반환된 이미지는 수정하지 말 것)
+        """
+        max_size = tuple(max_size)
+        thumbnail = self._thumbnails.get((handle.key, max_size))
+        if thumbnail is None:
+            thumbnail = _shrink(self.load(handle), max_size)
+            self._thumbnails.put((handle.key, max_size), thumbnail)
+        return thumbnail
+
+    def clear_decoded(self):
+        """디코딩된 이미지와 썸네일 메모리 캐시 비우기 (디스크 파일은 유지)"""
+        self._decoded.clear()
+        self._thumbnails.clear()
+
+
+def _shrink(image: Image.Image, max_size: Tuple[int, int]) -> Image.Image:
+    """비율을 유지하며 max_size 안에 들어가도록 축소한 복사본"""
+    thumbnail = image.copy()
+    thumbnail.thumbnail(max_size, Image.Resampling.LANCZOS)
+    return thumbnail
+
+
+_shared_store = None
+_shared_lock = threading.Lock()
+
+
+def get_image_store() -> ImageStore:
+    """
+    프로세스 전체에서 공유하는 이미지 저장소 반환
+    """
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = ImageStore()
+        return _shared_store
@@ -4,34 +4,35 @@
 가사에서 각 줄별 이미지 생성을 위한 프롬프트 생성 및 이미지 생성
 """
 
-from google import genai
-from google.genai import types
-from PIL import Image
-import google.generativeai as genai_legacy
 from typing import Optional, List, Dict, Tuple
-import time
-import io
+import json
+from gemini_image_generator import parse_batch_prompt_response
+from gemini_client_pool import GeminiClientPool, get_gemini_client_pool
+from image_cache import load_or_generate_image
+from image_store import ImageHandle
 
 
 class MusicImageGenerator:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, client_pool: Optional[GeminiClientPool] = None):
         """
         음악 이미지 생성기 초기화
 
         Args:
             api_key: Gemini API 키
+            client_pool: 공유 클라이언트 풀 (기본: API 키별 공유 풀)
         """
         if not api_key or len(api_key) < 10:
             raise ValueError("유효한 Gemini API 키가 필요합니다.")
 
         self.api_key = api_key
+        self.client_pool = client_pool or get_gemini_client_pool(api_key)
 
-        # 새로운 google-genai 클라이언트 (이미지 생성용)
-        self.client = genai.Client(api_key=api_key)
+        # google-genai 클라이언트 (이미지 생성용, 다른 생성기와 연결 풀 공유)
+        self.client = self.client_pool.client
 
-        # 기존 google-generativeai 라이브러리 (텍스트 생성용)
-        genai_legacy.configure(api_key=api_key)
-        self.text_model = genai_legacy.GenerativeModel('gemini-2.5-flash')
+        # google-generativeai 모델 (텍스트 생성용)
+        self.text_model_name = 'gemini-2.5-flash'
+        self.text_model = self.client_pool.text_model(self.text_model_name)
 
         # 지원 모델
         self.supported_models = {
@@ -194,17 +195,11 @@ Create a detailed image generation prompt for a music video visual based on the
 【Output Format】
 Return ONLY the image generation prompt, nothing else. No quotes, no labels, just the prompt text."""
 
-        for attempt in range(max_retries):
-            try:
-                response = self.text_model.generate_content(prompt)
-                return response.text.strip()
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                else:
-                    # 기본 프롬프트 반환
-                    return f"{style_keyword}, {lyric_line}, {mood_keyword}, {color_keyword}, {lighting} lighting, {camera} shot"
+        try:
+            return self.client_pool.generate_text(self.text_model_name, prompt, max_retries)
+        except Exception:
+            # 기본 프롬프트 반환
+            return f"{style_keyword}, {lyric_line}, {mood_keyword}, {color_keyword}, {lighting} lighting, {camera} shot"
 
     def generate_all_prompts(
         self,
@@ -219,7 +214,8 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
         color: str = "Vibrant & Colorful",
         lighting: str = "Natural Sunlight",
         camera: str = "Wide Angle",
-        progress_callback=None
+        progress_callback=None,
+        batch_size: int = 1
     ) -> List[Dict]:
         """
         모든 컷에 대해 이미지 프롬프트 생성
@@ -237,17 +233,51 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
             lighting: 조명
             camera: 카메라
             progress_callback: 진행 상황 콜백 함수
+            batch_size: 한 번의 요청으로 처리할 컷 수 (1이면 컷별 요청)
 
         Returns:
             List[Dict]: 이미지 프롬프트가 추가된 컷 리스트
         """
         results = []
         total = len(cuts)
+        # 진행률은 요청이 끝난 뒤 완료된 컷 수로 보고 (배치에서 빠진 컷은 이어서 개별 요청하며 증가)
+        completed = 0
+
+        # 배치 모드: batch_size개 컷씩 묶어서 요청
+        batch_prompts = {}
+        if batch_size > 1:
+            for start in range(0, total, batch_size):
+                batch = cuts[start:start + batch_size]
+                batch_prompts.update(self._request_batch_image_prompts(
+                    cuts=batch,
+                    song_title=song_title,
+                    visual_concept=visual_concept,
+                    genre=genre,
+                    tempo=tempo,
+                    music_mood=music_mood,
+                    style=style,
+                    visual_mood=visual_mood,
+                    color=color,
+                    lighting=lighting,
+                    camera=camera
+                ))
+
+                completed += sum(1 for cut in batch if cut['cut_number'] in batch_prompts)
+                if progress_callback:
+                    progress_callback(
+                        completed, total,
+                        f"컷 {batch[0]['cut_number']}-{batch[-1]['cut_number']} 프롬프트 생성 완료"
+                    )
 
-        for i, cut in enumerate(cuts):
-            if progress_callback:
-                progress_callback(i + 1, total, f"컷 {cut['cut_number']} 프롬프트 생성 중...")
+        for cut in cuts:
+            image_prompt = batch_prompts.get(cut['cut_number'])
+            if image_prompt is not None:
+                cut_result = cut.copy()
+                cut_result['image_prompt'] = image_prompt
+                results.append(cut_result)
+                continue
 
+            # 배치 응답에서 빠진 컷은 개별 요청
             image_prompt = self.generate_image_prompt(
                 lyric_line=cut['lyrics'],
                 song_title=song_title,
@@ -262,71 +292,129 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
                 camera=camera
             )
 
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, f"컷 {cut['cut_number']} 프롬프트 생성 완료")
+
             cut_result = cut.copy()
             cut_result['image_prompt'] = image_prompt
             results.append(cut_result)
 
         return results
 
+    def _request_batch_image_prompts(
+        self,
+        cuts: List[Dict],
+        song_title: str,
+        visual_concept: str,
+        genre: str,
+        tempo: str,
+        music_mood: str,
+        style: str,
+        visual_mood: str,
+        color: str,
+        lighting: str,
+        camera: str,
+        max_retries: int = 3
+    ) -> Dict[int, str]:
+        """
+        여러 가사 줄의 이미지 프롬프트를 한 번의 요청으로 생성 (JSON 입출력)
+
+        Returns:
+            Dict[int, str]: 컷 번호 -> 이미지 프롬프트 (응답에 없는 컷은 제외)
+        """
+        if not cuts:
+            return {}
+
+        style_keyword = self.style_descriptions.get(style, style)
+        color_keyword = self.color_descriptions.get(color, color)
+        tempo_keyword = self.tempo_descriptions.get(tempo, tempo)
+        mood_keyword = self.music_mood_descriptions.get(music_mood, music_mood)
+
+        lines = [{'cut_number': cut['cut_number'], 'lyrics': cut['lyrics']} for cut in cuts]
+        lines_json = json.dumps(lines, ensure_ascii=False, indent=2)
+
+        prompt = f"""You are an expert image prompt engineer for AI image generation.
+Create a detailed image generation prompt for a music video visual for EACH of the following lyrics lines (JSON array), based on the music information.
+
+【Lyrics Lines】
+{lines_json}
+
+【Music Information】
+- Song Title: {song_title if song_title else 'Not specified'}
+- Genre: {genre}
+- Tempo: {tempo_keyword}
+- Mood: {mood_keyword}
+- Visual Concept/Theme: {visual_concept if visual_concept else 'Create appropriate visuals based on the lyrics'}
+
+【Visual Style Requirements】
+- Visual Style: {style_keyword}
+- Atmosphere: {visual_mood}
+- Color Palette: {color_keyword}
+- Lighting: {lighting}
+- Camera: {camera}
+
+【Output Requirements】
+1. Write every prompt entirely in English
+2. Create a vivid visual scene that represents the emotion and meaning of each lyrics line
+3. Incorporate the music's mood, tempo, and genre into the visual atmosphere
+4. If visual concept is provided, integrate it with the lyrics meaning
+5. Include specific details about composition, colors, lighting, and atmosphere
+6. Keep each prompt concise but comprehensive (2-4 sentences)
+7. Write each prompt so it stands on its own; do not refer to other lines
+8. CRITICAL: The images must contain NO TEXT, NO LETTERS, NO WORDS, NO CAPTIONS, NO SUBTITLES, NO WATERMARKS, NO WRITING of any kind. These are pure visual images without any textual elements.
+
+【Output Format】
+Return ONLY a JSON array with exactly one object per lyrics line, in the same order, like:
+[{{"cut_number": 1, "image_prompt": "..."}}, {{"cut_number": 2, "image_prompt": "..."}}]
+No explanations, no markdown."""
+
+        cut_numbers = [cut['cut_number'] for cut in cuts]
+
+        try:
+            return parse_batch_prompt_response(
+                self.client_pool.generate_text(self.text_model_name, prompt, max_retries), cut_numbers)
+        except Exception:
+            # 배치 실패 시 빈 결과 -> 호출 측에서 컷별 요청으로 대체
+            return {}
+
     def generate_single_image(
         self,
         prompt: str,
         model: str = None,
         aspect_ratio: str = "16:9",
-        max_retries: int = 3
-    ) -> Tuple[Optional[Image.Image], Optional[str]]:
+        max_retries: int = 3,
+        use_cache: bool = True
+    ) -> Tuple[Optional[ImageHandle], Optional[str]]:
         """
-        단일 이미지 생성
+        단일 이미지 생성 (이미지는 디스크 저장소에 두고 핸들만 반환)
 
         Args:
             prompt: 이미지 생성 프롬프트 (영어)
             model: 사용할 모델
             aspect_ratio: 이미지 비율 ("16:9" 또는 "9:16")
             max_retries: 최대 재시도 횟수
+            use_cache: 캐시된 이미지 사용 여부 (False면 항상 새로 생성)
 
         Returns:
-            Tuple[Image, error_message]: 생성된 이미지와 에러 메시지
+            Tuple[ImageHandle, error_message]: 생성된 이미지의 저장소 핸들(PIL.Image가 아님,
+                                               표시할 때 load()로 디코딩)과 에러 메시지
         """
         if model is None:
             model = self.default_model
 
-        for attempt in range(max_retries):
-            try:
-                response = self.client.models.generate_content(
-                    model=model,
-                    contents=prompt,
-                    config=types.GenerateContentConfig(
-                        response_modalities=['TEXT', 'IMAGE'],
-                        image_config=types.ImageConfig(
-                            aspect_ratio=aspect_ratio,
-                        )
-                    )
-                )
-
-                # 응답에서 이미지 추출
-                for part in response.candidates[0].content.parts:
-                    if part.inline_data is not None:
-                        # 이미지 데이터를 PIL Image로 변환
-                        image_data = part.inline_data.data
-                        image = Image.open(io.BytesIO(image_data))
-                        return image, None
-
-                return None, "이미지가 응답에 포함되지 않았습니다."
-
-            except Exception as e:
-                error_msg = str(e)
-
-                # Rate Limit 처리
-                if "429" in error_msg or "quota" in error_msg.lower() or "resource_exhausted" in error_msg.lower():
-                    if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt) * 3
-                        time.sleep(wait_time)
-                        continue
-
-                if attempt == max_retries - 1:
-                    return None, f"이미지 생성 실패: {error_msg}"
+        try:
+            image = load_or_generate_image(
+                prompt, model, aspect_ratio,
+                lambda: self.client_pool.generate_image(model, prompt, aspect_ratio, max_retries),
+                use_cache
+            )
+        except Exception as e:
+            return None, f"이미지 생성 실패: {str(e)}"
 
-        return None, "알 수 없는 오류"
+        if image is None:
+            return None, "이미지가 응답에 포함되지 않았습니다."
+        return image, None
 
     def generate_all_images(
         self,
@@ -365,10 +453,6 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
             cut_result['image_error'] = error
             results.append(cut_result)
 
-            # API 호출 간 딜레이
-            if i < total - 1:
-                time.sleep(1)
-
         return results
 
     def regenerate_cut_image(
@@ -390,7 +474,13 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
         Returns:
             Dict: 업데이트된 컷 정보
         """
-        image, error = self.generate_single_image(prompt=new_prompt, model=model, aspect_ratio=aspect_ratio)
+        # 재생성은 항상 새 이미지를 요청 (결과는 캐시에 갱신됨)
+        image, error = self.generate_single_image(
+            prompt=new_prompt,
+            model=model,
+            aspect_ratio=aspect_ratio,
+            use_cache=False
+        )
 
         cut_result = cut.copy()
         cut_result['image_prompt'] = new_prompt
@@ -407,7 +497,6 @@ Return ONLY the image generation prompt, nothing else. No quotes, no labels, jus
             bool: 연결 성공 여부
         """
         try:
-            response = self.text_model.generate_content("Say hello")
-            return bool(response and response.text)
+            return bool(self.client_pool.generate_text(self.text_model_name, "Say hello", max_retries=1))
         except Exception:
             return False
@@ -0,0 +1,171 @@
+# prompt_cache.py
+"""
+이미지 프롬프트 캐시 모듈
+정규화된 요청 텍스트와 모델 이름을 키로 생성된 프롬프트를 저장 (TTL/개수 제한)
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+
+class PromptCache:
+    def __init__(
+        self,
+        cache_file: Optional[Path] = None,
+        ttl_seconds: int = 30 * 24 * 3600,
+        max_entries: int = 5000
+    ):
+        """
+        프롬프트 캐시 초기화
+
+        Args:
+            cache_file: 캐시 파일 경로 (기본: ~/.youtube_maker/prompt_cache.json)
+            ttl_seconds: 항목 유효 시간 (기본 30일)
+            max_entries: 최대 항목 수 (초과 시 오래 사용하지 않은 항목부터 삭제)
+        """
+        if cache_file is None:
+            cache_file = Path.home() / '.youtube_maker' / 'prompt_cache.json'
+        self.cache_file = Path(cache_file)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # 이전 스냅샷이 새 스냅샷을 덮어쓰지 않도록 저장 순서 보장
+        self._entries = OrderedDict()  # key -> {"value", "created"}, 오래 사용하지 않은 순
+        self._dirty = False
+
+        self._load()
+
+    def _load(self):
+        """캐시 파일 로드 (만료 항목 제외)"""
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"프롬프트 캐시 로드 실패: {e}")
+            return
+
+        now = time.time()
+        for key, entry in data.get('entries', []):
+            if now - entry.get('created', 0) < self.ttl_seconds:
+                self._entries[key] = entry
+
+    @staticmethod
+    def make_key(request_text: str, model: str) -> str:
+        """정규화된 요청 텍스트와 모델 이름으로 캐시 키 생성"""
+        normalized = re.sub(r'\s+', ' ', request_text).strip()
+        payload = f"{model}\n{normalized}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, request_text: str, model: str) -> Optional[str]:
+        """
+        캐시된 프롬프트 조회
+
+        Args:
+            request_text: 텍스트 모델에 보낼 요청 프롬프트
+            model: 텍스트 모델 이름
+
+        Returns:
+            str: 캐시된 프롬프트 (없거나 만료되면 None)
+        """
+        key = self.make_key(request_text, model)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry['created'] >= self.ttl_seconds:
+                del self._entries[key]
+                self._dirty = True
+                return None
+            # 사용 순서만 바뀐 것은 저장하지 않음 (다음 저장 때 함께 반영)
+            self._entries.move_to_end(key)
+            return entry['value']
+
+    def contains(self, request_text: str, model: str) -> bool:
+        """
+        캐시된 프롬프트 존재 여부 (사용 순서를 바꾸지 않는 조회)
+
+        Args:
+            request_text: 텍스트 모델에 보낼 요청 프롬프트
+            model: 텍스트 모델 이름
+        """
+        key = self.make_key(request_text, model)
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.time() - entry['created'] < self.ttl_seconds
+
+    def set(self, request_text: str, model: str, value: str):
+        """
+        프롬프트 저장 (파일 반영은 flush 호출 시)
+        """
+        key = self.make_key(request_text, model)
+        with self._lock:
+            self._entries[key] = {'value': value, 'created': time.time()}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def flush(self) -> bool:
+        """
+        변경 사항을 파일에 저장 (임시 파일 작성 후 교체)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                data = {'entries': list(self._entries.items())}
+                self._dirty = False
+
+            tmp_file = self.cache_file.with_name(
+                f".{self.cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_file, self.cache_file)
+                return True
+            except Exception as e:
+                print(f"프롬프트 캐시 저장 실패: {e}")
+                with self._lock:
+                    self._dirty = True
+                return False
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+        self.flush()
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_prompt_cache() -> Optional[PromptCache]:
+    """
+    프로세스 전체에서 공유하는 프롬프트 캐시 반환 (생성 실패 시 None)
+    """
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            try:
+                _shared_cache = PromptCache()
+            except OSError as e:
+                print(f"프롬프트 캐시 초기화 실패: {e}")
+                return None
+        return _shared_cache
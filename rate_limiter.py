@@ -0,0 +1,261 @@
+# rate_limiter.py
+"""
+Gemini API 요청 속도 제한 모듈
+모든 Gemini 호출이 공유하는 프로세스 단위 토큰 버킷 (모델별 RPM/TPM)
+"""
+
+import re
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+
+# 모델별 기본 한도 (분당 요청 수, 분당 토큰 수)
+DEFAULT_LIMITS = {
+    "gemini-2.5-flash": {"rpm": 60, "tpm": 1000000},
+    "gemini-2.5-flash-image": {"rpm": 30, "tpm": 500000},
+    "gemini-3-pro-image-preview": {"rpm": 20, "tpm": 500000},
+}
+
+# 등록되지 않은 모델에 적용할 한도
+FALLBACK_LIMITS = {"rpm": 30, "tpm": 500000}
+
+T = TypeVar('T')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    프롬프트 토큰 수 대략 추정 (한글/영문 혼합 기준 약 3자당 1토큰)
+    """
+    if not text:
+        return 1
+    return max(1, len(text) // 3)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    Rate Limit(429/quota) 오류 여부 확인
+    """
+    error_msg = str(error).lower()
+    return "429" in error_msg or "quota" in error_msg or "resource_exhausted" in error_msg
+
+
+def retry_after_from_error(error: Exception) -> Optional[float]:
+    """
+    오류에서 서버가 지정한 재시도 대기 시간(초) 추출
+
+    Retry-After 헤더, retryDelay 필드, "retry in Ns" 문구 순으로 확인
+    """
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if headers:
+        try:
+            value = headers.get('Retry-After') or headers.get('retry-after')
+            if value:
+                return float(value)
+        except (TypeError, ValueError):
+            pass
+
+    error_msg = str(error)
+    patterns = [
+        r'retryDelay["\']?\s*[:=]\s*["\']?([\d.]+)s',
+        r'retry in ([\d.]+)\s*s',
+        r'retry_delay\s*\{\s*seconds:\s*(\d+)',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, error_msg, re.IGNORECASE)
+        if match:
+            try:
+                return float(match.group(1))
+            except ValueError:
+                continue
+
+    return None
+
+
+class _TokenBucket:
+    def __init__(self, per_minute: float, burst: Optional[float] = None):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            per_minute: 분당 허용량
+            burst: 한 번에 몰아서 쓸 수 있는 최대량 (기본: 분당 허용량의 1/10)
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = burst if burst else max(1.0, per_minute / 10.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        amount만큼 예약하고 대기해야 할 시간(초) 반환 (잠금 상태에서 호출)
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        # 버킷보다 큰 요청은 버킷 크기만큼만 기다림
+        amount = min(amount, self.capacity)
+        self.tokens -= amount
+
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class RateLimiter:
+    def __init__(self, limits: Optional[Dict[str, Dict]] = None):
+        """
+        속도 제한기 초기화
+
+        Args:
+            limits: 모델별 한도 {"모델명": {"rpm": int, "tpm": int}}
+        """
+        self._lock = threading.Lock()
+        self._limits = {model: dict(limit) for model, limit in DEFAULT_LIMITS.items()}
+        self._request_buckets = {}
+        self._token_buckets = {}
+        self._blocked_until = {}
+
+        if limits:
+            for model, limit in limits.items():
+                self.configure(model, rpm=limit.get('rpm'), tpm=limit.get('tpm'))
+
+    def configure(self, model: str, rpm: Optional[int] = None, tpm: Optional[int] = None):
+        """
+        모델별 한도 설정
+
+        Args:
+            model: 모델 이름
+            rpm: 분당 요청 수
+            tpm: 분당 토큰 수
+        """
+        with self._lock:
+            limit = self._limits.setdefault(model, dict(FALLBACK_LIMITS))
+            if rpm:
+                limit['rpm'] = rpm
+            if tpm:
+                limit['tpm'] = tpm
+
+            # 다음 요청부터 새 한도로 버킷 재생성
+            self._request_buckets.pop(model, None)
+            self._token_buckets.pop(model, None)
+
+    def get_limits(self) -> Dict[str, Dict]:
+        """
+        현재 모델별 한도 반환
+        """
+        with self._lock:
+            return {model: dict(limit) for model, limit in self._limits.items()}
+
+    def acquire(self, model: str, tokens: int = 0):
+        """
+        요청 전 호출. 한도 내에서 요청이 가능해질 때까지 대기
+
+        Args:
+            model: 모델 이름
+            tokens: 예상 토큰 수
+        """
+        with self._lock:
+            now = time.monotonic()
+            limit = self._limits.get(model, FALLBACK_LIMITS)
+
+            if model not in self._request_buckets:
+                self._request_buckets[model] = _TokenBucket(limit['rpm'])
+                self._token_buckets[model] = _TokenBucket(limit['tpm'])
+
+            wait = max(
+                self._request_buckets[model].reserve(1, now),
+                self._token_buckets[model].reserve(tokens, now) if tokens else 0.0,
+                self._blocked_until.get(model, 0.0) - now
+            )
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def backoff(self, model: str, seconds: float):
+        """
+        해당 모델의 모든 요청을 지정 시간 동안 보류
+
+        Args:
+            model: 모델 이름
+            seconds: 보류 시간(초)
+        """
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._blocked_until[model] = max(self._blocked_until.get(model, 0.0), until)
+
+    def report_rate_limit(self, model: str, error: Exception, attempt: int, base_delay: float = 2) -> float:
+        """
+        429 응답 보고. Retry-After가 있으면 그 값을, 없으면 지수 백오프 적용
+
+        Args:
+            model: 모델 이름
+            error: 발생한 오류
+            attempt: 현재 재시도 횟수 (0부터)
+            base_delay: 지수 백오프 기본 대기 시간(초)
+
+        Returns:
+            float: 적용된 대기 시간(초)
+        """
+        wait_time = retry_after_from_error(error)
+        if wait_time is None:
+            wait_time = (2 ** attempt) * base_delay
+
+        self.backoff(model, wait_time)
+        return wait_time
+
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    프로세스 전체에서 공유하는 속도 제한기 반환
+    """
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter()
+        return _shared_limiter
+
+
+def request_with_retry(
+    model: str,
+    prompt: str,
+    request: Callable[[], T],
+    max_retries: int = 3,
+    base_delay: float = 1
+) -> T:
+    """
+    공유 속도 제한기를 거쳐 요청하고 실패하면 재시도
+
+    Rate Limit은 대기 시간(Retry-After, 없으면 지수 백오프)을 속도 제한기에 알려 같은 모델의 요청이 함께 기다리고,
+    그 밖의 오류는 이 요청만 2 ** attempt초 뒤 다시 시도
+
+    Args:
+        model: 속도 제한을 적용할 모델 이름
+        prompt: 요청 프롬프트 (토큰 수 추정용)
+        request: 요청을 한 번 보내고 결과를 반환하는 함수
+        max_retries: 최대 시도 횟수
+        base_delay: Rate Limit 지수 백오프 기본 대기 시간(초)
+
+    Returns:
+        request의 반환값
+
+    Raises:
+        Exception: 마지막 시도에서 발생한 오류
+    """
+    limiter = get_rate_limiter()
+    for attempt in range(max_retries):
+        try:
+            limiter.acquire(model, estimate_tokens(prompt))
+            return request()
+        except Exception as e:
+            if attempt == max_retries - 1:
+                raise
+            if is_rate_limit_error(e):
+                limiter.report_rate_limit(model, e, attempt, base_delay=base_delay)
+            else:
+                time.sleep(2 ** attempt)
@@ -0,0 +1,72 @@
+# startup_timer.py
+"""
+시작 시간 측정 모듈
+프로세스 시작부터 첫 화면 표시까지 단계별 소요 시간과, 지연 생성된 클라이언트의 생성 시간을 기록
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class StartupTimer:
+    def __init__(self):
+        """시작 시간 측정기 초기화 (생성 시각을 기준점으로 사용)"""
+        self.started = time.perf_counter()
+        self._last = self.started
+        self._lock = threading.Lock()
+        self._steps = []  # (단계 이름, 소요 시간, 스레드 이름)
+
+    def mark(self, name: str):
+        """
+        직전 기록 이후 지금까지를 한 단계로 기록 (메인 스레드의 순차 단계용)
+
+        Args:
+            name: 단계 이름
+        """
+        now = time.perf_counter()
+        with self._lock:
+            self._steps.append((name, now - self._last, threading.current_thread().name))
+            self._last = now
+
+    @contextmanager
+    def section(self, name: str):
+        """
+        블록 실행 시간을 한 단계로 기록 (백그라운드 작업 등 독립 구간용)
+
+        Args:
+            name: 단계 이름
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._steps.append((name, time.perf_counter() - start, threading.current_thread().name))
+
+    @property
+    def steps(self) -> List[Tuple[str, float, str]]:
+        with self._lock:
+            return list(self._steps)
+
+    def elapsed(self) -> float:
+        """시작 이후 경과 시간 (초)"""
+        return time.perf_counter() - self.started
+
+    def report(self) -> str:
+        """
+        단계별 소요 시간 보고서
+
+        Returns:
+            str: 단계 이름, 소요 시간(ms), 실행 스레드를 한 줄씩 나열한 문자열
+        """
+        lines = ["[시작 시간 분석]"]
+        for name, duration, thread in self.steps:
+            lines.append(f"  {name:<28} {duration * 1000:8.1f} ms  ({thread})")
+        lines.append(f"  {'전체 경과':<28} {self.elapsed() * 1000:8.1f} ms")
+        return '\n'.join(lines)
+
+
+# 앱 모듈보다 먼저 import되어 프로세스 시작 시각을 기준으로 사용
+startup_timer = StartupTimer()
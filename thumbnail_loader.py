@@ -0,0 +1,128 @@
+# thumbnail_loader.py
+"""
+썸네일 비동기 로더 모듈
+하나의 requests.Session을 공유하는 제한된 스레드 풀로 썸네일을 받아오고
+디코딩된 이미지(메모리)와 원본 JPEG(디스크)를 용량 기준 LRU로 캐시
+"""
+
+import hashlib
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from PIL import Image
+
+from image_cache import DiskLRUCache, MemoryLRUCache, image_nbytes
+
+
+class ThumbnailLoader:
+    def __init__(
+        self,
+        size: Tuple[int, int] = (180, 135),
+        max_workers: int = 6,
+        memory_bytes: int = 64 * 1024 * 1024,
+        disk_bytes: int = 200 * 1024 * 1024,
+        directory: Optional[Path] = None,
+        dispatch: Optional[Callable] = None
+    ):
+        """
+        썸네일 로더 초기화
+
+        Args:
+            size: 표시 크기 (기본 180x135)
+            max_workers: 동시 다운로드 수
+            memory_bytes: 디코딩된 이미지 캐시 최대 용량
+            disk_bytes: 원본 이미지 디스크 캐시 최대 용량
+            directory: 디스크 캐시 디렉토리 (기본: ~/.youtube_maker/thumbnail_cache)
+            dispatch: 콜백을 UI 스레드에서 실행하는 함수 (예: lambda fn: root.after(0, fn))
+        """
+        self.size = size
+        self.dispatch = dispatch or (lambda fn: fn())
+
+        # 연결을 재사용하는 공유 세션 (풀 크기 = 동시 다운로드 수)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='thumbnail')
+        self.memory = MemoryLRUCache(memory_bytes, sizeof=image_nbytes)
+
+        if directory is None:
+            directory = Path.home() / '.youtube_maker' / 'thumbnail_cache'
+        try:
+            self.disk = DiskLRUCache(directory, disk_bytes)
+        except OSError as e:
+            print(f"썸네일 캐시 초기화 실패: {e}")
+            self.disk = None
+
+        self._lock = threading.Lock()
+        self._pending = {}  # url -> 대기 중인 콜백 리스트
+
+    def get_cached(self, url: str) -> Optional[Image.Image]:
+        """
+        메모리에 캐시된 썸네일 반환 (없으면 None)
+        """
+        return self.memory.get(url)
+
+    def load(self, url: str, callback: Callable):
+        """
+        썸네일 요청. 완료되면 dispatch를 통해 callback(image) 호출 (실패 시 image는 None)
+
+        메모리에 있으면 바로 호출하고, 같은 URL을 받는 중이면 기존 요청에 합침
+
+        Args:
+            url: 썸네일 URL
+            callback: 표시 크기로 줄인 PIL 이미지를 받는 함수
+        """
+        image = self.memory.get(url)
+        if image is not None:
+            callback(image)
+            return
+
+        with self._lock:
+            if url in self._pending:
+                self._pending[url].append(callback)
+                return
+            self._pending[url] = [callback]
+
+        self.executor.submit(self._fetch, url)
+
+    def _fetch(self, url: str):
+        image = None
+        try:
+            image = self._load_image(url)
+        except Exception as e:
+            print(f"썸네일 로드 실패: {e}")
+
+        with self._lock:
+            callbacks = self._pending.pop(url, [])
+
+        for callback in callbacks:
+            self.dispatch(lambda callback=callback: callback(image))
+
+    def _load_image(self, url: str) -> Image.Image:
+        """디스크 캐시 또는 네트워크에서 받아 표시 크기로 디코딩"""
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+        data = self.disk.get(key) if self.disk else None
+        if data is None:
+            response = self.session.get(url, timeout=5)
+            response.raise_for_status()
+            data = response.content
+            if self.disk:
+                self.disk.put(key, data, '.jpg')
+
+        image = Image.open(io.BytesIO(data))
+        image = image.convert('RGB').resize(self.size, Image.Resampling.LANCZOS)
+        self.memory.put(url, image)
+        return image
+
+    def shutdown(self):
+        """대기 중인 작업을 취소하고 세션 종료"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
@@ -0,0 +1,279 @@
+# trend_store.py
+"""
+트렌드 기록 저장소 모듈
+검색/인기 차트 결과의 영상 통계를 SQLite에 시점별로 기록하고 조회수 증가 속도를 조회
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    title TEXT,
+    channel TEXT,
+    channel_id TEXT,
+    published_at TEXT,
+    duration_seconds INTEGER,
+    first_seen REAL,
+    -- 최근 두 스냅샷 (증가 속도 계산용)
+    last_captured_at REAL,
+    last_view_count INTEGER,
+    last_like_count INTEGER,
+    last_comment_count INTEGER,
+    prev_captured_at REAL,
+    prev_view_count INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS snapshots (
+    video_id TEXT NOT NULL,
+    captured_at REAL NOT NULL,
+    view_count INTEGER,
+    like_count INTEGER,
+    comment_count INTEGER,
+    PRIMARY KEY (video_id, captured_at)
+);
+
+CREATE TABLE IF NOT EXISTS video_regions (
+    video_id TEXT NOT NULL,
+    region TEXT NOT NULL,
+    last_rank INTEGER,
+    last_seen REAL,
+    PRIMARY KEY (video_id, region)
+);
+
+CREATE INDEX IF NOT EXISTS idx_videos_channel ON videos (channel_id);
+CREATE INDEX IF NOT EXISTS idx_video_regions_region ON video_regions (region, video_id);
+"""
+
+# 조회수 증가 속도 (시간당 조회수)
+_VELOCITY_SQL = """
+    (v.last_view_count - v.prev_view_count) * 3600.0 / (v.last_captured_at - v.prev_captured_at)
+"""
+
+# 증가 속도 계산에 쓰는 두 스냅샷의 최소 간격 (초)
+# 이보다 짧은 간격으로 다시 기록되면 이전 스냅샷은 두고 최근 스냅샷만 갱신
+_MIN_VELOCITY_INTERVAL = 600
+
+# IN (...) 조회 한 번에 넣을 최대 ID 수 (SQLite 변수 개수 제한 이하)
+_ID_CHUNK_SIZE = 500
+
+
+class TrendStore:
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        트렌드 저장소 초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로 (기본: ~/.youtube_maker/trends.db)
+        """
+        if db_path is None:
+            db_path = Path.home() / '.youtube_maker' / 'trends.db'
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def record_videos(
+        self,
+        videos: List[Dict],
+        region: Optional[str] = None,
+        captured_at: Optional[float] = None
+    ) -> int:
+        """
+        영상 통계 기록 (이전 스냅샷과 통계가 같은 영상은 스냅샷을 남기지 않고 시각만 갱신)
+
+        Args:
+            videos: YouTubeTrendAnalyzer가 반환한 영상 정보 리스트
+            region: 인기 차트를 조회한 지역 (목록 순서를 차트 순위로 기록,
+                    검색 결과는 None으로 두어 순위를 기록하지 않음. sweep_trending 결과는 ranks 사용)
+            captured_at: 스냅샷 시각 (기본: 현재 시각)
+
+        Returns:
+            int: 새로 기록한 스냅샷 수
+        """
+        captured_at = captured_at or time.time()
+        written = 0
+
+        with self._lock, self._conn:
+            ids = [video['video_id'] for video in videos]
+            latest = {}
+            for start in range(0, len(ids), _ID_CHUNK_SIZE):
+                chunk = ids[start:start + _ID_CHUNK_SIZE]
+                rows = self._conn.execute(
+                    f"SELECT video_id, last_captured_at, last_view_count, last_like_count, last_comment_count "
+                    f"FROM videos WHERE video_id IN ({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                for row in rows:
+                    latest[row['video_id']] = (
+                        row['last_captured_at'],
+                        (row['last_view_count'], row['last_like_count'], row['last_comment_count'])
+                    )
+
+            for rank, video in enumerate(videos, 1):
+                video_id = video['video_id']
+                stats = (video['view_count'], video['like_count'], video['comment_count'])
+
+                if video_id not in latest:
+                    self._conn.execute(
+                        "INSERT INTO videos (video_id, title, channel, channel_id, published_at, "
+                        "duration_seconds, first_seen) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (video_id, video.get('title'), video.get('channel'), video.get('channel_id'),
+                         video.get('published_at'), video.get('duration_seconds'), captured_at)
+                    )
+
+                last_captured_at, last_stats = latest.get(video_id, (None, None))
+                if last_stats != stats:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?)",
+                        (video_id, captured_at) + stats
+                    )
+                    written += 1
+
+                # 통계가 같아도 최근 스냅샷 시각은 갱신해 멈춘 영상의 증가 속도가 0이 되도록 함
+                if last_captured_at is None or captured_at - last_captured_at >= _MIN_VELOCITY_INTERVAL:
+                    self._conn.execute(
+                        "UPDATE videos SET "
+                        "prev_captured_at = last_captured_at, prev_view_count = last_view_count, "
+                        "last_captured_at = ?, last_view_count = ?, last_like_count = ?, last_comment_count = ? "
+                        "WHERE video_id = ?",
+                        (captured_at,) + stats + (video_id,)
+                    )
+                    latest[video_id] = (captured_at, stats)
+                elif captured_at > last_captured_at:
+                    # 간격이 너무 짧으면 이전 스냅샷은 유지 (초 단위 간격으로 속도가 튀지 않도록)
+                    self._conn.execute(
+                        "UPDATE videos SET "
+                        "last_captured_at = ?, last_view_count = ?, last_like_count = ?, last_comment_count = ? "
+                        "WHERE video_id = ?",
+                        (captured_at,) + stats + (video_id,)
+                    )
+                    latest[video_id] = (captured_at, stats)
+
+                regions = video.get('ranks') or ({region: rank} if region else {})
+                for video_region, video_rank in regions.items():
+                    self._conn.execute(
+                        "INSERT INTO video_regions VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT (video_id, region) DO UPDATE SET "
+                        "last_rank = excluded.last_rank, last_seen = excluded.last_seen",
+                        (video_id, video_region, video_rank, captured_at)
+                    )
+
+        return written
+
+    def get_view_velocity(
+        self,
+        video_ids: Optional[List[str]] = None,
+        region: Optional[str] = None,
+        channel_id: Optional[str] = None,
+        limit: Optional[int] = 50
+    ) -> List[Dict]:
+        """
+        최근 두 스냅샷 사이의 시간당 조회수 증가량 조회 (API 호출 없음)
+
+        Args:
+            video_ids: 대상 영상 ID (None이면 전체)
+            region: 지역 필터
+            channel_id: 채널 필터
+            limit: 최대 결과 수 (None이면 제한 없음)
+
+        Returns:
+            List[Dict]: video_id, title, channel, view_count, views_per_hour, hours
+                        (증가 속도 높은 순)
+        """
+        if video_ids is not None:
+            if not video_ids:
+                return []
+            # SQLite 변수 개수 제한을 넘지 않도록 ID를 나누어 조회한 뒤 합침
+            rows = []
+            for start in range(0, len(video_ids), _ID_CHUNK_SIZE):
+                rows += self._query_velocity(video_ids[start:start + _ID_CHUNK_SIZE], region, channel_id, limit)
+            # SQL의 ORDER BY ... DESC와 같이 NULL은 마지막
+            rows.sort(key=lambda row: (row['views_per_hour'] is not None, row['views_per_hour'] or 0), reverse=True)
+            return rows[:limit] if limit else rows
+
+        return self._query_velocity(None, region, channel_id, limit)
+
+    def _query_velocity(
+        self,
+        video_ids: Optional[List[str]],
+        region: Optional[str],
+        channel_id: Optional[str],
+        limit: Optional[int]
+    ) -> List[Dict]:
+        conditions = ["v.prev_captured_at IS NOT NULL", "v.last_captured_at - v.prev_captured_at >= ?"]
+        params = [_MIN_VELOCITY_INTERVAL]
+
+        if video_ids is not None:
+            conditions.append(f"v.video_id IN ({','.join('?' * len(video_ids))})")
+            params.extend(video_ids)
+        if region:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM video_regions r WHERE r.video_id = v.video_id AND r.region = ?)")
+            params.append(region)
+        if channel_id:
+            conditions.append("v.channel_id = ?")
+            params.append(channel_id)
+
+        sql = (
+            f"SELECT v.video_id, v.title, v.channel, v.last_view_count AS view_count, "
+            f"{_VELOCITY_SQL} AS views_per_hour, "
+            f"(v.last_captured_at - v.prev_captured_at) / 3600.0 AS hours "
+            f"FROM videos v WHERE {' AND '.join(conditions)} "
+            f"ORDER BY views_per_hour DESC"
+        )
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def get_history(self, video_id: str) -> List[Dict]:
+        """
+        영상의 전체 스냅샷 기록 (시간순)
+
+        Returns:
+            List[Dict]: captured_at, view_count, like_count, comment_count
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT captured_at, view_count, like_count, comment_count "
+                "FROM snapshots WHERE video_id = ? ORDER BY captured_at",
+                (video_id,)
+            )
+            return [dict(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_shared_store = None
+_shared_lock = threading.Lock()
+
+
+def get_trend_store() -> Optional[TrendStore]:
+    """
+    프로세스 전체에서 공유하는 트렌드 저장소 반환 (생성 실패 시 None)
+    """
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            try:
+                _shared_store = TrendStore()
+            except (OSError, sqlite3.Error) as e:
+                print(f"트렌드 저장소 초기화 실패: {e}")
+                return None
+        return _shared_store
@@ -0,0 +1,99 @@
+# ui_dispatcher.py
+"""
+UI 디스패치 큐 모듈
+백그라운드 스레드는 작업을 큐에 넣기만 하고, Tk 스레드가 일정 주기로 모아서 실행
+같은 키로 들어온 작업(진행 상황 등)은 마지막 것만 실행
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Hashable, Optional
+
+
+class UIDispatcher:
+    def __init__(self, root, interval_ms: int = 16, budget_ms: int = 12):
+        """
+        UI 디스패처 초기화
+
+        Args:
+            root: Tk 루트 위젯
+            interval_ms: 큐를 비우는 주기 (기본 16ms, 약 60fps)
+            budget_ms: 한 주기에 작업을 실행할 최대 시간 (남은 작업은 다음 주기로)
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self.budget = budget_ms / 1000
+
+        self._lock = threading.Lock()
+        self._queue = deque()  # (key, fn, args) - 키가 있는 항목은 _latest에서 꺼냄
+        self._latest = {}  # key -> (fn, args), 아직 실행되지 않은 최신 작업
+        self._after_id = None
+        self._running = False
+
+    def start(self):
+        """Tk 스레드에서 주기적으로 큐 비우기 시작"""
+        if not self._running:
+            self._running = True
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def stop(self):
+        """주기 실행 중지 (남은 작업은 실행하지 않음)"""
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def post(self, fn: Callable, *args, key: Optional[Hashable] = None):
+        """
+        Tk 스레드에서 실행할 작업 등록 (어느 스레드에서나 호출 가능)
+
+        Args:
+            fn: 실행할 함수
+            *args: 함수 인자
+            key: 병합 키 (같은 키의 작업이 대기 중이면 인자만 최신 값으로 교체,
+                 실행 순서는 처음 등록된 위치 유지)
+        """
+        with self._lock:
+            if key is None:
+                self._queue.append((None, fn, args))
+            else:
+                if key not in self._latest:
+                    self._queue.append((key, None, None))
+                self._latest[key] = (fn, args)
+
+    def __call__(self, fn: Callable):
+        """dispatch 콜백 형태로 사용 (예: ThumbnailLoader(dispatch=ui))"""
+        self.post(fn)
+
+    def pending(self) -> int:
+        """대기 중인 작업 수"""
+        with self._lock:
+            return len(self._queue)
+
+    def _drain(self):
+        """대기 중인 작업을 시간 예산 안에서 실행"""
+        self._after_id = None
+        deadline = time.perf_counter() + self.budget
+
+        while True:
+            with self._lock:
+                if not self._queue:
+                    break
+                key, fn, args = self._queue.popleft()
+                if key is not None:
+                    fn, args = self._latest.pop(key)
+
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"UI 작업 실행 실패: {e}")
+
+            if time.perf_counter() >= deadline:
+                break
+
+        if self._running:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
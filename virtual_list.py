@@ -0,0 +1,299 @@
+# virtual_list.py
+"""
+가상화 리스트 위젯 모듈
+보이는 행(+ 여유분)만 위젯을 만들고 스크롤 시 재사용해, 결과가 수천 개여도 위젯 수를 일정하게 유지
+"""
+
+import sys
+import tkinter as tk
+from bisect import bisect_right
+from itertools import accumulate
+from tkinter import ttk
+from typing import Callable, List, Optional
+
+
+class VirtualList(ttk.Frame):
+    def __init__(
+        self,
+        master,
+        create_row: Callable,
+        bind_row: Callable,
+        row_height: Optional[int] = None,
+        overscan: int = 2,
+        viewport=None,
+        **kwargs
+    ):
+        """
+        가상화 리스트 초기화
+
+        Args:
+            master: 부모 위젯
+            create_row: 빈 행 위젯을 만드는 함수 (parent) -> widget
+            bind_row: 행 위젯에 데이터를 채우는 함수 (widget, item, index)
+            row_height: 아직 측정하지 않은 행의 예상 높이 (None이면 첫 행의 요청 높이)
+            overscan: 화면 위아래로 미리 만들어 둘 행 수
+            viewport: 높이를 맞출 위젯 (바깥 스크롤 영역 안에 둘 때 보이는 영역 높이로 채움,
+                      None이면 부모 배치에 맞춤)
+        """
+        super().__init__(master, **kwargs)
+
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.row_height = row_height
+        self.overscan = overscan
+        self.viewport = viewport
+
+        self.canvas = tk.Canvas(self, highlightthickness=0, borderwidth=0, yscrollincrement=20)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_view_changed)
+
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self._items = []
+        self._heights = []  # index -> 행 높이 (그려진 적 없는 행은 예상 높이)
+        self._offsets = [0]  # index -> 행 시작 y (마지막 값은 전체 높이)
+        self._layout_dirty = False
+        self._active = {}  # index -> (widget, window_id)
+        self._rows = {}  # 배치된 위젯 -> index
+        self._pool = []  # 재사용 대기 중인 (widget, window_id)
+        self._refresh_pending = False
+        self._refreshing = False
+        self._refresh_again = False
+
+        self.canvas.bind('<Configure>', self._on_configure)
+        self._bind_wheel(self.canvas)
+
+        if viewport is not None:
+            viewport.bind('<Configure>', self._on_viewport_configure, add='+')
+            self._fit_viewport(viewport.winfo_height())
+
+    @property
+    def items(self) -> List:
+        return self._items
+
+    def set_items(self, items: List):
+        """
+        표시할 데이터 교체 (스크롤은 맨 위로)
+
+        Args:
+            items: 행 데이터 리스트
+        """
+        self._items = items
+
+        # 보이는 행은 모두 새 데이터로 다시 채움
+        for index in list(self._active):
+            self._release(index)
+
+        self._heights = [self.row_height or 1] * len(items)
+        self._layout_dirty = True
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self._refresh()
+
+    def refresh_row(self, index: int):
+        """
+        한 행만 다시 채움 (화면에 없으면 무시, 높이가 바뀌면 아래 행 위치 조정)
+        """
+        entry = self._active.get(index)
+        if entry and index < len(self._items):
+            self.bind_row(entry[0], self._items[index], index)
+            self._measure([index])
+
+    def refresh(self):
+        """보이는 모든 행을 다시 채움"""
+        for index, (widget, _) in self._active.items():
+            self.bind_row(widget, self._items[index], index)
+        self._measure(list(self._active))
+
+    def scroll_to(self, index: int):
+        """해당 행이 맨 위에 오도록 스크롤"""
+        if self._items:
+            self._layout()
+            self.canvas.yview_moveto(self._offsets[index] / max(1, self._offsets[-1]))
+
+    def _on_view_changed(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_refresh()
+
+    def _on_configure(self, event):
+        for widget, window_id in list(self._active.values()) + self._pool:
+            self.canvas.itemconfigure(window_id, width=event.width)
+        self._schedule_refresh()
+
+    def _on_viewport_configure(self, event):
+        # 리스트가 다시 만들어진 뒤에도 이전 리스트의 바인딩이 남아 있으므로 확인
+        if self.winfo_exists():
+            self._fit_viewport(event.height)
+
+    def _fit_viewport(self, height: int):
+        """바깥 스크롤 영역의 보이는 높이만큼 리스트를 채움 (스크롤 한 번에 리스트 전체가 보이도록)"""
+        height -= 20
+        if height > 0 and height != self.canvas.winfo_reqheight():
+            self.canvas.configure(height=height)
+
+    def _on_row_configure(self, event):
+        # 썸네일이 나중에 채워지는 등 다시 채우지 않고 높이가 바뀐 행 반영
+        index = self._rows.get(event.widget)
+        if index is not None and event.height > 1 and event.height != self._heights[index]:
+            self._heights[index] = event.height
+            self._layout_dirty = True
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        # 스크롤 이벤트가 몰려도 한 번만 갱신 (갱신 중 측정하며 생긴 이벤트는 끝난 뒤 한 번 더)
+        if self._refreshing:
+            self._refresh_again = True
+        elif not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._refresh)
+
+    def _layout(self):
+        """행 높이가 바뀌었으면 행 시작 위치를 다시 계산하고 배치된 행을 옮김"""
+        if not self._layout_dirty:
+            return
+        self._layout_dirty = False
+        self._offsets = [0] + list(accumulate(self._heights))
+        for index, (_, window_id) in self._active.items():
+            self.canvas.coords(window_id, 0, self._offsets[index])
+        self._update_scrollregion()
+
+    def _update_scrollregion(self):
+        height = sum(self._heights) if self._layout_dirty else self._offsets[-1]
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), height))
+
+    def _refresh(self):
+        """보이는 범위의 행만 위젯에 배치"""
+        self._refresh_pending = False
+        if not self.winfo_exists():
+            return
+
+        self._refreshing = True
+        try:
+            self._refresh_visible()
+        finally:
+            self._refreshing = False
+
+        if self._refresh_again:
+            self._refresh_again = False
+            self._schedule_refresh()
+
+    def _refresh_visible(self):
+        if not self._items:
+            for index in list(self._active):
+                self._release(index)
+            return
+
+        if self.row_height is None:
+            self._estimate_row_height()
+
+        self._layout()
+
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(0, bisect_right(self._offsets, top) - 1 - self.overscan)
+        last = min(len(self._items) - 1, bisect_right(self._offsets, bottom) - 1 + self.overscan)
+
+        for index in [i for i in self._active if i < first or i > last]:
+            self._release(index)
+
+        placed = [index for index in range(first, last + 1) if index not in self._active]
+        for index in placed:
+            self._place(index)
+
+        # 새로 그린 행의 실제 높이가 예상과 다르면 위치를 다시 잡고 보이는 범위 재계산
+        if self._measure(placed):
+            self._schedule_refresh()
+
+    def _estimate_row_height(self):
+        """첫 행을 그려 보고 아직 그려지지 않은 행의 예상 높이로 사용"""
+        widget, window_id = self._acquire()
+        self.bind_row(widget, self._items[0], 0)
+        widget.update_idletasks()
+        self.row_height = max(1, widget.winfo_reqheight())
+        self._pool.append((widget, window_id))
+
+        self._heights = [self.row_height] * len(self._items)
+        self._layout_dirty = True
+
+    def _measure(self, indices: List[int]) -> bool:
+        """
+        배치된 행의 요청 높이를 기록
+
+        Returns:
+            bool: 높이가 바뀐 행이 있으면 True (위치 재계산 완료)
+        """
+        if not indices:
+            return False
+
+        self.canvas.update_idletasks()
+        for index in indices:
+            height = max(1, self._active[index][0].winfo_reqheight())
+            if height != self._heights[index]:
+                self._heights[index] = height
+                self._layout_dirty = True
+
+        changed = self._layout_dirty
+        self._layout()
+        return changed
+
+    def _acquire(self):
+        if self._pool:
+            return self._pool.pop()
+
+        widget = self.create_row(self.canvas)
+        window_id = self.canvas.create_window(
+            0, 0, anchor=tk.NW, window=widget,
+            width=self.canvas.winfo_width(), state=tk.HIDDEN
+        )
+        widget.bind('<Configure>', self._on_row_configure, add='+')
+        self._bind_wheel(widget)
+        return widget, window_id
+
+    def _place(self, index: int):
+        widget, window_id = self._acquire()
+        self.bind_row(widget, self._items[index], index)
+        self.canvas.coords(window_id, 0, self._offsets[index])
+        self.canvas.itemconfigure(window_id, state=tk.NORMAL)
+        self._active[index] = (widget, window_id)
+        self._rows[widget] = index
+
+    def _release(self, index: int):
+        widget, window_id = self._active.pop(index)
+        self._rows.pop(widget, None)
+        self.canvas.itemconfigure(window_id, state=tk.HIDDEN)
+        self._pool.append((widget, window_id))
+
+    def _bind_wheel(self, widget):
+        """행 위젯 위에서도 휠로 이 리스트가 스크롤되도록 하위 위젯까지 바인딩"""
+        # 텍스트 상자는 자체 스크롤을 유지하고 끝에 닿았을 때만 리스트로 넘김
+        handler = self._on_text_wheel if isinstance(widget, tk.Text) else self._on_wheel
+        widget.bind('<MouseWheel>', handler)
+        widget.bind('<Button-4>', handler)
+        widget.bind('<Button-5>', handler)
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    @staticmethod
+    def _wheel_steps(event) -> int:
+        if event.num == 4:
+            return -3
+        if event.num == 5:
+            return 3
+        if sys.platform == 'darwin':
+            return -event.delta
+        return -int(event.delta / 40)
+
+    def _on_wheel(self, event):
+        self.canvas.yview_scroll(self._wheel_steps(event), 'units')
+        # 바깥 스크롤 영역으로 이벤트가 전달되지 않도록 중단
+        return 'break'
+
+    def _on_text_wheel(self, event):
+        top, bottom = event.widget.yview()
+        steps = self._wheel_steps(event)
+        if (steps < 0 and top <= 0) or (steps > 0 and bottom >= 1):
+            return self._on_wheel(event)
+        # 아직 스크롤할 내용이 남았으면 텍스트 상자만 스크롤 (리스트/바깥 영역으로는 전달하지 않음)
+        event.widget.yview_scroll(steps, 'units')
+        return 'break'
@@ -1,22 +1,352 @@
 # youtube_analyzer.py
+from __future__ import annotations
+
 import os
+import atexit
 import json
+import time
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from googleapiclient.discovery import build
+from pathlib import Path
 from googleapiclient.errors import HttpError
-import pandas as pd
-from typing import List, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, List, Dict, Iterator, Optional, Tuple
 import re
 import warnings
+from image_cache import DiskLRUCache
+
+# pandas/numpy와 discovery 클라이언트는 import 비용이 커서 실제로 사용할 때 불러옴
+if TYPE_CHECKING:
+    import pandas as pd
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
+# 엔드포인트별 할당량 비용 (units)
+QUOTA_COSTS = {
+    'search.list': 100,
+    'videos.list': 1,
+    'channels.list': 1,
+}
+
+# 엔드포인트별 응답 캐시 유효 시간 (초, 0이면 캐시하지 않음)
+DEFAULT_CACHE_TTLS = {
+    'search.list': 30 * 60,
+    'videos.list': 60 * 60,
+    'videos.list:mostPopular': 15 * 60,
+    'channels.list': 24 * 60 * 60,
+    # 영상별 snippet/contentDetails (있으면 statistics만 요청)
+    'videos.meta': 7 * 24 * 60 * 60,
+}
+
+# 모든 지역을 대상으로 하는 국가 선택값
+ALL_REGIONS = '전체 지역'
+
+# DataFrame 결과의 열 순서 (영상 정보 딕셔너리와 같은 필드)
+VIDEO_COLUMNS = [
+    'video_id', 'title', 'channel', 'channel_id', 'published_at', 'view_count', 'like_count',
+    'comment_count', 'duration', 'duration_seconds', 'description', 'thumbnail', 'url'
+]
+
+
+def _to_arrow(df: pd.DataFrame) -> pd.DataFrame:
+    """pyarrow가 있으면 Arrow 기반 열로 변환 (없으면 그대로 반환)"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return df
+    return df.convert_dtypes(dtype_backend='pyarrow')
+
+
+def videos_to_dataframe(items: List[Dict], use_arrow: bool = False) -> pd.DataFrame:
+    """
+    videos.list 응답 항목을 열 단위로 DataFrame 변환
+
+    재생 시간(ISO 8601) 파싱, 통계 정수 변환은 열 단위 벡터 연산으로 처리
+
+    Args:
+        items: videos.list 응답의 items
+        use_arrow: pyarrow가 설치되어 있으면 Arrow 기반 열 사용
+
+    Returns:
+        pd.DataFrame: VIDEO_COLUMNS 열 (published_at은 UTC datetime)
+    """
+    import pandas as pd
+
+    items = [
+        item for item in items
+        if 'snippet' in item and 'statistics' in item and 'contentDetails' in item
+    ]
+    snippets = [item['snippet'] for item in items]
+    statistics = [item['statistics'] for item in items]
+    video_ids = pd.Series([item['id'] for item in items], dtype='string')
+
+    def count_column(key: str) -> pd.Series:
+        values = pd.Series([stat.get(key) for stat in statistics], dtype='object')
+        return pd.to_numeric(values, errors='coerce').fillna(0).astype('int64')
+
+    durations = pd.Series([item['contentDetails'].get('duration', '') for item in items], dtype='string')
+    parts = durations.str.extract(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+    parts = parts.apply(pd.to_numeric).fillna(0).astype('int64')
+    seconds = parts[0] * 3600 + parts[1] * 60 + parts[2]
+
+    # _format_duration과 같은 형식 (HH:MM:SS 또는 MM:SS)
+    hours = (seconds // 3600).astype('string').str.zfill(2)
+    minutes = (seconds % 3600 // 60).astype('string').str.zfill(2)
+    secs = (seconds % 60).astype('string').str.zfill(2)
+    formatted = (minutes + ':' + secs).where(seconds < 3600, hours + ':' + minutes + ':' + secs)
+
+    df = pd.DataFrame({
+        'video_id': video_ids,
+        'title': pd.Series([snippet.get('title', '') for snippet in snippets], dtype='string'),
+        'channel': pd.Series([snippet.get('channelTitle', '') for snippet in snippets], dtype='string'),
+        'channel_id': pd.Series([snippet.get('channelId', '') for snippet in snippets], dtype='string'),
+        'published_at': pd.to_datetime(
+            pd.Series([snippet.get('publishedAt') for snippet in snippets], dtype='object'),
+            utc=True, errors='coerce'),
+        'view_count': count_column('viewCount'),
+        'like_count': count_column('likeCount'),
+        'comment_count': count_column('commentCount'),
+        'duration': formatted,
+        'duration_seconds': seconds,
+        'description': pd.Series([snippet.get('description', '') for snippet in snippets],
+                                 dtype='string').str.slice(0, 200) + '...',
+        'thumbnail': pd.Series([
+            snippet.get('thumbnails', {}).get('medium', {}).get('url') for snippet in snippets
+        ], dtype='string'),
+        'url': 'https://www.youtube.com/watch?v=' + video_ids,
+    }, columns=VIDEO_COLUMNS)
+
+    return _to_arrow(df) if use_arrow else df
+
+
+def _quota_date() -> str:
+    """
+    할당량 기준 날짜 (YouTube 할당량은 태평양 시간 자정에 초기화)
+    """
+    try:
+        from zoneinfo import ZoneInfo
+        return datetime.now(ZoneInfo('America/Los_Angeles')).strftime('%Y-%m-%d')
+    except Exception:
+        return datetime.now().strftime('%Y-%m-%d')
+
+
+class ResponseCache:
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = 100 * 1024 * 1024):
+        """
+        YouTube API 응답 디스크 캐시 초기화
+
+        Args:
+            directory: 캐시 디렉토리 (기본: ~/.youtube_maker/youtube_cache)
+            max_bytes: 최대 용량 (기본 100MB)
+        """
+        if directory is None:
+            directory = Path.home() / '.youtube_maker' / 'youtube_cache'
+        self.store = DiskLRUCache(directory, max_bytes)
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict) -> str:
+        """엔드포인트와 정규화된 요청 파라미터로 캐시 키 생성"""
+        normalized = {k: v for k, v in params.items() if v is not None}
+        payload = json.dumps([endpoint, normalized], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get_entry(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """
+        만료 여부와 관계없이 캐시 항목 조회 (ETag 재검증용)
+
+        Returns:
+            Dict: {"created": 저장 시각, "response": 응답} (없으면 None)
+        """
+        data = self.store.get(self.make_key(endpoint, params))
+        if data is None:
+            return None
+        try:
+            return json.loads(data.decode('utf-8'))
+        except ValueError:
+            return None
+
+    def get(self, endpoint: str, params: Dict, ttl: int) -> Optional[Dict]:
+        """
+        캐시된 응답 조회
+
+        Returns:
+            Dict: 캐시된 응답 (없거나 만료되면 None)
+        """
+        entry = self.get_entry(endpoint, params)
+        if entry is None or time.time() - entry.get('created', 0) >= ttl:
+            return None
+        return entry.get('response')
+
+    def put(self, endpoint: str, params: Dict, response: Dict):
+        """응답 저장"""
+        entry = {'created': time.time(), 'response': response}
+        data = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        self.store.put(self.make_key(endpoint, params), data, '.json')
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        self.store.clear()
+
+
+class QuotaLedger:
+    def __init__(self, ledger_file: Optional[Path] = None, keep_days: int = 30, flush_interval: float = 5.0):
+        """
+        일별 할당량 사용 기록 초기화
+
+        Args:
+            ledger_file: 기록 파일 경로 (기본: ~/.youtube_maker/youtube_quota.json)
+            keep_days: 보관할 일수
+            flush_interval: 기록 후 파일에 저장하기까지 모아 두는 시간 (초, 종료 시에도 저장)
+        """
+        if ledger_file is None:
+            ledger_file = Path.home() / '.youtube_maker' / 'youtube_quota.json'
+        self.ledger_file = Path(ledger_file)
+        self.ledger_file.parent.mkdir(parents=True, exist_ok=True)
+        self.keep_days = keep_days
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # 이전 스냅샷이 새 스냅샷을 덮어쓰지 않도록 저장 순서 보장
+        self._days = {}  # 날짜 -> {"spent", "saved", "calls": {엔드포인트: 호출 수}}
+        self._dirty = False
+        self._flush_timer = None
+
+        if self.ledger_file.exists():
+            try:
+                with open(self.ledger_file, 'r', encoding='utf-8') as f:
+                    self._days = json.load(f)
+            except Exception as e:
+                print(f"할당량 기록 로드 실패: {e}")
+
+        atexit.register(self.flush)
+
+    def record(self, endpoint: str, cached: bool = False, not_modified: bool = False):
+        """
+        API 호출 기록 (캐시로 대체된 호출은 절약량으로 기록, 파일 저장은 flush_interval 뒤에 모아서)
+
+        Args:
+            endpoint: 엔드포인트 이름 (예: "search.list")
+            cached: 캐시 응답 사용 여부
+            not_modified: ETag 재검증 결과 304(변경 없음) 응답 여부
+        """
+        cost = QUOTA_COSTS.get(endpoint, 1)
+        with self._lock:
+            day = self._days.setdefault(_quota_date(), {'spent': 0, 'saved': 0, 'calls': {}})
+            if cached:
+                day['saved'] += cost
+            else:
+                day['spent'] += cost
+                day['calls'][endpoint] = day['calls'].get(endpoint, 0) + 1
+            if not_modified:
+                day['not_modified'] = day.get('not_modified', 0) + 1
+
+            # 오래된 기록 정리
+            for date in sorted(self._days)[:-self.keep_days]:
+                del self._days[date]
+
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> bool:
+        """
+        변경된 기록을 파일에 저장 (임시 파일 작성 후 교체)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._dirty:
+                    return True
+                data = json.dumps(self._days, ensure_ascii=False, indent=2)
+                self._dirty = False
+
+            tmp_file = self.ledger_file.with_name(
+                f".{self.ledger_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                tmp_file.write_text(data, encoding='utf-8')
+                os.replace(tmp_file, self.ledger_file)
+                return True
+            except OSError as e:
+                print(f"할당량 기록 저장 실패: {e}")
+                with self._lock:
+                    self._dirty = True
+                return False
+
+    def get_usage(self, date: Optional[str] = None) -> Dict:
+        """
+        날짜별 사용량 조회
+
+        Args:
+            date: "YYYY-MM-DD" (기본: 오늘)
+
+        Returns:
+            Dict: {"spent": int, "saved": int, "calls": Dict}
+        """
+        with self._lock:
+            day = self._days.get(date or _quota_date(), {'spent': 0, 'saved': 0, 'calls': {}})
+            return json.loads(json.dumps(day))
+
+    def get_history(self) -> Dict[str, Dict]:
+        """전체 일별 사용량 반환"""
+        with self._lock:
+            return json.loads(json.dumps(self._days))
+
+
+_shared_cache = None
+_shared_ledger = None
+_shared_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    프로세스 전체에서 공유하는 응답 캐시 반환 (생성 실패 시 None)
+    """
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            try:
+                _shared_cache = ResponseCache()
+            except OSError as e:
+                print(f"YouTube 응답 캐시 초기화 실패: {e}")
+                return None
+        return _shared_cache
+
+
+def get_quota_ledger() -> QuotaLedger:
+    """
+    프로세스 전체에서 공유하는 할당량 기록 반환
+    """
+    global _shared_ledger
+    with _shared_lock:
+        if _shared_ledger is None:
+            _shared_ledger = QuotaLedger()
+        return _shared_ledger
+
+
 class YouTubeTrendAnalyzer:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_ttls: Optional[Dict[str, int]] = None):
         if not api_key or api_key == "YOUR_API_KEY_HERE":
             raise ValueError("유효한 YouTube API 키가 필요합니다.")
         self.api_key = api_key
-        self.youtube = build('youtube', 'v3', developerKey=api_key)
+        
+        # 스레드별 API 서비스 객체 (httplib2 연결은 스레드 간 공유 불가)
+        self._local = threading.local()
+        
+        # 응답 캐시와 할당량 기록
+        self.cache_ttls = dict(DEFAULT_CACHE_TTLS)
+        if cache_ttls:
+            self.cache_ttls.update(cache_ttls)
+        self.response_cache = get_response_cache()
+        self.quota_ledger = get_quota_ledger()
         
         self.category_mapping = {
             '전체': None,
@@ -74,6 +404,8 @@ class YouTubeTrendAnalyzer:
             date = now - timedelta(days=365)
         else:
             return None
+        # 시 단위로 맞춰 같은 조건의 검색이 같은 캐시 키를 갖도록 함
+        date = date.replace(minute=0, second=0, microsecond=0)
         return date.isoformat() + 'Z'
 
     def _parse_duration(self, duration_str: str) -> int:
@@ -86,6 +418,484 @@ class YouTubeTrendAnalyzer:
         seconds = int(match.group(3) or 0)
         return hours * 3600 + minutes * 60 + seconds
 
+    @property
+    def youtube(self):
+        """현재 스레드의 YouTube API 서비스 객체 (처음 사용할 때 생성)"""
+        return self._get_service()
+
+    def _get_service(self):
+        """
+        현재 스레드 전용 YouTube API 서비스 객체 반환
+        """
+        service = getattr(self._local, 'youtube', None)
+        if service is None:
+            from googleapiclient.discovery import build
+            service = build('youtube', 'v3', developerKey=self.api_key)
+            self._local.youtube = service
+        return service
+
+    def _cache_ttl(self, endpoint: str, params: Dict) -> int:
+        """엔드포인트별 캐시 유효 시간 (인기 차트는 별도 설정)"""
+        if params.get('chart'):
+            ttl = self.cache_ttls.get(f"{endpoint}:{params['chart']}")
+            if ttl is not None:
+                return ttl
+        return self.cache_ttls.get(endpoint, 0)
+
+    def _execute(self, endpoint: str, params: Dict, use_cache: bool = True, revalidate: bool = False) -> Dict:
+        """
+        YouTube API 요청 실행 (캐시 조회, ETag 재검증, 할당량 기록)
+        
+        캐시가 만료되었어도 ETag가 있으면 If-None-Match로 요청하고,
+        304(변경 없음) 응답이면 저장된 응답을 그대로 사용
+        
+        Args:
+            endpoint: "리소스.메서드" 형식 (예: "search.list")
+            params: 요청 파라미터
+            use_cache: 캐시 사용 여부
+            revalidate: 유효 시간과 관계없이 항상 ETag로 재검증 (주기적 통계 조회용)
+            
+        Returns:
+            Dict: API 응답
+        """
+        use_cache = use_cache and self.response_cache is not None
+        ttl = self._cache_ttl(endpoint, params) if use_cache else 0
+        
+        stale = None
+        if ttl > 0 or (use_cache and revalidate):
+            entry = self.response_cache.get_entry(endpoint, params)
+            if entry is not None:
+                if not revalidate and time.time() - entry.get('created', 0) < ttl:
+                    self.quota_ledger.record(endpoint, cached=True)
+                    return entry['response']
+                stale = entry.get('response')
+        
+        resource, method = endpoint.split('.')
+        request = getattr(getattr(self._get_service(), resource)(), method)(**params)
+        
+        etag = stale.get('etag') if stale else None
+        if etag:
+            request.headers['If-None-Match'] = etag
+        
+        try:
+            response = request.execute()
+        except HttpError as e:
+            if etag and getattr(e.resp, 'status', None) == 304:
+                # 변경 없음: 저장된 응답을 재사용하고 유효 시간 갱신
+                self.quota_ledger.record(endpoint, not_modified=True)
+                self.response_cache.put(endpoint, params, stale)
+                return stale
+            raise
+        self.quota_ledger.record(endpoint)
+        
+        if ttl > 0 or (use_cache and revalidate):
+            self.response_cache.put(endpoint, params, response)
+        return response
+
+    def get_quota_usage(self, date: Optional[str] = None) -> Dict:
+        """
+        일별 할당량 사용량 조회
+        
+        Returns:
+            Dict: {"spent": 사용한 units, "saved": 캐시로 절약한 units, "calls": 엔드포인트별 호출 수}
+        """
+        return self.quota_ledger.get_usage(date)
+
+    def get_channel_stats(self, channel_ids: List[str], max_workers: int = 4) -> Dict[str, Dict]:
+        """
+        채널 통계 조회 (채널별 캐시 후 나머지를 50개씩 묶어 channels.list 요청)
+        
+        Args:
+            channel_ids: 채널 ID 리스트 (중복 허용)
+            max_workers: 동시에 요청할 묶음 수
+            
+        Returns:
+            Dict[str, Dict]: {채널 ID: {"subscriber_count", "view_count", "video_count", "avg_views"}}
+                             (구독자 수 비공개 채널은 subscriber_count가 None)
+        """
+        unique_ids = list(dict.fromkeys(cid for cid in channel_ids if cid))
+        ttl = self.cache_ttls.get('channels.list', 0)
+        
+        stats = {}
+        missing = []
+        for channel_id in unique_ids:
+            cached = None
+            if ttl > 0 and self.response_cache:
+                cached = self.response_cache.get('channel', {'id': channel_id}, ttl)
+            if cached is not None:
+                stats[channel_id] = cached
+            else:
+                missing.append(channel_id)
+        
+        def fetch(batch):
+            # 묶음 응답은 조합이 매번 달라 채널 단위로 따로 캐시
+            response = self._execute('channels.list', {
+                'part': 'statistics',
+                'id': ','.join(batch),
+                'maxResults': 50
+            }, use_cache=False)
+            return response.get('items', [])
+        
+        batches = [missing[i:i + 50] for i in range(0, len(missing), 50)]
+        if batches:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                for items in executor.map(fetch, batches):
+                    for item in items:
+                        statistics = item.get('statistics', {})
+                        video_count = int(statistics.get('videoCount', 0))
+                        view_count = int(statistics.get('viewCount', 0))
+                        channel_stats = {
+                            'subscriber_count': None if statistics.get('hiddenSubscriberCount')
+                            else int(statistics.get('subscriberCount', 0)),
+                            'view_count': view_count,
+                            'video_count': video_count,
+                            'avg_views': view_count / video_count if video_count else None
+                        }
+                        stats[item['id']] = channel_stats
+                        if ttl > 0 and self.response_cache:
+                            self.response_cache.put('channel', {'id': item['id']}, channel_stats)
+        
+        return stats
+
+    def enrich_channel_stats(self, videos: List[Dict], max_workers: int = 4) -> List[Dict]:
+        """
+        영상 정보에 채널 통계와 비율 추가 (결과 전체의 채널을 한 번에 조회)
+        
+        추가 필드:
+            channel_subscribers: 채널 구독자 수
+            channel_avg_views: 채널 영상당 평균 조회수
+            views_per_subscriber: 조회수 / 구독자 수
+            outlier_score: 조회수 / 채널 평균 조회수 (1보다 크면 채널 평균 이상)
+        
+        Returns:
+            List[Dict]: 같은 리스트 (제자리에서 수정)
+        """
+        stats = self.get_channel_stats([video.get('channel_id') for video in videos], max_workers)
+        
+        for video in videos:
+            channel_stats = stats.get(video.get('channel_id'), {})
+            subscribers = channel_stats.get('subscriber_count')
+            avg_views = channel_stats.get('avg_views')
+            video['channel_subscribers'] = subscribers
+            video['channel_avg_views'] = avg_views
+            video['views_per_subscriber'] = video['view_count'] / subscribers if subscribers else None
+            video['outlier_score'] = video['view_count'] / avg_views if avg_views else None
+        
+        return videos
+
+    def enrich_channel_stats_df(self, df: pd.DataFrame, max_workers: int = 4) -> pd.DataFrame:
+        """
+        DataFrame 결과에 채널 통계 열과 비율 열 추가 (enrich_channel_stats와 같은 열, 벡터 연산)
+        """
+        import pandas as pd
+
+        stats = self.get_channel_stats(df['channel_id'].dropna().tolist(), max_workers)
+        
+        channels = pd.DataFrame.from_dict(stats, orient='index', columns=['subscriber_count', 'avg_views'])
+        channels = channels.rename(columns={
+            'subscriber_count': 'channel_subscribers',
+            'avg_views': 'channel_avg_views'
+        }).astype('float64')
+        
+        enriched = df.join(channels, on='channel_id')
+        subscribers = enriched['channel_subscribers'].where(enriched['channel_subscribers'] > 0)
+        avg_views = enriched['channel_avg_views'].where(enriched['channel_avg_views'] > 0)
+        enriched['views_per_subscriber'] = enriched['view_count'] / subscribers
+        enriched['outlier_score'] = enriched['view_count'] / avg_views
+        return enriched
+
+    def _build_search_params(self,
+                             category: str,
+                             keywords: Optional[List[str]],
+                             order: str,
+                             duration: Optional[str],
+                             period: Optional[str],
+                             country: str,
+                             license_type: str) -> Dict:
+        query = ' '.join(keywords) if keywords else ''
+        search_params = {
+            'part': 'snippet',
+            'type': 'video',
+            'order': self.order_mapping.get(order, 'relevance')
+        }
+        
+        if country != ALL_REGIONS:
+            search_params['regionCode'] = self.country_mapping.get(country, 'KR')
+        
+        if query:
+            search_params['q'] = query
+        
+        if category != '전체' and category in self.category_mapping:
+            category_id = self.category_mapping[category]
+            if category_id:
+                search_params['videoCategoryId'] = category_id
+        
+        if duration and duration in self.duration_mapping:
+            search_params['videoDuration'] = self.duration_mapping[duration]
+        
+        if period:
+            published_after = self._get_published_after(period)
+            if published_after:
+                search_params['publishedAfter'] = published_after
+        
+        if license_type == '크리에이티브 커먼즈':
+            search_params['videoLicense'] = 'creativeCommon'
+        elif license_type == '표준 라이센스':
+            search_params['videoLicense'] = 'youtube'
+        
+        return search_params
+
+    def _build_video_data(self, video: Dict) -> Dict:
+        """
+        videos.list 응답 항목을 결과 딕셔너리로 변환
+        """
+        duration_seconds = self._parse_duration(video['contentDetails']['duration'])
+        return {
+            'video_id': video['id'],
+            'title': video['snippet']['title'],
+            'channel': video['snippet']['channelTitle'],
+            'channel_id': video['snippet'].get('channelId', ''),
+            'published_at': video['snippet']['publishedAt'],
+            'view_count': int(video['statistics'].get('viewCount', 0)),
+            'like_count': int(video['statistics'].get('likeCount', 0)),
+            'comment_count': int(video['statistics'].get('commentCount', 0)),
+            'duration': self._format_duration(duration_seconds),
+            'duration_seconds': duration_seconds,
+            'description': video['snippet']['description'][:200] + '...',
+            'thumbnail': video['snippet']['thumbnails']['medium']['url'],
+            'url': f"https://www.youtube.com/watch?v={video['id']}"
+        }
+
+    def _get_cached_meta(self, video_ids: List[str]) -> Optional[Dict[str, Dict]]:
+        """
+        영상별 snippet/contentDetails 캐시 조회 (하나라도 없으면 None)
+        """
+        ttl = self.cache_ttls.get('videos.meta', 0)
+        if ttl <= 0 or not self.response_cache:
+            return None
+        
+        metas = {}
+        for video_id in video_ids:
+            meta = self.response_cache.get('video_meta', {'id': video_id}, ttl)
+            if meta is None:
+                return None
+            metas[video_id] = meta
+        return metas
+
+    def _fetch_video_items(self, video_ids: List[str]) -> List[Dict]:
+        """
+        검색 결과 ID 묶음(최대 50개)의 videos.list 응답 항목 조회 (검색 순서 유지)
+        
+        모든 영상의 snippet/contentDetails가 캐시되어 있으면 statistics만 요청해 합침
+        """
+        metas = self._get_cached_meta(video_ids)
+        
+        if metas is not None:
+            videos_response = self._execute('videos.list', {
+                'part': 'statistics',
+                'id': ','.join(video_ids)
+            })
+            items = [
+                dict(metas[item['id']], id=item['id'], statistics=item.get('statistics', {}))
+                for item in videos_response.get('items', []) if item.get('id') in metas
+            ]
+        else:
+            videos_response = self._execute('videos.list', {
+                'part': 'snippet,statistics,contentDetails',
+                'id': ','.join(video_ids)
+            })
+            items = videos_response.get('items', [])
+            if self.cache_ttls.get('videos.meta', 0) > 0 and self.response_cache:
+                for item in items:
+                    if 'snippet' in item and 'contentDetails' in item:
+                        self.response_cache.put('video_meta', {'id': item['id']}, {
+                            'snippet': item['snippet'],
+                            'contentDetails': item['contentDetails']
+                        })
+        
+        video_order = {video_id: idx for idx, video_id in enumerate(video_ids)}
+        return sorted(items, key=lambda item: video_order.get(item.get('id'), len(video_order)))
+
+    def poll_video_statistics(self, video_ids: List[str], max_workers: int = 4) -> Dict[str, Dict]:
+        """
+        영상 통계만 다시 조회 (part=statistics, 50개씩, ETag로 재검증)
+        
+        이전 조회 이후 변경이 없는 묶음은 304 응답으로 저장된 값을 재사용
+        
+        Args:
+            video_ids: 영상 ID 리스트
+            max_workers: 동시에 요청할 묶음 수
+            
+        Returns:
+            Dict[str, Dict]: {영상 ID: {"view_count", "like_count", "comment_count"}}
+        """
+        unique_ids = list(dict.fromkeys(video_ids))
+        batches = [unique_ids[i:i + 50] for i in range(0, len(unique_ids), 50)]
+        
+        def fetch(batch):
+            return self._execute('videos.list', {
+                'part': 'statistics',
+                'id': ','.join(batch)
+            }, revalidate=True).get('items', [])
+        
+        stats = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for items in executor.map(fetch, batches):
+                for item in items:
+                    statistics = item.get('statistics', {})
+                    stats[item['id']] = {
+                        'view_count': int(statistics.get('viewCount', 0)),
+                        'like_count': int(statistics.get('likeCount', 0)),
+                        'comment_count': int(statistics.get('commentCount', 0))
+                    }
+        return stats
+
+    def refresh_statistics(self, videos: List[Dict], max_workers: int = 4) -> List[Dict]:
+        """
+        영상 정보의 통계 필드만 최신 값으로 갱신 (제자리에서 수정)
+        
+        Returns:
+            List[Dict]: 같은 리스트
+        """
+        stats = self.poll_video_statistics([video['video_id'] for video in videos], max_workers)
+        for video in videos:
+            if video['video_id'] in stats:
+                video.update(stats[video['video_id']])
+        return videos
+
+    def _iter_search_pages(self, search_params: Dict, max_results: int, max_workers: int = 4) -> Iterator[List[Dict]]:
+        """
+        검색 결과를 페이지 단위로 받아오며 videos.list 항목 묶음을 순서대로 반환
+        
+        다음 페이지를 요청하는 동안 이전 페이지의 상세 정보를 동시에 조회
+        """
+        pending = deque()
+        remaining = max_results
+        page_token = None
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            try:
+                while remaining > 0:
+                    params = dict(search_params, maxResults=min(remaining, 50))
+                    if page_token:
+                        params['pageToken'] = page_token
+                    
+                    search_response = self._execute('search.list', params)
+                    video_ids = [
+                        item['id']['videoId'] for item in search_response.get('items', [])
+                        if 'videoId' in item.get('id', {})
+                    ]
+                    if video_ids:
+                        pending.append(executor.submit(self._fetch_video_items, video_ids))
+                    remaining -= len(video_ids)
+                    
+                    # 상세 조회가 끝난 앞쪽 페이지는 바로 전달
+                    while pending and pending[0].done():
+                        yield pending.popleft().result()
+                    
+                    page_token = search_response.get('nextPageToken')
+                    if not page_token or not video_ids:
+                        break
+                
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def iter_search_videos(self,
+                           category: str = '전체',
+                           keywords: Optional[List[str]] = None,
+                           order: str = '관련성',
+                           max_results: int = 25,
+                           duration: Optional[str] = None,
+                           period: Optional[str] = None,
+                           country: str = '한국',
+                           license_type: str = '전체',
+                           min_views: int = 0,
+                           max_workers: int = 4) -> Iterator[Dict]:
+        """
+        검색 결과를 페이지 단위로 받아오며 순서대로 반환 (nextPageToken 사용)
+        
+        다음 페이지를 요청하는 동안 이전 페이지의 상세 정보(videos.list)를 동시에 조회
+        
+        Args:
+            max_results: 최대 검색 결과 수 (50개씩 여러 페이지로 요청)
+            max_workers: 동시에 상세 정보를 조회할 페이지 수
+            (나머지 인자는 search_videos와 동일)
+            
+        Yields:
+            Dict: 영상 정보 (검색 순서, min_views 미만은 제외)
+        
+        Raises:
+            HttpError: YouTube API 오류
+        """
+        search_params = self._build_search_params(
+            category, keywords, order, duration, period, country, license_type
+        )
+        
+        for items in self._iter_search_pages(search_params, max_results, max_workers):
+            for video in items:
+                try:
+                    video_data = self._build_video_data(video)
+                except (KeyError, ValueError):
+                    continue
+                if video_data['view_count'] < min_views:
+                    continue
+                yield video_data
+
+    def search_videos_df(self,
+                         category: str = '전체',
+                         keywords: Optional[List[str]] = None,
+                         order: str = '관련성',
+                         max_results: int = 25,
+                         duration: Optional[str] = None,
+                         period: Optional[str] = None,
+                         country: str = '한국',
+                         license_type: str = '전체',
+                         min_views: int = 0,
+                         use_arrow: bool = False) -> pd.DataFrame:
+        """
+        검색 결과를 DataFrame으로 반환 (영상별 딕셔너리를 만들지 않고 열 단위로 구성)
+        
+        Args:
+            use_arrow: pyarrow가 설치되어 있으면 Arrow 기반 열 사용
+            (나머지 인자는 search_videos와 동일)
+            
+        Returns:
+            pd.DataFrame: VIDEO_COLUMNS 열을 가진 결과 (search_videos와 같은 순서)
+        
+        Raises:
+            HttpError: YouTube API 오류
+        """
+        import pandas as pd
+
+        search_params = self._build_search_params(
+            category, keywords, order, duration, period, country, license_type
+        )
+        
+        items = [item for page in self._iter_search_pages(search_params, max_results) for item in page]
+        df = videos_to_dataframe(items, use_arrow=use_arrow)
+        if min_views:
+            df = df[df['view_count'] >= min_views]
+        
+        if order == '조회수':
+            df = df.sort_values('view_count', ascending=False, kind='stable')
+        elif order == '업로드 날짜':
+            df = df.sort_values('published_at', ascending=False, kind='stable')
+        return df.reset_index(drop=True)
+
+    @staticmethod
+    def sort_videos(results: List[Dict], order: str = '관련성') -> List[Dict]:
+        """
+        검색 결과 정렬 (관련성은 검색 순서 유지)
+        """
+        if order == '조회수':
+            results.sort(key=lambda x: x['view_count'], reverse=True)
+        elif order == '업로드 날짜':
+            results.sort(key=lambda x: x['published_at'], reverse=True)
+        return results
+
     def search_videos(self, 
                      category: str = '전체',
                      keywords: Optional[List[str]] = None,
@@ -97,89 +907,18 @@ class YouTubeTrendAnalyzer:
                      license_type: str = '전체',
                      min_views: int = 0) -> List[Dict]:
         try:
-            query = ' '.join(keywords) if keywords else ''
-            search_params = {
-                'part': 'snippet',
-                'type': 'video',
-                'maxResults': min(max_results, 50),
-                'order': self.order_mapping.get(order, 'relevance'),
-                'regionCode': self.country_mapping.get(country, 'KR')
-            }
-            
-            if query:
-                search_params['q'] = query
-            
-            if category != '전체' and category in self.category_mapping:
-                category_id = self.category_mapping[category]
-                if category_id:
-                    search_params['videoCategoryId'] = category_id
-            
-            if duration and duration in self.duration_mapping:
-                search_params['videoDuration'] = self.duration_mapping[duration]
-            
-            if period:
-                published_after = self._get_published_after(period)
-                if published_after:
-                    search_params['publishedAfter'] = published_after
-            
-            if license_type == '크리에이티브 커먼즈':
-                search_params['videoLicense'] = 'creativeCommon'
-            elif license_type == '표준 라이센스':
-                search_params['videoLicense'] = 'youtube'
-            
-            search_response = self.youtube.search().list(**search_params).execute()
-            video_ids = [item['id']['videoId'] for item in search_response['items']]
-            
-            if not video_ids:
-                return []
-            
-            videos_response = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails',
-                id=','.join(video_ids)
-            ).execute()
-            
-            results = []
-            video_order = {item['id']['videoId']: idx for idx, item in enumerate(search_response['items'])}
-            
-            for video in videos_response['items']:
-                try:
-                    view_count = int(video['statistics'].get('viewCount', 0))
-                    if view_count < min_views:
-                        continue
-                    
-                    duration_seconds = self._parse_duration(video['contentDetails']['duration'])
-                    duration_formatted = self._format_duration(duration_seconds)
-                    
-                    video_data = {
-                        'video_id': video['id'],
-                        'title': video['snippet']['title'],
-                        'channel': video['snippet']['channelTitle'],
-                        'published_at': video['snippet']['publishedAt'],
-                        'view_count': view_count,
-                        'like_count': int(video['statistics'].get('likeCount', 0)),
-                        'comment_count': int(video['statistics'].get('commentCount', 0)),
-                        'duration': duration_formatted,
-                        'duration_seconds': duration_seconds,
-                        'description': video['snippet']['description'][:200] + '...',
-                        'thumbnail': video['snippet']['thumbnails']['medium']['url'],
-                        'url': f"https://www.youtube.com/watch?v={video['id']}",
-                        'search_order': video_order.get(video['id'], 999)
-                    }
-                    results.append(video_data)
-                except (KeyError, ValueError):
-                    continue
-            
-            if order == '조회수':
-                results.sort(key=lambda x: x['view_count'], reverse=True)
-            elif order == '업로드 날짜':
-                results.sort(key=lambda x: x['published_at'], reverse=True)
-            else:
-                results.sort(key=lambda x: x['search_order'])
-            
-            for result in results:
-                result.pop('search_order', None)
-            
-            return results
+            results = list(self.iter_search_videos(
+                category=category,
+                keywords=keywords,
+                order=order,
+                max_results=max_results,
+                duration=duration,
+                period=period,
+                country=country,
+                license_type=license_type,
+                min_views=min_views
+            ))
+            return self.sort_videos(results, order)
             
         except HttpError as e:
             print(f"YouTube API 오류: {e}")
@@ -197,35 +936,203 @@ class YouTubeTrendAnalyzer:
         else:
             return f"{minutes:02d}:{secs:02d}"
 
+    def _fetch_chart_items(self, region_code: str, category_id: Optional[str] = None, max_results: int = 200) -> List[Dict]:
+        """
+        인기 차트(mostPopular) 한 개를 페이지 단위로 끝까지 조회
+        
+        Args:
+            region_code: 국가 코드
+            category_id: 카테고리 ID (None이면 전체)
+            max_results: 최대 결과 수 (차트는 최대 200개)
+            
+        Returns:
+            List[Dict]: videos.list 응답 항목 (차트 순서)
+        """
+        items = []
+        page_token = None
+        
+        while len(items) < max_results:
+            params = {
+                'part': 'snippet,statistics,contentDetails',
+                'chart': 'mostPopular',
+                'regionCode': region_code,
+                'maxResults': min(max_results - len(items), 50)
+            }
+            if category_id:
+                params['videoCategoryId'] = category_id
+            if page_token:
+                params['pageToken'] = page_token
+            
+            response = self._execute('videos.list', params)
+            items.extend(response.get('items', []))
+            
+            page_token = response.get('nextPageToken')
+            if not page_token or not response.get('items'):
+                break
+        
+        return items
+
+    def _fetch_chart(self, region_code: str, category_id: Optional[str] = None, max_results: int = 200) -> List[Dict]:
+        """
+        인기 차트 한 개를 영상 정보 리스트로 조회 (차트 순서)
+        """
+        results = []
+        for video in self._fetch_chart_items(region_code, category_id, max_results):
+            try:
+                results.append(self._build_video_data(video))
+            except (KeyError, ValueError):
+                continue
+        return results
+
     def get_trending_videos(self, country: str = '한국', max_results: int = 50) -> List[Dict]:
         try:
             region_code = self.country_mapping.get(country, 'KR')
-            response = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails',
-                chart='mostPopular',
-                regionCode=region_code,
-                maxResults=min(max_results, 50)
-            ).execute()
-            
-            results = []
-            for video in response['items']:
-                duration_seconds = self._parse_duration(video['contentDetails']['duration'])
-                video_data = {
-                    'video_id': video['id'],
-                    'title': video['snippet']['title'],
-                    'channel': video['snippet']['channelTitle'],
-                    'published_at': video['snippet']['publishedAt'],
-                    'view_count': int(video['statistics'].get('viewCount', 0)),
-                    'like_count': int(video['statistics'].get('likeCount', 0)),
-                    'comment_count': int(video['statistics'].get('commentCount', 0)),
-                    'duration': self._format_duration(duration_seconds),
-                    'duration_seconds': duration_seconds,
-                    'description': video['snippet']['description'][:200] + '...',
-                    'thumbnail': video['snippet']['thumbnails']['medium']['url'],
-                    'url': f"https://www.youtube.com/watch?v={video['id']}"
-                }
-                results.append(video_data)
-            return results
+            return self._fetch_chart(region_code, max_results=max_results)
         except HttpError as e:
             print(f"YouTube API 오류: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def sweep_trending(self,
+                       countries: Optional[List[str]] = None,
+                       categories: Optional[List[str]] = None,
+                       max_results_per_chart: int = 200,
+                       max_workers: int = 8) -> List[Dict]:
+        """
+        여러 지역/카테고리의 인기 차트를 병렬로 조회해 하나로 합침
+        
+        여러 차트에 등장한 영상은 하나로 합치고 지역별 순위를 기록
+        
+        Args:
+            countries: 국가 목록 (기본: country_mapping 전체)
+            categories: 카테고리 목록 (기본: category_mapping 전체, '전체'는 지역 종합 차트)
+            max_results_per_chart: 차트별 최대 결과 수 (최대 200)
+            max_workers: 동시에 조회할 차트 수
+            
+        Returns:
+            List[Dict]: 영상 정보. 추가 필드:
+                ranks: {국가: 순위} (종합 차트 순위, 없으면 카테고리 차트 중 최고 순위)
+                category_ranks: {"국가 · 카테고리": 순위}
+                chart_count: 등장한 차트 수
+            등장한 차트 수, 조회수 순으로 정렬
+        """
+        countries = countries or list(self.country_mapping.keys())
+        categories = categories or list(self.category_mapping.keys())
+        charts = [(country, category) for country in countries for category in categories]
+        
+        def fetch(chart):
+            country, category = chart
+            try:
+                return self._fetch_chart(
+                    self.country_mapping.get(country, 'KR'),
+                    self.category_mapping.get(category),
+                    max_results_per_chart
+                )
+            except HttpError as e:
+                # 지역에 따라 제공되지 않는 카테고리 차트가 있음
+                print(f"인기 차트 조회 실패 ({country} · {category}): {e}")
+                return []
+        
+        merged = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for (country, category), videos in zip(charts, executor.map(fetch, charts)):
+                overall = self.category_mapping.get(category) is None
+                for rank, video in enumerate(videos, 1):
+                    entry = merged.get(video['video_id'])
+                    if entry is None:
+                        entry = dict(video, ranks={}, category_ranks={}, chart_count=0)
+                        merged[video['video_id']] = entry
+                    
+                    entry['chart_count'] += 1
+                    if overall:
+                        entry['ranks'][country] = rank
+                    else:
+                        entry['category_ranks'][f"{country} · {category}"] = rank
+        
+        # 종합 차트에 없는 지역은 카테고리 차트 중 최고 순위 사용
+        for entry in merged.values():
+            best = {}
+            for chart, rank in entry['category_ranks'].items():
+                country = chart.split(' · ')[0]
+                best[country] = min(rank, best.get(country, rank))
+            for country, rank in best.items():
+                entry['ranks'].setdefault(country, rank)
+        
+        results = list(merged.values())
+        results.sort(key=lambda x: (-x['chart_count'], -x['view_count']))
+        return results
+
+    def get_trending_videos_df(self, country: str = '한국', max_results: int = 50, use_arrow: bool = False) -> pd.DataFrame:
+        """
+        인기 차트를 DataFrame으로 반환
+        
+        Raises:
+            HttpError: YouTube API 오류
+        """
+        region_code = self.country_mapping.get(country, 'KR')
+        return videos_to_dataframe(self._fetch_chart_items(region_code, max_results=max_results), use_arrow=use_arrow)
+
+    def sweep_trending_df(self,
+                          countries: Optional[List[str]] = None,
+                          categories: Optional[List[str]] = None,
+                          max_results_per_chart: int = 200,
+                          max_workers: int = 8,
+                          use_arrow: bool = False) -> pd.DataFrame:
+        """
+        sweep_trending의 DataFrame 버전 (차트별 결과를 이어 붙인 뒤 groupby로 합침)
+        
+        Returns:
+            pd.DataFrame: VIDEO_COLUMNS + chart_count + "rank_국가" 열
+                          (등장한 차트 수, 조회수 순으로 정렬)
+        """
+        import numpy as np
+        import pandas as pd
+
+        countries = countries or list(self.country_mapping.keys())
+        categories = categories or list(self.category_mapping.keys())
+        charts = [(country, category) for country in countries for category in categories]
+        
+        def fetch(chart):
+            country, category = chart
+            try:
+                return self._fetch_chart_items(
+                    self.country_mapping.get(country, 'KR'),
+                    self.category_mapping.get(category),
+                    max_results_per_chart
+                )
+            except HttpError as e:
+                print(f"인기 차트 조회 실패 ({country} · {category}): {e}")
+                return []
+        
+        frames = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for (country, category), items in zip(charts, executor.map(fetch, charts)):
+                if not items:
+                    continue
+                frame = videos_to_dataframe(items)
+                frame['country'] = country
+                frame['overall'] = self.category_mapping.get(category) is None
+                frame['rank'] = np.arange(1, len(frame) + 1)
+                frames.append(frame)
+        
+        if not frames:
+            return videos_to_dataframe([], use_arrow=use_arrow)
+        
+        charts_df = pd.concat(frames, ignore_index=True)
+        
+        # 지역별 순위: 종합 차트 순위, 없으면 카테고리 차트 중 최고 순위
+        overall_ranks = charts_df[charts_df['overall']].pivot_table(
+            index='video_id', columns='country', values='rank', aggfunc='min')
+        best_ranks = charts_df.pivot_table(
+            index='video_id', columns='country', values='rank', aggfunc='min')
+        ranks = overall_ranks.combine_first(best_ranks).astype('Int64').add_prefix('rank_')
+        
+        merged = (
+            charts_df.drop_duplicates('video_id')
+            .set_index('video_id')[VIDEO_COLUMNS[1:]]
+            .join(charts_df.groupby('video_id').size().rename('chart_count'))
+            .join(ranks)
+            .reset_index()
+            .sort_values(['chart_count', 'view_count'], ascending=[False, False], kind='stable')
+            .reset_index(drop=True)
+        )
+        return _to_arrow(merged) if use_arrow else merged